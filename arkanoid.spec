@@ -1,5 +1,14 @@
 # -*- mode: python ; coding: utf-8 -*-
+from arkanoid.utils import (atlas,
+                            manifest)
 
+# Regenerate the manifest of image sequences, so that the bundled game
+# never has to probe the extracted files to find where a sequence ends.
+manifest.write()
+
+# Pack the graphics into atlas pages. The pages aren't kept in the
+# repository, so they must be built here to be bundled with the game.
+atlas.pack()
 
 a = Analysis(
     ['arkanoid.py'],
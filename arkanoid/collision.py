@@ -0,0 +1,529 @@
+import collections
+import heapq
+import logging
+import math
+
+import pygame
+
+LOG = logging.getLogger(__name__)
+
+
+class SpatialGrid:
+    """A uniform grid that indexes sprites by the cells that their rects
+    overlap.
+
+    Finding the sprites near a rect only looks in the handful of cells the
+    rect covers, so the cost doesn't grow with the number of sprites in the
+    grid. Sprites are indexed by their rect at the time they are added, so
+    a sprite that moves must be added again.
+    """
+
+    def __init__(self, cell_size, origin=(0, 0)):
+        """Initialise a new SpatialGrid.
+
+        Args:
+            cell_size:
+                The (width, height) of each cell.
+            origin:
+                The screen coordinates of the top left of cell (0, 0)
+                (default (0, 0)).
+        """
+        self._cell_width, self._cell_height = cell_size
+        self._origin_x, self._origin_y = origin
+
+        # Map of (column, row) to the sprites overlapping that cell.
+        self._cells = collections.defaultdict(list)
+        # Map of sprite to the cells it overlaps.
+        self._sprite_cells = {}
+
+    def __len__(self):
+        return len(self._sprite_cells)
+
+    def __contains__(self, sprite):
+        return sprite in self._sprite_cells
+
+    def __iter__(self):
+        return iter(list(self._sprite_cells))
+
+    def add(self, sprite):
+        """Add a sprite to the grid, or re-index it if it is already there.
+
+        Args:
+            sprite:
+                The sprite to add. It must have a rect attribute.
+        """
+        if sprite in self._sprite_cells:
+            self.remove(sprite)
+
+        cells = list(self._cells_for(sprite.rect))
+        for cell in cells:
+            self._cells[cell].append(sprite)
+        self._sprite_cells[sprite] = cells
+
+    def remove(self, sprite):
+        """Remove a sprite from the grid, if present.
+
+        Args:
+            sprite:
+                The sprite to remove.
+        """
+        for cell in self._sprite_cells.pop(sprite, ()):
+            occupants = self._cells[cell]
+            occupants.remove(sprite)
+            if not occupants:
+                del self._cells[cell]
+
+    def clear(self):
+        """Remove all sprites from the grid."""
+        self._cells.clear()
+        self._sprite_cells.clear()
+
+    def query(self, rect):
+        """Get the sprites in the cells that a rect overlaps.
+
+        The sprites returned are candidates for collision with the rect;
+        their own rects still need testing against it.
+
+        Args:
+            rect:
+                The Rect to look up.
+        Returns:
+            A list of the sprites, each appearing once.
+        """
+        found = []
+        for cell in self._cells_for(rect):
+            for sprite in self._cells.get(cell, ()):
+                if sprite not in found:
+                    found.append(sprite)
+        return found
+
+    def _cells_for(self, rect):
+        left = (rect.left - self._origin_x) // self._cell_width
+        right = (rect.right - 1 - self._origin_x) // self._cell_width
+        top = (rect.top - self._origin_y) // self._cell_height
+        bottom = (rect.bottom - 1 - self._origin_y) // self._cell_height
+
+        for row in range(top, bottom + 1):
+            for column in range(left, right + 1):
+                yield column, row
+
+
+class CollisionWorld:
+    """The sprites that balls can collide with, along with what happens
+    when a ball strikes each of them.
+
+    Each collider is held with its bounce strategy, speed adjustment and
+    collision callback. A world is shared by all the balls in play, so a
+    collider added to or removed from the world is immediately added to or
+    removed from every ball, and a new ball can join the world without
+    copying anything.
+
+    Large numbers of sprites, such as the bricks, can be added as a
+    SpatialGrid, in which case only the sprites in the cells near a ball
+    are considered.
+
+    Sprites with irregular shapes, such as the enemies, can be added as
+    precise colliders. A ball then only strikes them when the opaque pixels
+    of the two sprites overlap, not merely their rects.
+    """
+
+    def __init__(self):
+        """Initialise a new empty CollisionWorld."""
+        # Map of individually added sprite to a 3-element tuple of its
+        # bounce strategy, speed adjustment and collision callback.
+        self._sprites = {}
+        # Map of SpatialGrid to the same 3-element tuple, shared by every
+        # sprite in the grid.
+        self._grids = {}
+        # The individually added sprites that are precise colliders.
+        self._precise = set()
+
+    def __len__(self):
+        return len(self._sprites) + sum(len(grid) for grid in self._grids)
+
+    def __contains__(self, sprite):
+        return sprite in self._sprites or any(
+            sprite in grid for grid in self._grids)
+
+    def add(self, sprite, bounce_strategy=None, speed_adjust=0.0,
+            on_collide=None, precise=False):
+        """Add a sprite that balls might collide with, or replace the
+        collision data of a sprite already added.
+
+        Args:
+            sprite:
+                The collidable sprite.
+            bounce_strategy:
+                Optional callable that determines how a ball should bounce
+                when it collides with the sprite. It takes 2 arguments: the
+                Rect of the object and the Rect of the ball.
+            speed_adjust:
+                Optional numeric value that will be used to speed up or slow
+                down a ball. Use a negative value to slow the ball down.
+            on_collide:
+                Optional callable that will be called when a collision occurs.
+                It takes 2 arguments: the sprite the ball struck and the ball
+                that struck it.
+            precise:
+                Whether collisions with the sprite are confirmed by testing
+                masks once the rects overlap (default False). The sprite
+                should have a mask attribute.
+        """
+        self._sprites[sprite] = bounce_strategy, speed_adjust, on_collide
+        if precise:
+            self._precise.add(sprite)
+        else:
+            self._precise.discard(sprite)
+
+    def add_grid(self, grid, bounce_strategy=None, speed_adjust=0.0,
+                 on_collide=None):
+        """Add a SpatialGrid of sprites that balls might collide with.
+
+        This behaves as though each sprite in the grid had been added with
+        add() using the same arguments. Sprites removed from the grid can no
+        longer be struck.
+
+        Args:
+            grid:
+                The SpatialGrid of collidable sprites.
+            bounce_strategy:
+                Optional callable that determines how a ball should bounce
+                when it collides with a sprite in the grid.
+            speed_adjust:
+                Optional numeric value that will be used to speed up or slow
+                down a ball.
+            on_collide:
+                Optional callable that will be called when a collision occurs.
+        """
+        self._grids[grid] = bounce_strategy, speed_adjust, on_collide
+
+    def remove(self, sprite):
+        """Remove an individually added sprite, if present.
+
+        Args:
+            sprite:
+                The sprite to remove.
+        """
+        self._sprites.pop(sprite, None)
+        self._precise.discard(sprite)
+
+    def clear(self):
+        """Remove all sprites and grids from the world."""
+        self._sprites.clear()
+        self._grids.clear()
+        self._precise.clear()
+
+    def is_precise(self, sprite):
+        """Whether a sprite was added as a precise collider.
+
+        Args:
+            sprite:
+                The collidable sprite.
+        """
+        return sprite in self._precise
+
+    def sprites(self):
+        """Get the individually added sprites.
+
+        Returns:
+            A list of 2-tuples of each sprite and its collision data.
+        """
+        return list(self._sprites.items())
+
+    def grids(self):
+        """Get the grids of sprites.
+
+        Returns:
+            A list of 2-tuples of each SpatialGrid and the collision data
+            shared by its sprites.
+        """
+        return list(self._grids.items())
+
+    def nearby(self, rect):
+        """Get the visible sprites that might be touching a rect: all of
+        those added individually, plus those from the cells of each grid
+        that the rect overlaps.
+
+        Args:
+            rect:
+                The Rect to look for sprites near.
+        Returns:
+            A list of the sprites.
+        """
+        sprites = [s for s in self._sprites if s.visible]
+        for grid in self._grids:
+            sprites.extend(s for s in grid.query(rect) if s.visible)
+        return sprites
+
+    def collision_data(self, sprite):
+        """Get what happens when a ball strikes a sprite.
+
+        Args:
+            sprite:
+                The collidable sprite.
+        Returns:
+            A 3-element tuple of the bounce strategy, speed adjustment and
+            collision callback for the sprite.
+        Raises:
+            KeyError if the sprite is not in the world.
+        """
+        try:
+            return self._sprites[sprite]
+        except KeyError:
+            for grid, collision_data in self._grids.items():
+                if sprite in grid:
+                    return collision_data
+            raise
+
+
+class SortAndSweep:
+    """A broadphase that finds which moving sprites might be touching each
+    other, or any of a set of static sprites.
+
+    The sprites are sorted by the left of their rects and swept from left to
+    right, keeping track of those whose rects the sweep is still within.
+    Only sprites that overlap along the x-axis are compared, so the cost
+    grows roughly linearly with the number of sprites rather than with the
+    number of pairs of them. Pairs of static sprites are never reported.
+
+    The pairs are found once per rebuild, which should happen once per
+    frame. Sprites may move between a rebuild and the pairs being used, so
+    sprites are paired when they are within a margin of each other rather
+    than only when they touch. The pairs are then candidates; their rects
+    still need testing against each other.
+    """
+
+    def __init__(self, margin=0):
+        """Initialise a new SortAndSweep.
+
+        Args:
+            margin:
+                The distance within which sprites are paired (default 0).
+                This should cover the furthest any sprite can move or grow
+                between a rebuild and the pairs being used.
+        """
+        self.margin = margin
+
+        # The static sprites, sorted by the left of their rects.
+        self._static = []
+        # The moving sprites as at the last rebuild.
+        self._movers = []
+        # Map of moving sprite to the sprites paired with it, or None when
+        # the sweep hasn't been made since the last rebuild.
+        self._candidates = None
+
+    def __contains__(self, sprite):
+        return sprite in self._sweep()
+
+    def set_static(self, sprites):
+        """Set the sprites that don't move, such as the walls and bricks.
+
+        Static sprites that are not visible at a rebuild are left out of it,
+        as a sprite that has gone, like a destroyed brick, doesn't return.
+
+        Args:
+            sprites:
+                The static sprites.
+        """
+        self._static = sorted(sprites, key=lambda sprite: sprite.rect.left)
+        self._candidates = None
+
+    def rebuild(self, movers):
+        """Rebuild the broadphase with the current moving sprites.
+
+        The sweep is made when the pairs are first asked for after the
+        rebuild, so that sprites placed later in the same frame are swept in
+        their new positions.
+
+        Args:
+            movers:
+                The moving sprites.
+        """
+        self._movers = list(movers)
+        self._candidates = None
+
+    def candidates(self, sprite):
+        """Get the sprites that might be touching a moving sprite.
+
+        Args:
+            sprite:
+                One of the moving sprites from the last rebuild.
+        Returns:
+            A list of the moving and static sprites paired with the sprite.
+        Raises:
+            KeyError if the sprite was not a moving sprite at the last
+            rebuild.
+        """
+        return self._sweep()[sprite]
+
+    def pairs(self):
+        """Get the pairs of sprites that might be touching.
+
+        Returns:
+            A list of 2-tuples of sprites. The first sprite of each pair is a
+            moving sprite.
+        """
+        pairs = []
+        for sprite, candidates in self._sweep().items():
+            for other in candidates:
+                # Report pairs of moving sprites only once.
+                if other not in self._candidates or id(sprite) < id(other):
+                    pairs.append((sprite, other))
+        return pairs
+
+    def _sweep(self):
+        if self._candidates is not None:
+            return self._candidates
+
+        self._candidates = {sprite: [] for sprite in self._movers}
+        movers = sorted(self._movers, key=lambda sprite: sprite.rect.left)
+        static = (sprite for sprite in self._static if sprite.visible)
+        margin = self.margin
+
+        active_movers, active_static = [], []
+        for sprite, moving in heapq.merge(
+                ((sprite, True) for sprite in movers),
+                ((sprite, False) for sprite in static),
+                key=lambda item: item[0].rect.left):
+            rect = sprite.rect
+            # Drop the sprites the sweep has passed the right of.
+            active_movers = [s for s in active_movers if
+                             s.rect.right + margin > rect.left]
+            active_static = [s for s in active_static if
+                             s.rect.right + margin > rect.left]
+
+            others = active_movers + active_static if moving else \
+                active_movers
+            for other in others:
+                if (rect.top < other.rect.bottom + margin and
+                        other.rect.top < rect.bottom + margin):
+                    if moving:
+                        self._candidates[sprite].append(other)
+                    if other in self._candidates:
+                        self._candidates[other].append(sprite)
+
+            if moving:
+                active_movers.append(sprite)
+            else:
+                active_static.append(sprite)
+
+        return self._candidates
+
+
+def masks_overlap(sprite, other):
+    """Whether the opaque pixels of two sprites whose rects overlap also
+    overlap.
+
+    This is a narrowphase test, to be made only once the rects are known to
+    overlap. The masks are expected to be built in advance and shared, such
+    as those from AssetCache.mask(), so that no mask is built here.
+
+    Args:
+        sprite:
+            A sprite with rect and mask attributes.
+        other:
+            The other sprite with rect and mask attributes.
+    Returns:
+        True if the masks overlap, or if either sprite has no mask yet, in
+        which case the overlap of the rects stands.
+    """
+    mask, other_mask = getattr(sprite, 'mask', None), getattr(other, 'mask',
+                                                              None)
+    if mask is None or other_mask is None:
+        return True
+    offset = other.rect.left - sprite.rect.left, other.rect.top - sprite.rect.top
+    return mask.overlap(other_mask, offset) is not None
+
+
+def path_rect(box, dx=0, dy=0):
+    """Get the smallest Rect covering a box over the whole of a movement.
+
+    Args:
+        box:
+            The (left, top, width, height) of the box at the start of its
+            movement. The values may be floats.
+        dx:
+            The distance the box moves along the x-axis (default 0).
+        dy:
+            The distance the box moves along the y-axis (default 0).
+    Returns:
+        A Rect covering every pixel the box touches as it moves.
+    """
+    left, top, width, height = box
+    x, y = math.floor(min(left, left + dx)), math.floor(min(top, top + dy))
+    return pygame.Rect(x, y,
+                       math.ceil(max(left, left + dx) + width) - x,
+                       math.ceil(max(top, top + dy) + height) - y)
+
+
+def box_overlaps(box, rect):
+    """Whether a box overlaps a rect, rather than merely touching its edge.
+
+    Args:
+        box:
+            The (left, top, width, height) of the box. The values may be
+            floats.
+        rect:
+            The Rect to test against.
+    Returns:
+        True if the box overlaps the rect, False otherwise.
+    """
+    left, top, width, height = box
+    return (left < rect.right and left + width > rect.left and
+            top < rect.bottom and top + height > rect.top)
+
+
+def sweep(box, dx, dy, rect):
+    """Find when and where a box moving in a straight line first strikes a
+    stationary rect.
+
+    The box is tested over the whole of its movement rather than only at
+    its end position, so that a fast moving box can't pass through a thin
+    rect between one frame and the next.
+
+    Args:
+        box:
+            The (left, top, width, height) of the moving box at the start of
+            its movement. The values may be floats.
+        dx:
+            The distance the box moves along the x-axis.
+        dy:
+            The distance the box moves along the y-axis.
+        rect:
+            The Rect of the stationary object.
+    Returns:
+        None if the box does not strike the rect during its movement, or if
+        it already overlaps it. Otherwise a 2-tuple of the time of impact,
+        as a fraction of the movement between 0 and 1, and the normal of the
+        surface struck as an (x, y) tuple of -1, 0 or 1. The normal has two
+        non-zero components when the box strikes a corner exactly.
+    """
+    left, top, width, height = box
+    x_entry, x_exit = _axis_times(left, width, dx, rect.left, rect.right)
+    y_entry, y_exit = _axis_times(top, height, dy, rect.top, rect.bottom)
+
+    entry, exit_ = max(x_entry, y_entry), min(x_exit, y_exit)
+    if entry >= exit_ or not 0 <= entry <= 1:
+        # Misses, merely grazes, or is already overlapping.
+        return None
+
+    normal_x = (-1 if dx > 0 else 1) if x_entry >= y_entry else 0
+    normal_y = (-1 if dy > 0 else 1) if y_entry >= x_entry else 0
+    return entry, (normal_x, normal_y)
+
+
+def _axis_times(position, size, distance, lower, upper):
+    """The times, as fractions of the movement, at which a moving span
+    starts and stops overlapping a stationary span along one axis.
+    """
+    if distance > 0:
+        return ((lower - (position + size)) / distance,
+                (upper - position) / distance)
+    if distance < 0:
+        return ((upper - position) / distance,
+                (lower - (position + size)) / distance)
+    if position + size <= lower or position >= upper:
+        # Not moving on this axis, and never overlapping.
+        return math.inf, -math.inf
+    # Not moving on this axis, and always overlapping.
+    return -math.inf, math.inf
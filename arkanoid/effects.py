@@ -0,0 +1,254 @@
+import logging
+
+import pygame
+
+LOG = logging.getLogger(__name__)
+
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+
+
+# Easing functions map the progress of an effect through its duration, a
+# value between 0 and 1, onto the progress of its alpha from start to end.
+
+def hold(t):
+    """Remain at the start alpha for the whole duration."""
+    return 0
+
+
+def linear(t):
+    return t
+
+
+def ease_in(t):
+    return t * t
+
+
+def ease_out(t):
+    return t * (2 - t)
+
+
+def ease_in_out(t):
+    return 2 * t * t if t < 0.5 else -1 + (4 - 2 * t) * t
+
+
+class Effect:
+    """A translucent colour overlaid across the effect area, whose alpha
+    moves from a start to an end value over a number of frames.
+    """
+
+    def __init__(self, colour, start_alpha, end_alpha, duration=None,
+                 easing=linear):
+        """Initialise a new Effect.
+
+        Args:
+            colour:
+                The RGB colour of the overlay.
+            start_alpha:
+                The alpha of the overlay on the first frame, 0-255.
+            end_alpha:
+                The alpha of the overlay at the end of the duration, 0-255.
+            duration:
+                The number of frames the alpha takes to reach end_alpha. When
+                None (the default), the effect holds start_alpha until it is
+                removed from the compositor.
+            easing:
+                The easing function used to move between the start and end
+                alpha (default linear).
+        """
+        self.colour = tuple(colour)
+        self.start_alpha = start_alpha
+        self.end_alpha = end_alpha
+        self.duration = duration
+        self.easing = easing
+
+        # Whether the effect remains at end_alpha once its duration has
+        # elapsed, rather than finishing.
+        self.persist = False
+
+        self._frame = 0
+
+    @property
+    def alpha(self):
+        """The alpha of the overlay for the current frame."""
+        if not self.duration:
+            return self.start_alpha
+        t = min((self._frame + 1) / self.duration, 1)
+        return int(self.start_alpha +
+                   (self.end_alpha - self.start_alpha) * self.easing(t))
+
+    @property
+    def finished(self):
+        """Whether the effect has run for its full duration and should be
+        removed.
+        """
+        return (self.duration is not None and not self.persist and
+                self._frame >= self.duration)
+
+    def advance(self):
+        """Move the effect on to its next frame."""
+        self._frame += 1
+
+
+class Effects:
+    """Composites screen effects such as flashes, fades and tints over an
+    area of the screen.
+
+    Overlay surfaces are allocated once per colour and reused, and nothing
+    is done on frames when no effect is active.
+    """
+
+    def __init__(self, screen, area, renderer=None):
+        """Initialise a new Effects compositor.
+
+        Args:
+            screen:
+                The surface the effects are drawn onto.
+            area:
+                The Rect of the screen covered by the effects.
+            renderer:
+                Optional Renderer that is told to rebuild the area beneath
+                the effects each frame, so that overlays don't accumulate.
+        """
+        self._screen = screen
+        self._area = pygame.Rect(area)
+        self._renderer = renderer
+
+        # The overlay surfaces, keyed by colour.
+        self._overlays = {}
+        # Pre-allocate the overlays for the built-in effects.
+        self._overlay(WHITE)
+        self._overlay(BLACK)
+
+        self._effects = []
+
+        # Whether an overlay was drawn over the area during the last frame.
+        self._drawn = False
+
+    @property
+    def active(self):
+        """Whether any effect is in progress."""
+        return bool(self._effects)
+
+    def add(self, effect):
+        """Add an effect to the compositor.
+
+        Args:
+            effect:
+                The Effect instance to add.
+        Returns:
+            The effect, so that it can later be removed.
+        """
+        self._effects.append(effect)
+        return effect
+
+    def remove(self, effect):
+        """Remove an effect from the compositor, if present.
+
+        Args:
+            effect:
+                The Effect instance to remove.
+        """
+        if effect in self._effects:
+            self._effects.remove(effect)
+
+    def clear(self):
+        """Remove all effects."""
+        self._effects.clear()
+
+    def flash(self, colour=WHITE, alpha=128, duration=10, easing=hold):
+        """Flash the area with a colour.
+
+        Args:
+            colour:
+                The colour of the flash (default white).
+            alpha:
+                The alpha at the start of the flash (default 128).
+            duration:
+                The length of the flash in frames (default 10).
+            easing:
+                How the flash fades out over its duration. The default holds
+                the starting alpha for the whole flash.
+        Returns:
+            The Effect.
+        """
+        return self.add(Effect(colour, alpha, 0, duration, easing))
+
+    def fade(self, colour=BLACK, duration=30, alpha=255, easing=linear):
+        """Fade the area to a colour. Once the fade completes the colour
+        stays in place until the effect is removed or cleared.
+
+        Args:
+            colour:
+                The colour to fade to (default black).
+            duration:
+                The length of the fade in frames (default 30).
+            alpha:
+                The alpha at the end of the fade (default 255).
+            easing:
+                The easing function for the fade (default linear).
+        Returns:
+            The Effect.
+        """
+        effect = Effect(colour, 0, alpha, duration, easing)
+        effect.persist = True
+        return self.add(effect)
+
+    def tint(self, colour, alpha=64, duration=None):
+        """Tint the area with a colour.
+
+        Args:
+            colour:
+                The colour of the tint.
+            alpha:
+                The strength of the tint (default 64).
+            duration:
+                Optional number of frames to tint for. If not supplied, the
+                tint remains until the effect is removed or cleared.
+        Returns:
+            The Effect.
+        """
+        return self.add(Effect(colour, alpha, alpha, duration, hold))
+
+    def update(self):
+        """Prepare for a new frame. This should be called before the area
+        is rendered.
+        """
+        if self._drawn:
+            # The last frame's overlays are still on screen, so the area
+            # beneath them needs rebuilding.
+            if self._renderer:
+                self._renderer.invalidate(self._area)
+            self._drawn = False
+
+    def draw(self):
+        """Draw the active effects over the area and move them on to their
+        next frame. This should be called after the area is rendered.
+        """
+        if not self._effects:
+            return
+
+        for effect in list(self._effects):
+            alpha = effect.alpha
+            if alpha > 0:
+                overlay = self._overlay(effect.colour)
+                overlay.set_alpha(alpha)
+                self._screen.blit(overlay, self._area)
+                self._drawn = True
+
+            effect.advance()
+            if effect.finished:
+                self._effects.remove(effect)
+
+        if self._drawn and self._renderer:
+            self._renderer.mark_dirty(self._area)
+
+    def _overlay(self, colour):
+        colour = tuple(colour)
+        try:
+            return self._overlays[colour]
+        except KeyError:
+            overlay = pygame.Surface(self._area.size).convert()
+            overlay.fill(colour)
+            self._overlays[colour] = overlay
+            return overlay
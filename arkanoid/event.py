@@ -18,11 +18,24 @@ class EventReceiver:
         # Map of event types to handlers.
         self._handlers = defaultdict(list)
 
-    def receive(self):
+    def receive(self, timeout=None):
         """Receive the latest list of pygame events (if any) and dispatch them
         to any registered handlers.
+
+        Args:
+            timeout:
+                Optional number of milliseconds to wait for an event to arrive
+                when there are none pending. By default, return immediately.
+        Returns:
+            True if any events were received, False otherwise.
         """
-        event_list = pygame.event.get()
+        if timeout is None:
+            event_list = pygame.event.get()
+        else:
+            # Sleep until an event arrives, or the timeout expires.
+            event = pygame.event.wait(max(timeout, 1))
+            event_list = [] if event.type == pygame.NOEVENT else [event]
+            event_list += pygame.event.get()
 
         for event in event_list:
             try:
@@ -34,6 +47,8 @@ class EventReceiver:
                 for handler in handlers:
                     handler(event)
 
+        return bool(event_list)
+
     def register_handler(self, event_type, *handlers):
         """Register one or more event handlers for the given event type.
 
@@ -1,4 +1,3 @@
-import functools
 import importlib
 import itertools
 import logging
@@ -8,18 +7,27 @@ import random
 import pygame
 from pygame.sprite import Sprite # 🔸 필살기 아이템 생성을 위해 Sprite 임포트
 
+from arkanoid.collision import (CollisionWorld,
+                                SortAndSweep)
+from arkanoid.effects import Effects
 from arkanoid.event import receiver
+from arkanoid.hud import HudValue
 from arkanoid.rounds.round1 import Round1
 from arkanoid.sprites.ball import Ball
-from arkanoid.sprites.enemy import Enemy
+from arkanoid.sprites.enemy import (BROADPHASE_MARGIN,
+                                    Enemy)
 from arkanoid.sprites.paddle import (ExplodingState,
                                      Paddle,
                                      MaterializeState)
-from arkanoid.utils.util import (load_high_score,
+from arkanoid.utils.util import (assets,
+                                 load_high_score,
                                  load_png,
                                  load_png_sequence,
                                  save_high_score)
 from arkanoid.utils import ptext
+from arkanoid.utils.render import (Interpolator,
+                                   Renderer,
+                                   TextSprite)
 
 # 로깅 설정은 유지합니다.
 LOG = logging.getLogger(__name__)
@@ -28,15 +36,62 @@ LOG = logging.getLogger(__name__)
 # 게임이 1초에 60번 업데이트되므로 공/패들의 이동 속도도 이 기준에 맞춰 설계됨.
 GAME_SPEED = 60
 
+# The length of each simulation step in milliseconds. The game is advanced
+# in steps of this length however long each frame takes, so the speeds of
+# the sprites, which are in pixels per step, hold when a frame runs long.
+SIMULATION_STEP = 1000 / GAME_SPEED
+
+# The most frames drawn per second. This can be higher than GAME_SPEED, to
+# suit a fast display, with the sprites drawn between the simulation steps
+# when RENDER_INTERPOLATION is on.
+FRAME_RATE = 60
+
+# Whether moving sprites are drawn part way between their positions at the
+# last two simulation steps, according to how far each frame falls into the
+# next step, so that motion is smooth when frames and steps don't line up.
+RENDER_INTERPOLATION = True
+
+# The furthest a sprite can move along either axis in one simulation step
+# and still be interpolated. Sprites that jump further, such as a ball being
+# reset, are drawn at their new position straight away.
+INTERPOLATION_MAX_DISTANCE = 32  # pixels
+
+# The seed for the random choices made during a game, such as the angles of
+# bounce and the bricks that hold powerups. A game with a fixed seed plays out
+# the same way every time for the same input. None for a new seed each game.
+GAME_SEED = None
+
+# The most simulation steps run to catch up before a frame is drawn. After a
+# longer stall, such as the window being dragged, the game slows down rather
+# than lurching ahead.
+MAX_SIMULATION_STEPS = 5
+
 # 메인 게임 창 해상도 (가로 600px, 세로 800px)
 DISPLAY_SIZE = 600, 800
 
 # 화면 상단의 HUD(점수, 하이스코어, 타이머)를 위해 비워둘 공간
 TOP_OFFSET = 150
 
+# The number of frames between each step of the start screen animation.
+START_SCREEN_ANIMATION_FRAMES = 4
+# The number of frames between each change of colour of the start screen
+# prompt text.
+START_SCREEN_BLINK_FRAMES = 15
+
+# The area of the start screen covered by the powerup legend.
+START_SCREEN_LEGEND_RECT = pygame.Rect(0, 200, 600, 290)
+
+# The maximum time in milliseconds to sleep waiting for input whilst the
+# screen is static, e.g. on the GAME OVER screen.
+IDLE_TIMEOUT = 500
+
 # 윈도우 창의 제목
 DISPLAY_CAPTION = 'Arkanoid'
 
+# Whether to redraw and present only the changed regions of the screen each
+# frame, rather than redrawing and flipping the whole screen.
+DIRTY_RECT_RENDERING = True
+
 # 공이 패들에서 시작할 때의 각도 (라디안)
 # (너무 수직이면 게임 진행 어려움 → 최소값 제한 코멘트 있음)
 BALL_START_ANGLE_RAD = 5.0   # 286.48도 # -3.14보다 작으면 안 됨
@@ -52,6 +107,14 @@ BALL_TOP_SPEED = 12  # px/frame
 # (0.02면 매우 서서히 BASE_SPEED로 복귀함)
 BALL_SPEED_NORMALISATION_RATE = 0.02
 
+# Whether the ball checks for collision along its whole path each frame,
+# so that it can't pass through thin sprites or brick corners at speed.
+BALL_SWEPT_COLLISION = True
+
+# Whether collisions with the enemies, whose shapes are irregular, need their
+# pixels to overlap rather than just their rects.
+MASK_COLLISION = True
+
 # 벽돌(brick)에 맞을 때 공 속도 증가량
 BRICK_SPEED_ADJUST = 0.3    # 0.5 -> 0.3으로 변경
 
@@ -61,6 +124,10 @@ WALL_SPEED_ADJUST = 0.1      # 0.2에서 0.1로 변경
 # 패들의 이동 속도
 PADDLE_SPEED = 10
 
+# Whether the angle the ball bounces off the paddle changes smoothly along
+# the paddle, rather than in steps from one segment of the paddle to the next.
+PADDLE_SMOOTH_BOUNCE = False
+
 # 파워업/필살기 아이템의 표준 크기 (StartScreen 참고)
 ITEM_ICON_SIZE = (44, 28)
 
@@ -83,7 +150,12 @@ class Arkanoid:
 
         # Create the main screen (the window) and default background.
         self._screen = self._create_screen()
+        # Decode all the images up front, so that round setup and powerup
+        # spawns don't stall loading them mid-game.
+        assets.preload()
         self._background = self._create_background()
+        self._renderer = Renderer(self._screen,
+                                  dirty_rects=DIRTY_RECT_RENDERING)
         self._display_logo()
         self._display_score_titles()
         self._high_score = load_high_score()
@@ -96,11 +168,13 @@ class Arkanoid:
 
         # Whether we're running.
         self._running = True
+
+        # The time in milliseconds that has passed but not yet been simulated.
+        self._accumulator = 0.0
         
         ### TIMER 변수 추가해봄 ##-----------------------------------
         self.level_time_limit = 250              # 제한 시간(초)
         self.time_left = self.level_time_limit
-        self._last_time_tick = pygame.time.get_ticks()
         
         #지금 어떤 라운드 객체인지 추적용
         self._current_round = None
@@ -116,14 +190,12 @@ class Arkanoid:
             self._running = False
         receiver.register_handler(pygame.QUIT, quit_handler)
 
-        # Initialise the scores.
-        self._display_player_score = functools.partial(self._display_score,
-                                                       y=35)
-        self._display_high_score = functools.partial(self._display_score,
-                                                     y=100)
+        # Initialise the scores. Each slot remembers the value it last drew
+        # and only re-renders when that value changes.
+        self._display_player_score = self._create_hud_value(y=35).display
+        self._display_high_score = self._create_hud_value(y=100).display
         # 타이머 숫자 표시용 (y=135에 그림) -----------------------------
-        self._display_timer = functools.partial(self._display_score,
-                                                y=135)
+        self._display_timer = self._create_hud_value(y=135).display
         #--------------------------------------------------
         
         self._display_player_score(0)
@@ -137,55 +209,46 @@ class Arkanoid:
 
         Pretty much everything takes place within this loop.
         """
+        # The number of milliseconds for which the screen will stay static.
+        # The loop sleeps waiting for input during that time, rather than
+        # running at full rate.
+        idle = 0
+
         while self._running:
-            # Game runs at 60 fps.
-            self._clock.tick(GAME_SPEED)
+            if idle:
+                # Sleep until the screen next changes or input arrives, then
+                # resume at full rate.
+                receiver.receive(timeout=idle)
+                idle = 0
+                # The time spent asleep isn't simulated.
+                self._clock.tick()
+                elapsed = 0
+            else:
+                # Frames are drawn at up to FRAME_RATE fps.
+                elapsed = self._clock.tick(FRAME_RATE)
 
-            # Receive and dispatch events.
-            receiver.receive()
+                # Receive and dispatch events.
+                receiver.receive()
 
             if not self._game:
-                self._start_screen.show()
+                if self._start_screen.show():
+                    pygame.display.flip()
+                idle = self._start_screen.idle_time()
             else:
-                 # 🔹 [추가] 라운드가 바뀌었는지 체크해서, 바뀌었으면 타이머 리셋
-                if self._current_round is not self._game.round:
-                    self.time_left = self.level_time_limit
-                    self._last_time_tick = pygame.time.get_ticks()
-                    self.time_over = False
-                    self._time_over_drawn = False
-                    self._current_round = self._game.round
-                    self._display_timer(int(self.time_left))
-                        
                 #아직 시간 안 끝났으면 평소처럼 게임 업데이트 -----
                 if not self.time_over:
-                    self._game.update()
-                    self._display_player_score(self._game.score) 
-                #--------------------------------------
-                
-                    # TIMER UPDATE: 게임이 진행 중일 때만 시간 감소 ------------------
-                    if not self._game.over and self.time_left > 0:
-                        current_tick = pygame.time.get_ticks()
-                        dt = (current_tick - self._last_time_tick) / 1000.0  # ms → 초
-                        self.time_left -= dt
-                        self._last_time_tick = current_tick
-
-                        # 0 이하로 내려가는 거 방지 + 시간 끝나면 게임 오버 처리
-                        if self.time_left <= 0:
-                            self.time_left = 0
-                            self.time_over = True   # 시간 초과 = 게임 종료
+                    # Simulate the time that has passed in fixed steps, then
+                    # draw the result once.
+                    for _ in range(self._simulation_steps(elapsed)):
+                        self._step()
+                        if self.time_over:
+                            break
+                    self._game.draw(
+                        min(self._accumulator / SIMULATION_STEP, 1))
+                    self._display_player_score(self._game.score)
 
                     # 화면에 남은 시간 숫자 그리기
                     self._display_timer(int(self.time_left))
-                    # (일반적인) 게임 오버 처리: 라이프 다 쓰거나 클리어했을 때
-                    # 이제는 바로 게임을 없애지 말고, GAME OVER 화면 모드로 전환
-                    if self._game.over and not self.time_over:
-                         # 하이스코어 저장은 한 번만
-                        if not self._time_over_drawn:
-                            if self._game.score > self._high_score:
-                                self._high_score = self._game.score
-                                self._display_high_score(self._high_score)
-                                save_high_score(self._high_score)
-                        self.time_over = True
                 #-------------------------------------------------------------
                 # 시간이 다 된 상태(time_over == True)면: 화면에 GAME OVER만 띄우고 멈춤
                 else:
@@ -194,7 +257,7 @@ class Arkanoid:
 
                     # GAME OVER 텍스트를 한 번만 그리자
                     if not self._time_over_drawn:
-                        ptext.draw(
+                        surf, pos = ptext.draw(
                             'GAME OVER',
                             center=(self._screen.get_width() // 2,
                                     DISPLAY_SIZE[1] // 2),
@@ -204,13 +267,79 @@ class Arkanoid:
                             shadow=(1.0, 1.0),
                             scolor="black",
                         )
+                        self._renderer.mark_dirty(
+                            pygame.Rect(pos, surf.get_size()))
                         self._time_over_drawn = True
+                    else:
+                        # Nothing changes on the GAME OVER screen.
+                        idle = IDLE_TIMEOUT
                     
             # Display all updates.
-            pygame.display.flip()
+            if self._game and not idle:
+                self._renderer.present()
 
         LOG.debug('Exiting')
 
+    def _simulation_steps(self, elapsed):
+        """Work out how many simulation steps to run for a frame.
+
+        Time that doesn't make up a whole step is carried over to the next
+        frame. At most MAX_SIMULATION_STEPS are run, and any time beyond
+        those is dropped.
+
+        Args:
+            elapsed:
+                The time in milliseconds since the last frame.
+        Returns:
+            The number of steps.
+        """
+        self._accumulator += elapsed
+        steps = int(self._accumulator // SIMULATION_STEP)
+        if steps > MAX_SIMULATION_STEPS:
+            LOG.debug('Dropping %s simulation steps',
+                      steps - MAX_SIMULATION_STEPS)
+            steps = MAX_SIMULATION_STEPS
+            self._accumulator %= SIMULATION_STEP
+        else:
+            self._accumulator -= steps * SIMULATION_STEP
+        return steps
+
+    def _step(self):
+        """Advance the game by one simulation step, and run the round timer
+        down by the length of the step.
+        """
+        # 🔹 [추가] 라운드가 바뀌었는지 체크해서, 바뀌었으면 타이머 리셋
+        if self._current_round is not self._game.round:
+            self.time_left = self.level_time_limit
+            self.time_over = False
+            self._time_over_drawn = False
+            self._current_round = self._game.round
+            self._display_timer(int(self.time_left))
+
+        self._game.update()
+
+        # TIMER UPDATE: 게임이 진행 중일 때만 시간 감소 ------------------
+        # The timer runs on simulation time, so it keeps pace with play
+        # rather than with the wall clock.
+        if not self._game.over and self.time_left > 0:
+            self.time_left -= SIMULATION_STEP / 1000  # ms → 초
+
+            # 0 이하로 내려가는 거 방지 + 시간 끝나면 게임 오버 처리
+            if self.time_left <= 0:
+                self.time_left = 0
+                self.time_over = True   # 시간 초과 = 게임 종료
+
+        # (일반적인) 게임 오버 처리: 라이프 다 쓰거나 클리어했을 때
+        # 이제는 바로 게임을 없애지 말고, GAME OVER 화면 모드로 전환
+        if self._game.over and not self.time_over:
+            # 하이스코어 저장은 한 번만
+            if not self._time_over_drawn:
+                if self._game.score > self._high_score:
+                    self._high_score = self._game.score
+                    self._display_high_score(self._high_score)
+                    save_high_score(self._high_score)
+            self.time_over = True
+
     def _start_game(self, round_no):
         """Callback invoked by the start screen when a user begins a game,
         either by hitting the spacebar, or by entering a specific round number
@@ -230,13 +359,16 @@ class Arkanoid:
         else:
             # 타이머 리셋 --------------------
             self.time_left = self.level_time_limit      # 다시 90초
-            self._last_time_tick = pygame.time.get_ticks()
+            self._accumulator = 0.0
             self.time_over = False
             self._time_over_drawn = False
             self._display_timer(int(self.time_left))
 
             # [수정 시작] Game 클래스에 배경 Surface 전달
-            self._game = Game(background=self._background, round_class=round_cls)
+            self._game = Game(background=self._background,
+                              round_class=round_cls,
+                              renderer=self._renderer,
+                              seed=GAME_SEED)
             # [수정 끝]
             
             # 현재 라운드 기억 (라운드 바뀔 때 타이머 리셋용)
@@ -285,29 +417,18 @@ class Arkanoid:
         #            fontsize=20,  #24
         #            color=(230, 0, 0))
 
-    def _display_score(self, value, y):
-        # 점수를 그리는 surface를 하나 만든다. 가로150 세로 20
-        # .convert_alpha() : 투명(알파) 채널 있는 Surface로 변환
-        score_surf = pygame.Surface((150, 20)).convert_alpha() #150,20
-        
-        # ptext로 value(점수 숫자)를 score_surf 위에 그린다.
-        ptext.draw(str(value),
-                   #topright=(150, 0) : score_surf의 오른쪽 위 모서리를 기준으로 배치
-                   topright=(150, 0),
-                   fontname=MAIN_FONT,
-                # 숫자 글씨 크기
-                   fontsize=20,
-                   color=(255, 255, 255),
-                   surf=score_surf)
+    def _create_hud_value(self, y):
+        # 점수를 그리는 slot: 가로150 세로 20, 오른쪽 정렬
         # 메인 화면에서의 실제 위치 계산
         # - x : 화면 오른쪽에서 160px 안쪽
         # - y : 함수 인자로 받은 y 그대로 사용
-        position = self._screen.get_width() - 160, y-10      #160,y
-        # 배경을 한 번 먼저 덮어씌워서 이전 점수를 지운다.
-        # self._background의 같은 위치 영역을 복사해서 덮어버리는 느낌.
-        self._screen.blit(self._background, position, score_surf.get_rect())
-        # 그 위에 방금 그린 score_surf(숫자) 를 올려서 최종 표시.
-        self._screen.blit(score_surf, position)
+        return HudValue(self._screen,
+                        topright=(self._screen.get_width() - 10, y - 10),
+                        fontname=MAIN_FONT,
+                        fontsize=20,
+                        color=(255, 255, 255),
+                        size=(150, 20),
+                        renderer=self._renderer)
 
 
 class StartScreen:
@@ -336,32 +457,35 @@ class StartScreen:
 
         # The key for the powerups - their images with names and descriptions.
         # ITEM_ICON_SIZE (44, 28)에 맞춰 크기가 조정됨
-        ICON_W, ICON_H = ITEM_ICON_SIZE # 🔸 표준 아이템 크기 사용
-        self._powerups = (
-                          (itertools.cycle(load_png_sequence('powerup_life')),
+        powerups = (
+                          (load_png_sequence('powerup_life'),
                            'extra life',
                            'gain an additional\nlife'), #gain an additional\nvaus
                           
-                          (itertools.cycle(load_png_sequence('powerup_expand')),
+                          (load_png_sequence('powerup_expand'),
                           'expand',
                           'expands the paddle'), 
                           
-                          (itertools.cycle(load_png_sequence('powerup_duplicate')),
+                          (load_png_sequence('powerup_duplicate'),
                            'duplicate',
                            'duplicates the ball'),
                           
-                          (itertools.cycle(load_png_sequence('powerup_slow')),  
+                          (load_png_sequence('powerup_slow'),  
                            'slow',
                            'slow down the speed'), # 슬로우
                           
-                          (itertools.cycle(load_png_sequence('powerup_reduce')),
+                          (load_png_sequence('powerup_reduce'),
                            'reduce',
                            'reduces the paddle'), # reduce
                           
-                          (itertools.cycle(load_png_sequence('powerup_speedup')),  
+                          (load_png_sequence('powerup_speedup'),  
                            'speedup',
                            'speed up the ball'))  # speedup
 
+        # Pre-render the legend and pre-scale the animations, so that each
+        # animation step costs one blit per powerup.
+        self._legend, self._powerups = self._create_legend(powerups)
+
         # Whether the event listeners have been registered.
         self._registered = False
 
@@ -377,87 +501,182 @@ class StartScreen:
         self._user_input = ''
         self._user_input_pos = None
 
-        # Keep track of display count for animation purposes.
-        self._display_count = 0
+        # The time the start screen was first shown, and the animation and
+        # blink steps last drawn, for animation purposes.
+        self._start_ticks = 0
+        self._anim_step, self._blink_step = None, None
+
+        # The screen regions of the blinking prompt text.
+        self._prompt_rects = []
+
+        # The user input text last drawn.
+        self._user_input_drawn = None
 
     def show(self):
         """Display the start screen and register event listeners for
         capturing keyboard input.
 
         This method is designed to be called repeatedly by the main game loop.
+        Animation is timed by the clock rather than by the number of calls, so
+        the loop may sleep between calls for the duration given by
+        idle_time().
+
+        Returns:
+            True if the screen was changed and needs to be displayed.
         """
         if not self._registered:
             receiver.register_handler(pygame.KEYUP, self._on_keyup)
             self._registered = True
-        
+
+        changed = False
+
         if not self._init:
            self._init = True
+           self._start_ticks = pygame.time.get_ticks()
+           self._anim_step, self._blink_step = None, None
+           self._user_input_drawn = None
            self._screen.blit(pygame.Surface((600, 650)), (0, TOP_OFFSET))
+           self._screen.blit(self._legend, START_SCREEN_LEGEND_RECT)
+
+           ptext.draw('Based on original Arkanoid game\n'
+                      'by Taito Corporation 1986',
+                      (100, 700),
+                      align='center',
+                      fontname=ALT_FONT,
+                      fontsize=24,
+                      color=(128, 128, 128))
+           changed = True
+
+        frame = self._frame()
+
+        if frame // START_SCREEN_ANIMATION_FRAMES != self._anim_step:
+            self._anim_step = frame // START_SCREEN_ANIMATION_FRAMES
+            self._draw_powerups()
+            changed = True
+
+        # 깜빡이는 텍스트 색상 주기
+        if frame // START_SCREEN_BLINK_FRAMES != self._blink_step:
+            self._blink_step = frame // START_SCREEN_BLINK_FRAMES
+            self._text_color_1 = next(self._text_colors_1)
+            self._text_color_2 = next(self._text_colors_2)
+            self._draw_prompt()
+            changed = True
+
+        if self._user_input != self._user_input_drawn:
+            self._user_input_drawn = self._user_input
+            self._user_input_pos = ptext.draw(self._user_input, (280, 625),
+                                              fontname=ALT_FONT,
+                                              fontsize=40,
+                                              color=(255, 255, 255))[1]
+            changed = True
+
+        return changed
 
-        ptext.draw('item', (245, 200),   # 수정함
+    def idle_time(self):
+        """The time until the start screen next changes of its own accord.
+
+        Returns:
+            The number of milliseconds until the next animation step.
+        """
+        frame = self._frame()
+        next_frame = min(
+            (frame // START_SCREEN_ANIMATION_FRAMES + 1) *
+            START_SCREEN_ANIMATION_FRAMES,
+            (frame // START_SCREEN_BLINK_FRAMES + 1) *
+            START_SCREEN_BLINK_FRAMES)
+        elapsed = pygame.time.get_ticks() - self._start_ticks
+        return max(-(-next_frame * 1000 // GAME_SPEED) - elapsed, 1)
+
+    def _frame(self):
+        # The number of frames elapsed at GAME_SPEED since the start screen
+        # was first shown.
+        return (pygame.time.get_ticks() - self._start_ticks) * GAME_SPEED // \
+            1000
+
+    def _create_legend(self, powerups):
+        """Render the powerup legend - the title, names and descriptions -
+        onto a single surface, and scale the powerup animations to the icon
+        size.
+
+        Args:
+            powerups:
+                A sequence of 3-tuples of a powerup's image sequence, name
+                and description.
+        Returns:
+            A 2-tuple of the legend surface, and a list of 2-tuples of an
+            endless iterator over each powerup's scaled animation frames and
+            the screen position of the icon.
+        """
+        legend = pygame.Surface(START_SCREEN_LEGEND_RECT.size).convert()
+        origin_x, origin_y = START_SCREEN_LEGEND_RECT.topleft
+
+        ptext.draw('item', (245 - origin_x, 200 - origin_y),   # 수정함
                    fontname=ALT_FONT,
                    fontsize=32,
-                   color=(255, 255, 255))
-        
-        left, top = 30, 270   # 30, 270   
+                   color=(255, 255, 255),
+                   surf=legend)
+
+        left, top = 30, 270   # 30, 270
         ICON_W, ICON_H = ITEM_ICON_SIZE # 🔸 표준 아이템 크기 사용
-        
-        for anim, name, desc in self._powerups:   
-            if self._display_count % 4 == 0:
-                image, _ = next(anim)
-                
+        animations = []
+
+        for sequence, name, desc in powerups:
+            frames = []
+            for image, _ in sequence:
                 # 2️⃣ 알파(투명) 보존 + 크기 조정 (수정) ---------
                 image = image.convert_alpha()
                 if image.get_size() != (ICON_W, ICON_H):
-                    image = pygame.transform.smoothscale(image, (ICON_W, ICON_H))
-                # ---------------- 
-                self._screen.blit(image, (left, top))
-                ptext.draw(name.upper(), (left + image.get_width() + 20,
-                                          top-3),
-                           fontname=ALT_FONT,
-                           fontsize=20,
-                           color=(255, 255, 255))
-                ptext.draw(desc.upper(), (left, top + 25),
-                           fontname=ALT_FONT,
-                           fontsize=14,
-                           color=(255, 255, 255))
+                    image = pygame.transform.smoothscale(image,
+                                                         (ICON_W, ICON_H))
+                # ----------------
+                # Flatten onto the background so that each frame completely
+                # replaces the last.
+                frame = pygame.Surface((ICON_W, ICON_H)).convert()
+                frame.blit(image, (0, 0))
+                frames.append(frame)
+            animations.append((itertools.cycle(frames), (left, top)))
+
+            ptext.draw(name.upper(), (left + ICON_W + 20 - origin_x,
+                                      top - 3 - origin_y),
+                       fontname=ALT_FONT,
+                       fontsize=20,
+                       color=(255, 255, 255),
+                       surf=legend)
+            ptext.draw(desc.upper(), (left - origin_x, top + 25 - origin_y),
+                       fontname=ALT_FONT,
+                       fontsize=14,
+                       color=(255, 255, 255),
+                       surf=legend)
             left += 180
 
             if left > 400:
                 left = 30
                 top += 100
-        
-        # 깜빡이는 텍스트 색상 주기
-        if self._display_count % 15 == 0:
-            self._text_color_1 = next(self._text_colors_1)
-            self._text_color_2 = next(self._text_colors_2)
 
-        ptext.draw('SPACEBAR TO START', (50, 500),
-                fontname=ALT_FONT,
-                fontsize=48,
-                color=self._text_color_1,
-                shadow=(1.0, 1.0),
-                scolor="grey")
-
-        ptext.draw('OR ENTER LEVEL', (160, 575),
-                fontname=ALT_FONT,
-                fontsize=32,
-                color=self._text_color_2)
-
-        self._user_input_pos = ptext.draw(self._user_input, (280, 625),
-                                       fontname=ALT_FONT,
-                                       fontsize=40,
-                                       color=(255, 255, 255))[1]
-
-        ptext.draw('Based on original Arkanoid game\n'
-                'by Taito Corporation 1986',
-                (100, 700),
-                align='center',
-                fontname=ALT_FONT,
-                fontsize=24,
-                color=(128, 128, 128))
+        return legend, animations
+
+    def _draw_powerups(self):
+        for animation, position in self._powerups:
+            self._screen.blit(next(animation), position)
+
+    def _draw_prompt(self):
+        # Erase the previous colour before drawing in the new one.
+        for rect in self._prompt_rects:
+            self._screen.fill((0, 0, 0), rect)
 
-        self._display_count += 1
+        surf, pos = ptext.draw('SPACEBAR TO START', (50, 500),
+                               fontname=ALT_FONT,
+                               fontsize=48,
+                               color=self._text_color_1,
+                               shadow=(1.0, 1.0),
+                               scolor="grey")
+        self._prompt_rects = [pygame.Rect(pos, surf.get_size())]
+
+        surf, pos = ptext.draw('OR ENTER LEVEL', (160, 575),
+                               fontname=ALT_FONT,
+                               fontsize=32,
+                               color=self._text_color_2)
+        self._prompt_rects.append(pygame.Rect(pos, surf.get_size()))
 
     def hide(self):
         """Hide the start screen and unregister event listeners."""
@@ -497,7 +716,8 @@ class Game:
     """
 
     # [수정] background 인자를 추가했습니다.
-    def __init__(self, background, round_class=Round1, lives=3):
+    def __init__(self, background, round_class=Round1, lives=3,
+                 renderer=None, seed=None):
         """Initialise a new Game.
 
         Args:
@@ -507,7 +727,23 @@ class Game:
                 The class of the round to start, default Round1.
             lives:
                 Optional number of lives for the player, default 3.
+            renderer:
+                Optional Renderer used to draw the game. If not supplied, a
+                new one will be created.
+            seed:
+                Optional seed for the game's random choices. Playing a game
+                with the same seed and the same input reproduces it exactly.
+                If not supplied, a new seed is chosen.
         """
+        # All of the game's randomness is drawn from its own generator, so
+        # that a game can be replayed from its seed, and games don't affect
+        # each other.
+        if seed is None:
+            seed = int.from_bytes(os.urandom(4), 'big')
+        self.seed = seed
+        self.rng = random.Random(seed)
+        LOG.info('Game seed: %s', seed)
+
         # Keep track of the score and lives throughout the game.
         self.lives = lives
         self.score = 0
@@ -517,13 +753,23 @@ class Game:
         # [수정] background 인자를 인스턴스 변수로 저장
         self._background = background
 
+        # Draws the sprites and presents the changed regions of the screen.
+        self.renderer = renderer or Renderer(dirty_rects=DIRTY_RECT_RENDERING)
+        # Where to draw the moving sprites between simulation steps.
+        self.interpolator = Interpolator(INTERPOLATION_MAX_DISTANCE)
+
+        # The area of the screen below the HUD where the game is played.
+        self._game_area = pygame.Rect(
+            0, TOP_OFFSET, self._screen.get_width(),
+            self._screen.get_height() - TOP_OFFSET)
+
         # The life graphic.
         self._life_img, _ = load_png('paddle_life.png')
         # The life graphic positions.
         self._life_rects = []
 
         # The current round.
-        self.round = round_class(TOP_OFFSET)
+        self.round = round_class(TOP_OFFSET, rng=self.rng)
 
         # The sprites in the game.
         self.paddle = Paddle(left_offset=self.round.edges.left.rect.width,
@@ -531,12 +777,18 @@ class Game:
                              bottom_offset=60,
                              speed=PADDLE_SPEED)
 
+        # The sprites the balls can collide with, shared by every ball.
+        self.collision_world = CollisionWorld()
+
         ball = Ball(start_pos=self.paddle.rect.midtop,
                     start_angle=BALL_START_ANGLE_RAD,
                     base_speed=BALL_BASE_SPEED,
                     top_speed=BALL_TOP_SPEED,
                     normalisation_rate=BALL_SPEED_NORMALISATION_RATE,
-                    off_screen_callback=self._off_screen)
+                    off_screen_callback=self._off_screen,
+                    swept=BALL_SWEPT_COLLISION,
+                    collision_world=self.collision_world,
+                    rng=self.rng)
 
         # The game starts with a single ball in play initially.
         self.balls = [ball]
@@ -547,6 +799,10 @@ class Game:
         # The current enemies in the game.
         self.enemies = []
 
+        # Pairs the enemies with the sprites and other enemies they might be
+        # touching. Rebuilt every frame.
+        self.enemy_broadphase = SortAndSweep(margin=BROADPHASE_MARGIN)
+
         # 🔸 필살기 관련 변수
         self.special_ready = False  # 필살기 사용 가능 상태
         self.special_used = False   # 현재 라운드에서 필살기 사용 여부
@@ -569,7 +825,12 @@ class Game:
             self.special_item_image.fill((255, 255, 0))
             # 💡 [디버깅 추가] 로드 실패 메시지
             LOG.error("🚨 special_item.png 파일을 찾을 수 없어 노란색 임시 Surface 사용.")
-        self.flash_timer = 10        # 화면 플래시 효과 타이머 (초기값 10 유지)
+
+        # Composites screen effects such as the special flash over the game
+        # area, reusing the same overlay surfaces every frame.
+        self.effects = Effects(self._screen, self._game_area, self.renderer)
+        # 화면 플래시 효과 (새 게임 시작 시에도 플래시, 초기값 10 유지)
+        self.effects.flash(duration=10)
         
         # Hold a reference to all the sprites for redrawing purposes.
         self.sprites = []
@@ -585,16 +846,22 @@ class Game:
         self.state = GameStartState(self)
 
     def update(self):
-        """Update the state of the running game."""
-        
-        # 1. Clear the screen.
-        # [수정1] 게임 보드 배경을 TOP_OFFSET(150px) 아래부터 그려 HUD 영역을 보존합니다.
-        self._screen.blit(self.round.background, (0, TOP_OFFSET))
+        """Advance the running game by one simulation step.
+
+        Nothing is drawn; draw() renders the game as it stands after the
+        latest step.
+        """
+        # 1. Record where the sprites are before they move.
+        if RENDER_INTERPOLATION:
+            self.interpolator.record(self.sprites)
 
         # 2. Delegate to the active state.
         self.state.update()
         
         # 3. Update all sprites.
+        self.round.update()
+        if self.enemies:
+            self.enemy_broadphase.rebuild(self.enemies)
         for sprite in self.sprites:
             sprite.update()
             
@@ -638,50 +905,74 @@ class Game:
                 self.special_item = None
                 LOG.info("필살기 획득! 이제 'S' 키를 눌러 사용 가능.")
 
-        # 4. Draw the sprites.
-        for sprite in self.sprites:
-            if sprite.visible:
-                self._screen.blit(sprite.image, sprite.rect)
-
-        # 🔸 필살기 플래시 효과 그리기 
-        if self.flash_timer > 0:
-            
-            # [수정2] 게임 영역 크기 계산 (화면 너비, 화면 높이 - TOP_OFFSET)
-            game_area_width = self._screen.get_width()
-            game_area_height = self._screen.get_height() - TOP_OFFSET
-            
-            # 게임 영역 크기만큼의 흰색 반투명 오버레이를 생성
-            overlay = pygame.Surface((game_area_width, game_area_height), pygame.SRCALPHA)
-            overlay.fill((255, 255, 255, 128)) # 흰색, 반투명
-            
-            # 오버레이를 (0, TOP_OFFSET) 위치부터 그립니다. (HUD 영역 제외)
-            self._screen.blit(overlay, (0, TOP_OFFSET))
-            
-            self.flash_timer -= 1
-
+    def draw(self, alpha=1.0):
+        """Draw the running game as it stands after the latest simulation
+        step.
 
-        # 5. Update the lives.
+        Args:
+            alpha:
+                How far the frame falls between the latest simulation step
+                and the next, from 0 to 1 (default 1). Unless it is 1, moving
+                sprites are drawn that far between their positions before
+                and after the latest step, when RENDER_INTERPOLATION is on.
+        """
+        # 1. Set the background the sprites are drawn over. The round's static
+        # layer already holds the side edges and any bricks not animating.
+        # [수정1] 게임 보드 배경을 TOP_OFFSET(150px) 아래부터 그려 HUD 영역을 보존합니다.
+        self.renderer.set_background(self.round.static_layer, (0, TOP_OFFSET))
+
+        # 2. Draw the sprites.
+        self.effects.update()
+        sprites = self.round.animating_bricks + self.sprites
+        rects = None
+        if RENDER_INTERPOLATION and alpha < 1:
+            rects = self.interpolator.rects(sprites, alpha)
+        self.renderer.render(sprites, rects)
+
+        # 3. Update the lives. They sit within the game area, so they are
+        # drawn before the effects to end up beneath any overlay, whether or
+        # not the renderer rebuilt the area under them.
         self._update_lives()
 
+        # 🔸 필살기 플래시 효과 그리기 
+        # 오버레이는 게임 영역에만 그립니다. (HUD 영역 제외)
+        self.effects.draw()
+
     # 🔸 [삭제] _update_sprites 메서드는 update에 통합되어 삭제됨.
 
     def _update_lives(self):
-        """Update the number of remaining lives displayed on the screen."""
-        # Erase the existing lives.
-        for rect in self._life_rects:
-            # 💡 [수정] Game.__init__에서 받은 self._background를 사용하여 이전 라이프 아이콘을 지웁니다.
-            self._screen.blit(self._background, rect, rect)
-        self._life_rects.clear()
+        """Update the number of remaining lives displayed on the screen.
 
-        # Display the remaining lives.
+        A life icon is only drawn when it first appears, or over the parts
+        of it that the renderer has rebuilt. Icons for lost lives are erased.
+        """
         left = self.round.edges.left.rect.width
         top = self._screen.get_height() - self._life_img.get_height() - 5
+        rects = []
 
+        # Display the remaining lives.
         for life in range(self.lives - 1):
-            self._life_rects.append(
-                self._screen.blit(self._life_img, (left, top)))
+            rect = self._life_img.get_rect(topleft=(left, top))
+            if life >= len(self._life_rects):
+                areas = [rect]
+            else:
+                # Redraw only what was erased, as blending the icon over
+                # itself would darken its translucent edges.
+                areas = self.renderer.damaged(rect)
+            for area in areas:
+                self._screen.blit(self._life_img, area,
+                                  area.move(-rect.x, -rect.y))
+                self.renderer.mark_dirty(area)
+            rects.append(rect)
             left += self._life_img.get_width() + 5
 
+        # Erase the lives that have been lost.
+        for rect in self._life_rects[len(rects):]:
+            self.renderer.restore(rect)
+            self.renderer.mark_dirty(rect)
+
+        self._life_rects = rects
+
     def on_brick_collide(self, brick, sprite):
         """Called by a sprite when it collides with a brick.
 
@@ -700,7 +991,7 @@ class Game:
         # Has the brick been destroyed, based on the collision count?
         if brick.visible:
             # Still visible, so animate to indicate strike.
-            brick.animate()
+            self.round.animate_brick(brick)
         else:
             # Brick has been destroyed.
             if brick.value:
@@ -709,7 +1000,9 @@ class Game:
 
             # Tell the round that a brick has gone, so that it can decide
             # whether the round is completed.
-            self.round.brick_destroyed()
+            self.round.brick_destroyed(brick)
+            # The brick has been erased from the round's static layer.
+            self.renderer.invalidate(brick.rect)
             
             # 💡 [수정] 필살기 아이템 생성 로직: 
             # 1. 파괴된 벽돌이 지정된 special_brick이고
@@ -734,7 +1027,7 @@ class Game:
             if not release:
                 # Brick hasn't been destroyed, so randomly decide whether
                 # to release or not.
-                release = random.choice((True, False))
+                release = self.rng.choice((True, False))
 
             if release:
                 powerup = brick.powerup_cls(self, brick)
@@ -767,17 +1060,17 @@ class Game:
         """
         enemy.explode()
         self.score += 500
-        # Temporarily remove the enemy sprites from the balls to prevent
-        # the balls from colliding with the explosion. The enemy sprites
-        # are re-added to the balls when they are re-released.
-        for ball in self.balls:
-            ball.remove_collidable_sprite(enemy)
+        # Temporarily remove the enemy sprite from the collision world to
+        # prevent the balls from colliding with the explosion. The enemy
+        # sprite is re-added when it is re-released.
+        self.collision_world.remove(enemy)
 
     def _setup_enemies(self):
         """Set up the enemy sprites ready for release into the game."""
         collidable_sprites = []
         collidable_sprites += self.round.edges
         collidable_sprites += self.round.bricks
+        self.enemy_broadphase.set_static(collidable_sprites)
 
         for _ in range(self.round.num_enemies):
             # Create the sprite.
@@ -785,7 +1078,10 @@ class Game:
                                  self.paddle,
                                  self.on_enemy_collide,
                                  collidable_sprites,
-                                 on_destroyed=self.release_enemy)
+                                 on_destroyed=self.release_enemy,
+                                 broadphase=self.enemy_broadphase,
+                                 precise=MASK_COLLISION,
+                                 rng=self.rng)
 
             # Keep track of the enemy sprites currently in the game.
             self.enemies.append(enemy_sprite)
@@ -813,9 +1109,8 @@ class Game:
             enemy.reset()  # Show the enemy and re-init its movement.
             enemy.rect.topleft = coords
             # Tell the ball(s) about it.
-            for ball in self.balls:
-                ball.add_collidable_sprite(enemy,
-                                           on_collide=self.on_enemy_collide)
+            self.collision_world.add(enemy, on_collide=self.on_enemy_collide,
+                                     precise=MASK_COLLISION)
 
         # Trigger opening the door.
         self.round.edges.top.open_door(door_open)
@@ -873,7 +1168,7 @@ class Game:
         # 필살기 사용 상태로 변경
         self.special_used = True
         self.special_ready = False # 👈 사용했으므로 준비 상태 해제
-        self.flash_timer = 10 # 화면 플래시 효과를 위한 타이머
+        self.effects.flash(duration=10) # 화면 플래시 효과
 
         # 📢 [추가] 필살기 사용 시 패들 이미지 원래대로 복구
         self.paddle.deactivate_special_image()
@@ -886,8 +1181,7 @@ class Game:
 
         # 공이 적과 충돌하지 않도록 임시로 충돌 목록에서 제거
         for enemy in self.enemies:
-            for ball in self.balls:
-                ball.remove_collidable_sprite(enemy)
+            self.collision_world.remove(enemy)
 
         # 문 닫기 취소 (만약 열려 있다면)
         self.round.edges.top.cancel_open_door()
@@ -1025,7 +1319,7 @@ class RoundStartState(BaseState):
             # 현재 라운드의 모든 벽돌 중 하나를 랜덤하게 선택하여 지정
             # self.game.special_brick = random.choice(self.game.round.bricks) # ❌ 이전 코드 (TypeError 발생)
             # 💡 [수정] Group 객체를 리스트로 변환하여 random.choice 사용
-            self.game.special_brick = random.choice(self.game.round.bricks.sprites())
+            self.game.special_brick = self.game.rng.choice(self.game.round.bricks.sprites())
             LOG.info(f"Special Brick assigned: {self.game.special_brick}")
         else:
             self.game.special_brick = None
@@ -1047,6 +1341,9 @@ class RoundStartState(BaseState):
         # Whether we've reset the paddle
         self._paddle_reset = False
 
+        # The round name and "ready" text sprites.
+        self._caption, self._ready = None, None
+
         # Keep track of the number of update cycles.
         self._update_count = 0
 
@@ -1055,32 +1352,35 @@ class RoundStartState(BaseState):
         self.game.sprites.clear()
         self.game.sprites.append(self.game.paddle)
         self.game.sprites.append(self.game.ball)
-        self.game.sprites += self.game.round.edges
-        self.game.sprites += self.game.round.bricks
+        # The side edges and bricks are drawn as part of the round's static
+        # layer. Only the top edge, with its opening doors, is a sprite.
+        self.game.sprites.append(self.game.round.edges.top)
 
     def _configure_ball(self):
-        self.game.ball.remove_all_collidable_sprites()
+        collision_world = self.game.collision_world
+        collision_world.clear()
 
         for edge in self.game.round.edges:
             # Every collision with a wall momentarily increases the speed
             # of the ball.
-            self.game.ball.add_collidable_sprite(
-                edge,
-                speed_adjust=WALL_SPEED_ADJUST)
+            collision_world.add(edge, speed_adjust=WALL_SPEED_ADJUST)
 
-        self.game.ball.add_collidable_sprite(
+        if PADDLE_SMOOTH_BOUNCE:
+            bounce_strategy = self.game.paddle.smooth_bounce_strategy
+        else:
+            bounce_strategy = self.game.paddle.bounce_strategy
+        collision_world.add(
             self.game.paddle,
-            bounce_strategy=self.game.paddle.bounce_strategy,
+            bounce_strategy=bounce_strategy,
             on_collide=self.game.paddle.on_ball_collide)
 
-        for brick in self.game.round.bricks:
-            # Make the ball aware of the bricks it might collide with.
-            # Every brick collision momentarily increases the speed of
-            # the ball.
-            self.game.ball.add_collidable_sprite(
-                brick,
-                speed_adjust=BRICK_SPEED_ADJUST,
-                on_collide=self.game.on_brick_collide)
+        # Make the ball aware of the bricks it might collide with, via the
+        # round's grid so that only the bricks near the ball are checked.
+        # Every brick collision momentarily increases the speed of the ball.
+        collision_world.add_grid(
+            self.game.round.brick_grid,
+            speed_adjust=BRICK_SPEED_ADJUST,
+            on_collide=self.game.on_brick_collide)
 
         # Make any round-specific adjustments to the ball.
         self.game.ball.base_speed += self.game.round.ball_base_speed_adjust
@@ -1095,22 +1395,24 @@ class RoundStartState(BaseState):
         """Handle the sequence of events that happen at the beginning of a
         round just before gameplay starts.
         """
-        caption, ready = None, None
-
-        if self._update_count > 100:
+        if self._update_count > 100 and not self._caption:
             # Display the caption after a short delay.
-            caption = ptext.draw(self.game.round.name,
-                                 (235, self.game.paddle.rect.center[1] - 150),
-                                 fontname=MAIN_FONT,
-                                 fontsize=24,
-                                 color=(255, 255, 255))
-        if self._update_count > 200:
+            self._caption = TextSprite(
+                self.game.round.name,
+                (235, self.game.paddle.rect.center[1] - 150),
+                fontname=MAIN_FONT,
+                fontsize=24,
+                color=(255, 255, 255))
+            self.game.sprites.append(self._caption)
+        if self._update_count > 200 and not self._ready:
             # Display the "Ready" message.
-            ready = ptext.draw('ready',
-                               (250, caption[1][1] + 50),
-                               fontname=MAIN_FONT,
-                               fontsize=24,
-                               color=(255, 255, 255))
+            self._ready = TextSprite('ready',
+                                     (250, self._caption.rect.top + 50),
+                                     fontname=MAIN_FONT,
+                                     fontsize=24,
+                                     color=(255, 255, 255))
+            self.game.sprites.append(self._ready)
+        if self._update_count > 200:
             # Anchor the ball to the paddle.
             self.game.ball.anchor(self.game.paddle,
                                   (self.game.paddle.rect.width // 2,
@@ -1126,11 +1428,12 @@ class RoundStartState(BaseState):
             self.game.paddle.transition(MaterializeState(self.game.paddle))
             # Animate the bricks
             for brick in self.game.round.bricks:
-                brick.animate()
+                self.game.round.animate_brick(brick)
         if self._update_count > 310:
             # Erase the text.
-            self._screen.blit(self.game.round.background, caption[1])
-            self._screen.blit(self.game.round.background, ready[1])
+            for text in (self._caption, self._ready):
+                if text in self.game.sprites:
+                    self.game.sprites.remove(text)
         if self._update_count > 340:
             # Release the anchor.
             self.game.ball.release(BALL_START_ANGLE_RAD)
@@ -1298,7 +1601,8 @@ class RoundEndState(BaseState):
             # Move on to the next round, carrying over a single ball.
             self.game.balls = self.game.balls[:1]
             if self.game.round.next_round is not None:
-                self.game.round = self.game.round.next_round(TOP_OFFSET)
+                self.game.round = self.game.round.next_round(
+                    TOP_OFFSET, rng=self.game.rng)
                 self.game.state = RoundStartState(self.game)
             else:
                 # TODO: special behaviour when user completes whole game.
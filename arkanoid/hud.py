@@ -0,0 +1,81 @@
+import logging
+
+import pygame
+
+from arkanoid.utils import ptext
+from arkanoid.utils.digits import (DIGITS,
+                                   digit_atlas)
+
+LOG = logging.getLogger(__name__)
+
+
+class HudValue:
+    """A value displayed in a fixed slot of the heads up display, such as
+    the score, high score or timer.
+
+    The value is right aligned within its slot. The slot remembers the last
+    value it drew and only re-renders when it is given a different one, so
+    displaying an unchanged value every frame costs nothing. Values made up
+    only of digits are composed from a shared digit atlas rather than
+    rendered as new text.
+    """
+
+    def __init__(self, screen, topright, fontname, fontsize, color,
+                 size=(150, 20), renderer=None):
+        """Initialise a new HudValue.
+
+        Args:
+            screen:
+                The surface the value is displayed on.
+            topright:
+                The screen coordinates of the top right of the slot.
+            fontname:
+                The filename of the font.
+            fontsize:
+                The size of the font.
+            color:
+                The colour of the text, as a tuple.
+            size:
+                The (width, height) of the slot (default 150x20).
+            renderer:
+                Optional Renderer that is told about the regions of the screen
+                that change, so that they get presented.
+        """
+        self._screen = screen
+        self._renderer = renderer
+        self._text_kwargs = dict(fontname=fontname, fontsize=fontsize,
+                                 color=color)
+        self._digits = digit_atlas(fontname, fontsize, color)
+
+        # The slot surface is allocated once and redrawn on each change.
+        self._surf = pygame.Surface(size).convert_alpha()
+        self._rect = self._surf.get_rect(topright=topright)
+
+        # The value last drawn, or None if nothing has been drawn yet.
+        self._value = None
+
+    def display(self, value):
+        """Display a value in the slot, if it differs from the value
+        currently displayed.
+
+        Args:
+            value:
+                The value to display.
+        """
+        if value == self._value:
+            return
+        self._value = value
+
+        text = str(value)
+        self._surf.fill((0, 0, 0))
+        if text and not text.strip(DIGITS):
+            self._digits.draw(text, self._surf, (self._rect.width, 0))
+        else:
+            ptext.draw(text,
+                       topright=(self._rect.width, 0),
+                       surf=self._surf,
+                       **self._text_kwargs)
+        self._screen.blit(self._surf, self._rect)
+
+        if self._renderer:
+            self._renderer.mark_dirty(self._rect)
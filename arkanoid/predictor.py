@@ -0,0 +1,239 @@
+import collections
+import logging
+import math
+
+from arkanoid.collision import (path_rect,
+                                sweep)
+from arkanoid.sprites.ball import (normal_collide_points,
+                                   reflect)
+
+LOG = logging.getLogger(__name__)
+
+# The most bounces followed when predicting the path of a ball. A ball that
+# hasn't reached the paddle line after this many is not predicted.
+MAX_BOUNCES = 32
+
+# How far a ball not heading for the paddle line is traced before giving up
+# on finding something for it to bounce off. Longer than any path across
+# the screen.
+MAX_DISTANCE = 2000  # Pixels
+
+# How far the ball can stray from a predicted path, in pixels, before the
+# path is traced again.
+PATH_TOLERANCE = 1.0
+
+# Impacts whose times differ by less than this are treated as simultaneous,
+# as they are by a swept ball.
+IMPACT_TIME_TOLERANCE = 1e-9
+
+Prediction = collections.namedtuple('Prediction', 'x time path')
+"""Where and when a ball will cross the paddle line.
+
+Attributes:
+    x:
+        The x coordinate of the centre of the ball as it crosses the line.
+    time:
+        The number of updates until the ball crosses the line.
+    path:
+        A tuple of the (x, y) coordinates of the centre of the ball at its
+        current position, at each bounce, and where it crosses the line.
+"""
+
+# A traced path, held until the ball's state changes. The key identifies the
+# state it was traced from, the origin is the top left of the ball at the
+# start, and the velocity is the direction of travel along the first
+# segment. There is one length per segment of the path, and after each
+# segment but the last, the speed adjustments of the sprites struck. Lands
+# is whether the path reaches the line.
+_Path = collections.namedtuple(
+    '_Path', 'key origin velocity points lengths adjusts lands')
+
+
+class TrajectoryPredictor:
+    """Predicts where a ball will cross the paddle line.
+
+    The ball's current direction of travel is traced through the sprites of
+    its CollisionWorld, bouncing off them using the same rules as the ball
+    itself but without the randomness the ball adds to each bounce. Only
+    static colliders are traced: the edges and the live bricks. Sprites that
+    decide their own bounce, such as the paddle, and precise colliders, such
+    as the enemies, are passed through. Bricks that the traced path destroys
+    are passed through after the hit that destroys them.
+
+    A path is traced once and held until a collision changes the ball's
+    angle, a brick leaves the grid, or the ball strays from the path, so
+    repeated predictions while the ball is travelling along its first
+    segment only work out how far it has come. The time to the line assumes
+    the speed changes only by the speed adjustments of the sprites struck,
+    not by the gradual return to base speed.
+    """
+
+    def __init__(self, ball, line):
+        """Initialise a new TrajectoryPredictor.
+
+        Args:
+            ball:
+                The Ball to predict the path of.
+            line:
+                The y coordinate of the paddle line: the top of the paddle.
+                The ball crosses it when its bottom reaches it.
+        """
+        self.ball = ball
+        self.line = line
+
+        # The last traced path, or None if there isn't one.
+        self._path = None
+        # The ball state and Prediction last returned by predict().
+        self._last = None
+
+    def predict(self):
+        """Predict where and when the ball will cross the paddle line.
+
+        Returns:
+            A Prediction, or None if the ball is stopped, is already beyond
+            the line, or doesn't reach it within MAX_BOUNCES bounces.
+        """
+        ball = self.ball
+        if ball.speed <= 0:
+            # A stopped ball, such as at the end of a round, never arrives.
+            return None
+        x, y = ball.position
+        state = x, y, ball.speed, ball.angle, self.line
+        if self._last is not None and self._last[0] == state:
+            return self._last[1]
+
+        key = ball.angle, self.line, tuple(
+            len(grid) for grid, _ in ball.collision_world.grids())
+        path = self._path
+        travelled = None
+        if path is not None and path.key == key:
+            travelled = self._travelled(path, x, y)
+        if travelled is None:
+            path = self._trace(key, x, y)
+            self._path, travelled = path, 0.0
+
+        prediction = None
+        if path.lands:
+            prediction = self._prediction(path, travelled, x, y)
+        self._last = state, prediction
+        return prediction
+
+    def _travelled(self, path, x, y):
+        """How far the ball has travelled along the first segment of a path.
+
+        Returns:
+            The distance, or None if the ball is not on the first segment.
+        """
+        vx, vy = path.velocity
+        offset_x, offset_y = x - path.origin[0], y - path.origin[1]
+        along = offset_x * vx + offset_y * vy
+        across = abs(offset_x * vy - offset_y * vx)
+        if (across > PATH_TOLERANCE or
+                not -PATH_TOLERANCE <= along <=
+                path.lengths[0] + PATH_TOLERANCE):
+            return None
+        return max(along, 0.0)
+
+    def _prediction(self, path, travelled, x, y):
+        """Make a Prediction from a path the ball has travelled some way
+        along.
+        """
+        ball = self.ball
+        speed, time = ball.speed, 0.0
+        lengths = (path.lengths[0] - travelled,) + path.lengths[1:]
+        for segment, length in enumerate(lengths):
+            time += max(length, 0.0) / speed
+            if segment < len(path.adjusts):
+                # The speed changes as the ball bounces, as it does in
+                # Ball._handle_collision().
+                for speed_adjust in path.adjusts[segment]:
+                    if speed < ball.top_speed:
+                        speed += speed_adjust
+
+        width, height = ball.rect.size
+        points = ((x + width / 2, y + height / 2),) + path.points[1:]
+        return Prediction(points[-1][0], time, points)
+
+    def _trace(self, key, x, y):
+        """Trace the ball's path from its current position to the line.
+
+        Returns:
+            A _Path, which might not reach the line.
+        """
+        ball = self.ball
+        world = ball.collision_world
+        width, height = ball.rect.size
+        angle = ball.angle
+
+        static = [sprite for sprite, collision_data in world.sprites() if
+                  not collision_data[0] and not world.is_precise(sprite)]
+        # Sprites struck along the path, and how often.
+        hits = collections.Counter()
+
+        origin = x, y
+        velocity = math.cos(angle), math.sin(angle)
+        points = [(x + width / 2, y + height / 2)]
+        lengths, adjusts = [], []
+
+        for _ in range(MAX_BOUNCES + 1):
+            vx, vy = math.cos(angle), math.sin(angle)
+            if y + height > self.line:
+                # The ball is already beyond the line.
+                break
+            distance = (self.line - (y + height)) / vy if vy > 0 else \
+                MAX_DISTANCE
+            dx, dy = vx * distance, vy * distance
+
+            box = x, y, width, height
+            time, struck, normal = 1.0, [], (0, 0)
+            for sprite in self._colliders(static, hits, box, dx, dy):
+                impact = sweep(box, dx, dy, sprite.rect)
+                if impact is None:
+                    continue
+                if impact[0] < time - IMPACT_TIME_TOLERANCE:
+                    time, struck, normal = impact[0], [], (0, 0)
+                if impact[0] <= time + IMPACT_TIME_TOLERANCE:
+                    struck.append(sprite)
+                    normal = (normal[0] or impact[1][0],
+                              normal[1] or impact[1][1])
+
+            x, y = x + dx * time, y + dy * time
+            points.append((x + width / 2, y + height / 2))
+            lengths.append(distance * time)
+
+            if not struck:
+                # Either the line is reached, or the ball is heading away
+                # from it with nothing to bounce off.
+                return _Path(key, origin, velocity, tuple(points),
+                             tuple(lengths), tuple(adjusts), vy > 0)
+
+            hits.update(struck)
+            adjusts.append(tuple(world.collision_data(sprite)[1]
+                                 for sprite in struck))
+            angle = round(reflect(angle, *normal_collide_points(normal)), 2)
+
+        else:
+            LOG.debug('Ball does not reach the line within %s bounces',
+                      MAX_BOUNCES)
+        return _Path(key, origin, velocity, tuple(points), tuple(lengths) or
+                     (0.0,), tuple(adjusts), False)
+
+    def _colliders(self, static, hits, box, dx, dy):
+        """Get the live static colliders that might lie across a movement
+        of the ball.
+        """
+        path = path_rect(box, dx, dy).inflate(2, 2)
+
+        sprites = list(static)
+        for grid, _ in self.ball.collision_world.grids():
+            sprites.extend(grid.query(path))
+        return [sprite for sprite in sprites if
+                sprite.visible and self._survives(sprite, hits[sprite])]
+
+    @staticmethod
+    def _survives(sprite, hits):
+        """Whether a sprite is still there after being struck a number of
+        times along the traced path.
+        """
+        hits_remaining = getattr(sprite, 'hits_remaining', None)
+        return hits_remaining is None or hits < hits_remaining
@@ -1,6 +1,9 @@
 import collections
+import random
+
 import pygame
 
+from arkanoid.collision import SpatialGrid
 from arkanoid.sprites.edge import (TopEdge,
                                    SideEdge)
 from arkanoid.sprites.brick import BrickColour
@@ -23,7 +26,7 @@ class BaseRound:
       `_create_bricks()`, `_get_background_colour()` 등을 구체적으로 구현.
     - 경계(Edge), 벽돌 배치, 클리어 조건, 다음 라운드 연결 등의 기본 로직을 공통 제공.
     """
-    def __init__(self, top_offset):
+    def __init__(self, top_offset, rng=None):
         """
            라운드 기본 설정 초기화.
 
@@ -31,12 +34,22 @@ class BaseRound:
             top_offset (int):
                 화면 상단에서 '게임 영역'이 얼마나 아래에서 시작할지를 픽셀 단위로 지정.
                 (예: 점수판, 타이머 등을 위한 여백)
+            rng:
+                Optional random.Random used for the round's random choices,
+                such as which bricks hold powerups. The random module is used
+                if not supplied.
         """
         # ───────────────────────────────────────────────
         # 게임 영역 배치 관련 설정
         self.top_offset = top_offset
         self.screen = pygame.display.get_surface() # pygame의 전체 디스플레이 Surface (렌더링 대상)
         # ───────────────────────────────────────────────
+
+        # ───────────────────────────────────────────────
+        # The source of the round's random choices, shared with the game so
+        # that a game can be replayed from its seed.
+        self.rng = rng or random
+        # ───────────────────────────────────────────────
         
         # ───────────────────────────────────────────────
         # 라운드 이름 (화면 시작 시 표시)
@@ -64,8 +77,35 @@ class BaseRound:
         # 각 라운드별 `_create_bricks()` 가 실제 구현해야 함.
         # (벽돌 그룹을 만들어 위치를 계산하고 배치)
         self.bricks = self._create_bricks()
+
+        # The number of bricks that must be destroyed to complete the round,
+        # counted once here since gold bricks can't be destroyed.
+        self._bricks_to_destroy = sum(1 for brick in self.bricks
+                                      if brick.colour != BrickColour.gold)
         # ───────────────────────────────────────────────
-        
+
+        # ───────────────────────────────────────────────
+        # Static layer: the background, side edges and intact bricks
+        # composited onto one surface, built on first use. Bricks are lifted
+        # out of the layer whilst they animate and drawn as sprites instead.
+        self._static_layer = None
+        self.animating_bricks = []
+        # ───────────────────────────────────────────────
+
+        # ───────────────────────────────────────────────
+        # Spatial index of the intact bricks by grid cell, built on first
+        # use, so that collision checks only look at nearby bricks.
+        self._brick_grid = None
+        # ───────────────────────────────────────────────
+
+        # ───────────────────────────────────────────────
+        # Intact bricks by grid column, each column ordered from the top
+        # down, built on first use so that a laser bullet only looks at the
+        # lowest brick above it.
+        self._brick_columns = None
+        self._brick_column_width = 1
+        # ───────────────────────────────────────────────
+
         # ───────────────────────────────────────────────
         # 난이도·속도 튜닝용 파라미터
         # 각 라운드에서 이 값을 오버라이드해 조정 가능.
@@ -105,17 +145,191 @@ class BaseRound:
             True if the round has been completed. False otherwise.
             #bool: True면 라운드 클리어.
         """
-        # gold 벽돌은 카운트에서 제외한 총 벽돌 수
-        return self._bricks_destroyed >= len([brick for brick in self.bricks
-                                              if brick.colour !=
-                                              BrickColour.gold])
+        return self.bricks_remaining == 0
+
+    @property
+    def bricks_remaining(self):
+        """The number of bricks still to be destroyed to complete the round.
+
+        Gold bricks are not included.
+
+        Returns:
+            The number of bricks remaining.
+        """
+        return max(self._bricks_to_destroy - self._bricks_destroyed, 0)
+
+    @property
+    def percent_cleared(self):
+        """How much of the round has been cleared, as a percentage of the
+        bricks that can be destroyed.
+
+        Returns:
+            The percentage cleared, from 0 to 100.
+        """
+        if not self._bricks_to_destroy:
+            return 100.0
+        return 100 * (self._bricks_to_destroy -
+                      self.bricks_remaining) / self._bricks_to_destroy
 
     # 벽돌이 부서질 때 게임 쪽(예: Brick 스프라이트)에서 호출해주는 훅
-    def brick_destroyed(self):
-        """Conveys to the round that a brick has been destroyed in the game."""
+    def brick_destroyed(self, brick=None):
+        """Conveys to the round that a brick has been destroyed in the game.
+
+        Args:
+            brick:
+                Optional Brick instance that was destroyed. When supplied, the
+                brick is erased from the static layer.
+        """
         # 벽돌 1개가 파괴되었음을 라운드에 알림
         self._bricks_destroyed += 1
 
+        if brick is not None:
+            if self._brick_grid is not None:
+                self._brick_grid.remove(brick)
+            if self._brick_columns is not None:
+                for column in self._columns_for(brick.rect.left,
+                                                brick.rect.right):
+                    if brick in self._brick_columns.get(column, ()):
+                        self._brick_columns[column].remove(brick)
+            if brick in self.animating_bricks:
+                self.animating_bricks.remove(brick)
+            self._erase_from_static_layer(brick.rect)
+
+    # ──────────────────────────────────────────────────────────────────────
+    # Brick grid
+    #  - The game area split into brick sized cells, as laid out by
+    #    _blit_brick(). Destroyed bricks are removed from the grid.
+    # ──────────────────────────────────────────────────────────────────────
+    @property
+    def brick_grid(self):
+        """A SpatialGrid of the intact bricks, with one cell per brick
+        position in the game area.
+
+        The grid is built on first access and bricks are removed from it
+        as they are destroyed.
+
+        Returns:
+            The SpatialGrid of bricks.
+        """
+        if self._brick_grid is None:
+            bricks = [brick for brick in self.bricks if brick.visible]
+            cell_size = bricks[0].rect.size if bricks else (1, 1)
+            self._brick_grid = SpatialGrid(
+                cell_size, origin=(self.edges.left.rect.right,
+                                   self.edges.top.rect.bottom))
+            for brick in bricks:
+                self._brick_grid.add(brick)
+        return self._brick_grid
+
+    def lowest_brick(self, left, right):
+        """Get the lowest intact brick between two x coordinates.
+
+        This is the first brick that something travelling straight up
+        between the coordinates would hit. The bricks are indexed by column
+        on first use, and bricks are removed from the index as they are
+        destroyed.
+
+        Args:
+            left:
+                The left x coordinate.
+            right:
+                The right x coordinate, exclusive.
+
+        Returns:
+            The lowest brick, or None if there are no bricks between the
+            coordinates.
+        """
+        if self._brick_columns is None:
+            self._index_brick_columns()
+
+        lowest = None
+        for column in self._columns_for(left, right):
+            bricks = self._brick_columns.get(column)
+            if bricks and (lowest is None or
+                           bricks[-1].rect.bottom > lowest.rect.bottom):
+                lowest = bricks[-1]
+        return lowest
+
+    def _index_brick_columns(self):
+        bricks = sorted((brick for brick in self.bricks if brick.visible),
+                        key=lambda brick: brick.rect.bottom)
+        if bricks:
+            self._brick_column_width = bricks[0].rect.width
+        self._brick_columns = collections.defaultdict(list)
+        for brick in bricks:
+            for column in self._columns_for(brick.rect.left,
+                                            brick.rect.right):
+                self._brick_columns[column].append(brick)
+
+    def _columns_for(self, left, right):
+        origin = self.edges.left.rect.right
+        width = self._brick_column_width
+        return range((left - origin) // width,
+                     (max(right, left + 1) - 1 - origin) // width + 1)
+
+    # ──────────────────────────────────────────────────────────────────────
+    # Static layer
+    #  - Built once from the background, side edges and intact bricks, then
+    #    patched only when a brick is destroyed or starts/stops animating.
+    # ──────────────────────────────────────────────────────────────────────
+    @property
+    def static_layer(self):
+        """The surface holding the background, side edges and all intact
+        bricks that are not currently animating.
+
+        The layer is the same size as the background and is positioned at
+        the top offset. It is built on first access and patched in place
+        from then on.
+
+        Returns:
+            The static layer surface.
+        """
+        if self._static_layer is None:
+            self._static_layer = self.background.copy()
+            for edge in (self.edges.left, self.edges.right):
+                self._draw_onto_static_layer(edge)
+            for brick in self.bricks:
+                if brick.visible and brick not in self.animating_bricks:
+                    self._draw_onto_static_layer(brick)
+        return self._static_layer
+
+    def animate_brick(self, brick):
+        """Trigger animation of a brick.
+
+        The brick is lifted out of the static layer for the duration of the
+        animation, and can be found in the animating_bricks list so that it
+        can be drawn as a sprite.
+
+        Args:
+            brick:
+                The Brick instance to animate.
+        """
+        brick.animate()
+        if brick not in self.animating_bricks:
+            self.animating_bricks.append(brick)
+            self._erase_from_static_layer(brick.rect)
+
+    def update(self):
+        """Advance the animation of any animating bricks, returning those
+        that have finished to the static layer.
+        """
+        for brick in list(self.animating_bricks):
+            brick.update()
+            if not brick.animating:
+                self.animating_bricks.remove(brick)
+                if brick.visible:
+                    self._draw_onto_static_layer(brick)
+
+    def _draw_onto_static_layer(self, sprite):
+        if self._static_layer is not None:
+            self._static_layer.blit(sprite.image,
+                                    sprite.rect.move(0, -self.top_offset))
+
+    def _erase_from_static_layer(self, rect):
+        if self._static_layer is not None:
+            rect = rect.move(0, -self.top_offset)
+            self._static_layer.blit(self.background, rect, rect)
+
     # ─ 현재 라운드에서 적을 언제 풀어줄지(타이밍/조건)는 라운드별로 다름
     #   → 하위 클래스에서 구현
     def can_release_enemies(self):
@@ -230,7 +444,7 @@ class BaseRound:
         edges = collections.namedtuple('edge', 'left right top')
         left_edge = SideEdge('left')
         right_edge = SideEdge('right')
-        top_edge = TopEdge()
+        top_edge = TopEdge(rng=self.rng)
         
         # Edge의 실제 화면 위치 지정(상단 여백 포함)
         left_edge.rect.topleft = 0, self.top_offset
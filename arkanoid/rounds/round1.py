@@ -1,4 +1,3 @@
-import random
 import pygame
 
 from arkanoid.rounds.base import (BaseRound,
@@ -22,13 +21,17 @@ class Round1(BaseRound):
     - BaseRound가 정의한 배경/벽/브릭 기본 구조 위에 라운드1만의 정보만 추가한다.
     """
 
-    def __init__(self, top_offset):
+    def __init__(self, top_offset, rng=None):
         """round 1 초기화 함수.
 
         Args:
             top_offset(int):
                 화면 맨 위에서부터 라운드(벽돌/벽/배경)를 얼마나 아래로 내려서 표시할지 결정하는 값.
                 상단 HUD(점수, 하이스코어, 타이머 같은 UI)를 위해 일정 공간을 비워놓기 위한 offset.
+            rng:
+                Optional random.Random used for the round's random choices,
+                such as which bricks hold powerups. The random module is used
+                if not supplied.
         """
         # BaseRound 초기화 실행
         # BaseRound에서:
@@ -36,7 +39,7 @@ class Round1(BaseRound):
         # - 기본 배경 Surface 생성
         # - 벽돌(Bricks) 배열 로딩
         # - 충돌 처리 기본 틀 설정
-        super().__init__(top_offset)
+        super().__init__(top_offset, rng)
 
          # HUD 등에 표시될 라운드 이름
         self.name = 'Round 1'
@@ -80,14 +83,14 @@ class Round1(BaseRound):
         powerup_classes.extend([SpeedPowerUp] * 6)      # 공 빨리지기
         powerup_classes.extend([DuplicatePowerUp] * 2)  # 공 복제
         # 파워업 드랍 테이블을 랜덤으로 섞기
-        random.shuffle(powerup_classes)
+        self.rng.shuffle(powerup_classes)
 
         # 벽돌 전체 65개 0~64
         # 어떤 벽돌이 파워업을 가질지 인덱스 선택
         # 0~51(52개) 중에서 (전체 파워업 수 - 4)개를 먼저 선택
-        powerup_indexes = random.sample(range(52), len(powerup_classes) - 4)
+        powerup_indexes = self.rng.sample(range(52), len(powerup_classes) - 4)
         # 마지막 줄(52~64)에서 4개는 반드시 파워업 포함
-        powerup_indexes += random.sample(range(52, 65), 4)
+        powerup_indexes += self.rng.sample(range(52, 65), 4)
         #정렬하여 brick 생성 순서와 일치시키기
         powerup_indexes.sort()
 
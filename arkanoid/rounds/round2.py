@@ -1,5 +1,4 @@
 import itertools
-import random
 
 import pygame
 
@@ -22,15 +21,18 @@ class Round2(BaseRound):
 
     _BRICK_START_ROW = 16
 
-    def __init__(self, top_offset):
+    def __init__(self, top_offset, rng=None):
         """Initialise round 2.
 
         Args:
             top_offset:
                 The number of pixels from the top of the screen before the
                 top edge can be displayed.
+            rng:
+                Optional random.Random used for the round's random choices.
+                The random module is used if not supplied.
         """
-        super().__init__(top_offset)
+        super().__init__(top_offset, rng)
 
         self.name = 'Round 2'
         self.next_round = Round3
@@ -61,10 +63,10 @@ class Round2(BaseRound):
 
         # Create a dict structure with the brick index as the key, and
         # powerup class as the value.
-        first_row_powerup_indexes = dict(zip(random.sample(range(13),
+        first_row_powerup_indexes = dict(zip(self.rng.sample(range(13),
                                              len(first_row_powerups)),
                                              first_row_powerups))
-        remaining_powerup_indexes = dict(zip(random.sample(range(91),
+        remaining_powerup_indexes = dict(zip(self.rng.sample(range(91),
                                              len(remaining_powerups)),
                                              remaining_powerups))
 
@@ -99,7 +101,7 @@ class Round2(BaseRound):
         first_row_powerups = []
         first_row_powerups.extend([SlowBallPowerUp] * 2)
         first_row_powerups.extend([CatchPowerUp] * 2)
-        random.shuffle(first_row_powerups)
+        self.rng.shuffle(first_row_powerups)
         return first_row_powerups
 
     def _create_remaining_powerups(self):
@@ -111,5 +113,5 @@ class Round2(BaseRound):
         remaining_powerups.extend([ExpandPowerUp] * 4)
         remaining_powerups.extend([SlowBallPowerUp] * 2)
         remaining_powerups.extend([DuplicatePowerUp] * 2)
-        random.shuffle(remaining_powerups)
+        self.rng.shuffle(remaining_powerups)
         return remaining_powerups
@@ -17,15 +17,18 @@ class Round5(BaseRound):
 
     _TOP_ROW_START = 5
 
-    def __init__(self, top_offset):
+    def __init__(self, top_offset, rng=None):
         """Initialise round 5.
 
         Args:
             top_offset:
                 The number of pixels from the top of the screen before the
                 top edge can be displayed.
+            rng:
+                Optional random.Random used for the round's random choices.
+                The random module is used if not supplied.
         """
-        super().__init__(top_offset)
+        super().__init__(top_offset, rng)
 
         self.name = 'Round 5'
         self.enemy_type = EnemyType.cone
@@ -4,7 +4,14 @@ import random
 
 import pygame
 
-from arkanoid.utils.util import load_png
+from arkanoid.collision import (box_overlaps,
+                                CollisionWorld,
+                                masks_overlap,
+                                path_rect,
+                                sweep)
+from arkanoid.sprites.motion import FloatPosition
+from arkanoid.utils.util import (assets,
+                                 load_png)
 
 LOG = logging.getLogger(__name__)
 
@@ -15,13 +22,22 @@ HALF_PI = math.pi / 2
 # to apply to the angle of bounce for top/bottom/side collisions of the ball.
 RANDOM_RANGE = 0.1  # Radians
 
+# The most collisions a ball using swept collision will resolve in a single
+# update. Any movement left after this many is carried out without checking.
+MAX_IMPACTS_PER_UPDATE = 4
+
+# Impacts whose times differ by less than this are treated as simultaneous.
+IMPACT_TIME_TOLERANCE = 1e-9
+
 
 class Ball(pygame.sprite.Sprite):
     """The ball that bounces around the screen.
 
     A Ball is aware of the screen, and any sprites on the screen
-    that have been added via add_collidable_sprite(). Note that the game
-    edges are considered to be collidable sprites.
+    that have been added via add_collidable_sprite() or, for large numbers
+    of sprites such as the bricks, add_collidable_grid(). Note that the game
+    edges are considered to be collidable sprites. The collidable sprites
+    are held in a CollisionWorld, which may be shared by several balls.
 
     The ball will begin its journey using the position and angle specified
     when the ball is initialised. As the ball collides with sprites, its
@@ -38,7 +54,8 @@ class Ball(pygame.sprite.Sprite):
 
     def __init__(self, start_pos, start_angle, base_speed, top_speed=15,
                  normalisation_rate=0.02,
-                 off_screen_callback=None):
+                 off_screen_callback=None, swept=False,
+                 collision_world=None, rng=None):
         """
         Initialise a new Ball with the given arguments.
 
@@ -68,34 +85,92 @@ class Ball(pygame.sprite.Sprite):
                 A callable that will be called if the ball goes off the edge
                 of the screen. It takes a single argument: the ball sprite
                 instance.
+            swept:
+                Whether to use swept collision (default False). A swept ball
+                is checked for collision along the whole of its path each
+                update, rather than only at its new position, so that at high
+                speed it can't pass through thin sprites or brick corners.
+                Several collisions can be resolved in a single update.
+            collision_world:
+                Optional CollisionWorld holding the sprites the ball can
+                collide with. Balls sharing a world all see the same sprites.
+                If not supplied, the ball gets a world of its own.
+            rng:
+                Optional random.Random used to vary the angle of bounce. The
+                random module is used if not supplied.
         """
         super().__init__()
         self.image, self.rect = load_png('ball')
         self.rect.x, self.rect.y = start_pos
+        # The exact position of the ball, from which its rect is derived.
+        self._pos = FloatPosition()
         self.visible = True
         self.speed = base_speed
         self.base_speed = base_speed
         self.normalisation_rate = normalisation_rate
+        # The direction of travel as a (vx, vy) unit vector, worked out from
+        # the angle when first needed after the angle changes.
+        self._velocity = None
         self.angle = start_angle
+        self.swept = swept
 
         self._start_pos = start_pos
         self._start_angle = start_angle
         self._top_speed = top_speed
         self._off_screen_callback = off_screen_callback
         self._anchor = None
+        self._rng = rng or random
 
         # The area within which the ball is in play.
         screen = pygame.display.get_surface()
         self._area = screen.get_rect()
 
-        # The sprites the ball can collide with.
-        self._collidable_sprites = pygame.sprite.Group()
+        # The sprites the ball can collide with, and the actions associated
+        # with each of them.
+        if collision_world is None:
+            collision_world = CollisionWorld()
+        self.collision_world = collision_world
+
+    @property
+    def angle(self):
+        """The angle of travel of the ball in radians, measured clockwise
+        from the righthand x-axis.
+        """
+        return self._angle
+
+    @angle.setter
+    def angle(self, angle):
+        self._angle = angle
+        self._velocity = None
+
+    @property
+    def position(self):
+        """The exact (x, y) position of the top left of the ball, as floats.
+        The ball's rect is this position rounded to the nearest pixel.
+        """
+        return self._pos.resolve(self.rect)
+
+    @property
+    def top_speed(self):
+        """The speed that collisions can't increase the ball's speed beyond.
+        """
+        return self._top_speed
 
-        # The actions associated with the collidable sprites.
-        # This dictionary is keyed by the collidable sprite. The value is
-        # a 3-element tuple corresponding to the bounce strategy, speed
-        # adjustment and collision callback for that sprite.
-        self._collision_data = {}
+    @property
+    def mask(self):
+        """The collision mask of the ball's image, shared by every ball."""
+        return assets.mask(self.image)
+
+    @property
+    def velocity(self):
+        """The direction of travel of the ball as a (vx, vy) unit vector.
+
+        The angle only changes when the ball bounces or is released or reset,
+        so the direction is cached rather than worked out on every update.
+        """
+        if self._velocity is None:
+            self._velocity = math.cos(self._angle), math.sin(self._angle)
+        return self._velocity
 
     def add_collidable_sprite(self, sprite, bounce_strategy=None,
                               speed_adjust=0.0, on_collide=None):
@@ -130,9 +205,34 @@ class Ball(pygame.sprite.Sprite):
                 It takes 2 arguments: the sprite the ball struck and the ball
                 that struck it.
         """
-        self._collidable_sprites.add(sprite)
-        self._collision_data[sprite] = (
-            bounce_strategy, speed_adjust, on_collide)
+        self.collision_world.add(sprite, bounce_strategy, speed_adjust,
+                                 on_collide)
+
+    def add_collidable_grid(self, grid, bounce_strategy=None,
+                            speed_adjust=0.0, on_collide=None):
+        """Add a SpatialGrid of sprites that the ball might collide with.
+
+        This behaves as though each sprite in the grid had been added with
+        add_collidable_sprite() using the same arguments, except that the
+        ball only checks the sprites in the grid cells it overlaps. Sprites
+        removed from the grid can no longer be struck.
+
+        Args:
+            grid:
+                The SpatialGrid of collidable sprites.
+            bounce_strategy:
+                Optional callable that determines how the ball should bounce
+                when it collides with a sprite in the grid.
+            speed_adjust:
+                Optional numeric value that will be used to speed up or slow
+                down the the ball.
+            on_collide:
+                Optional callable that will be called when a collision occurs.
+                It takes 2 arguments: the sprite the ball struck and the ball
+                that struck it.
+        """
+        self.collision_world.add_grid(grid, bounce_strategy, speed_adjust,
+                                      on_collide)
 
     def remove_collidable_sprite(self, sprite):
         """Remove a sprite so that the ball can no longer collide with it.
@@ -144,23 +244,20 @@ class Ball(pygame.sprite.Sprite):
             sprite:
                 The collidable sprite to remove.
         """
-        self._collidable_sprites.remove(sprite)
-        try:
-            del self._collision_data[sprite]
-        except KeyError:
-            pass
+        self.collision_world.remove(sprite)
 
     def remove_all_collidable_sprites(self):
         """Remove all collidable sprites from the ball."""
-        self._collidable_sprites.empty()
-        self._collision_data.clear()
+        self.collision_world.clear()
 
     def clone(self, **kwargs):
         """Clone the ball creating a new ball with the same collidable
         sprites as the instance being cloned.
 
-        Because the collidable sprites are shared amongst the ball clones,
-        when one ball hits a sprite the other balls know about it.
+        The clone shares the CollisionWorld of the ball being cloned rather
+        than copying it, so sprites added to or removed from one ball are
+        added to or removed from the other, and cloning takes the same time
+        however many sprites there are.
 
         This method accepts an optional list of keyword arguments. These, if
         supplied, will override the values of the ball being cloned.
@@ -180,16 +277,13 @@ class Ball(pygame.sprite.Sprite):
         off_screen_callback = kwargs.get('off_screen_callback',
                                          self._off_screen_callback)
 
-        ball = Ball(start_pos, start_angle, base_speed, top_speed,
-                    normalisation_rate, off_screen_callback)
-
-        for sprite in self._collidable_sprites:
-            bounce_strategy, speed_adjust, on_collide = self._collision_data[
-                sprite]
-            ball.add_collidable_sprite(sprite, bounce_strategy, speed_adjust,
-                                       on_collide)
+        swept = kwargs.get('swept', self.swept)
+        collision_world = kwargs.get('collision_world', self.collision_world)
+        rng = kwargs.get('rng', self._rng)
 
-        return ball
+        return Ball(start_pos, start_angle, base_speed, top_speed,
+                    normalisation_rate, off_screen_callback, swept,
+                    collision_world, rng)
 
     def update(self):
         """Update the ball's position.
@@ -197,6 +291,15 @@ class Ball(pygame.sprite.Sprite):
         Check whether the ball has collided with anything and if so, update
         its angle and speed and invoke any associated actions.
         """
+        if self.swept and not self._anchor:
+            # Move the ball along its path, resolving collisions as it goes.
+            self._move_swept()
+            if not self._area.contains(self.rect):
+                # Ball has gone off the screen.
+                if self._off_screen_callback:
+                    self._off_screen_callback(self)
+            return
+
         # Get the new position of the ball.
         self.rect = self._calc_new_pos()
 
@@ -204,9 +307,10 @@ class Ball(pygame.sprite.Sprite):
             if not self._anchor:
                 # The ball is still on the screen and is not anchored, so see
                 # if it has collided with anything.
-                sprites_collided = pygame.sprite.spritecollide(
-                    self,
-                    (s for s in self._collidable_sprites if s.visible), False)
+                sprites_collided = [
+                    sprite for sprite in pygame.sprite.spritecollide(
+                        self, self._nearby_sprites(), False)
+                    if self._touching(sprite)]
 
                 if sprites_collided:
                     # Handle the collision.
@@ -220,6 +324,103 @@ class Ball(pygame.sprite.Sprite):
             if self._off_screen_callback:
                 self._off_screen_callback(self)
 
+    def _move_swept(self):
+        """Move the ball by its speed and angle, stopping at the first
+        sprite in its path to bounce off it, then carrying on with the rest
+        of the movement at the new angle.
+
+        Precise colliders can't be swept, as it is their masks rather than
+        their rects that the ball must touch. They are checked at the ball's
+        position once it has moved.
+        """
+        x, y = self._pos.resolve(self.rect)
+        width, height = self.rect.size
+        remaining, impacts, collided = 1.0, 0, False
+
+        while remaining > 0:
+            vx, vy = self.velocity
+            dx = self.speed * vx * remaining
+            dy = self.speed * vy * remaining
+            box = x, y, width, height
+            # Look for sprites along the exact path of the ball, rather than
+            # that of its rounded rect, which can fall short of it.
+            path = path_rect(box, dx, dy).inflate(2, 2)
+            sprites = [s for s in self._nearby_sprites(path) if
+                       not self.collision_world.is_precise(s)]
+
+            overlapping = [s for s in sprites if box_overlaps(box, s.rect)]
+            if overlapping and not impacts:
+                # Something moved onto the ball, so there is no time of
+                # impact. Treat it as a collision at the ball's position.
+                self._handle_collision(overlapping)
+                collided = True
+                sprites = []
+
+            time, struck, normal = 1.0, [], (0, 0)
+            if impacts < MAX_IMPACTS_PER_UPDATE:
+                for sprite in sprites:
+                    impact = sweep(box, dx, dy, sprite.rect)
+                    if impact is None:
+                        continue
+                    if impact[0] < time - IMPACT_TIME_TOLERANCE:
+                        time, struck, normal = impact[0], [], (0, 0)
+                    if impact[0] <= time + IMPACT_TIME_TOLERANCE:
+                        struck.append(sprite)
+                        normal = (normal[0] or impact[1][0],
+                                  normal[1] or impact[1][1])
+
+            x, y = x + dx * time, y + dy * time
+            self._pos.place(self.rect, x, y)
+
+            if not struck:
+                break
+
+            self._handle_collision(struck, normal)
+            collided = True
+            remaining *= 1 - time
+            impacts += 1
+
+        if not collided:
+            # The ball must not come to rest inside a sprite, so one that it
+            # ends up overlapping is struck, even with no time of impact.
+            box = x, y, width, height
+            overlapping = [s for s in self._nearby_sprites(path_rect(box)) if
+                           not self.collision_world.is_precise(s) and
+                           box_overlaps(box, s.rect)]
+            if overlapping:
+                self._handle_collision(overlapping)
+                collided = True
+
+        struck = [s for s in self._nearby_sprites() if
+                  self.collision_world.is_precise(s) and
+                  self.rect.colliderect(s.rect) and masks_overlap(self, s)]
+        if struck:
+            self._handle_collision(struck)
+        elif not collided:
+            # No collision. Bring speed back to base.
+            self._normalise_speed()
+
+    def _touching(self, sprite):
+        """Whether the ball, whose rect overlaps the sprite's, is touching
+        it. For a precise collider, their masks must overlap too.
+        """
+        return (not self.collision_world.is_precise(sprite) or
+                masks_overlap(self, sprite))
+
+    def _nearby_sprites(self, rect=None):
+        """Get the visible collidable sprites that the ball might be
+        touching: all of those added individually, plus those from the cells
+        of each grid that the rect overlaps.
+
+        Args:
+            rect:
+                Optional Rect to look for sprites near. The ball's rect is
+                used if not supplied.
+        """
+        if rect is None:
+            rect = self.rect
+        return self.collision_world.nearby(rect)
+
     def _calc_new_pos(self):
         if self._anchor:
             pos, rel_pos = self._anchor
@@ -237,25 +438,34 @@ class Ball(pygame.sprite.Sprite):
             # Use the centre of the sprite.
             return rect.center
         else:
-            # Move the ball normally based on angle and speed.
-            offset_x = self.speed * math.cos(self.angle)
-            offset_y = self.speed * math.sin(self.angle)
+            # Move the ball normally based on its direction and speed.
+            vx, vy = self.velocity
+            return self._pos.move(self.rect, self.speed * vx, self.speed * vy)
 
-            return self.rect.move(offset_x, offset_y)
+    def _handle_collision(self, sprites, normal=None):
+        """Handle a collision with one or more sprites.
 
-    def _handle_collision(self, sprites):
+        Args:
+            sprites:
+                The sprites the ball collided with.
+            normal:
+                The normal of the surface struck, when known from a swept
+                collision. The ball will be touching the sprites rather than
+                overlapping them.
+        """
         rects, bounce_strategy = [], None
 
         for sprite in sprites:
             rects.append(sprite.rect)
+            collision_data = self.collision_world.collision_data(sprite)
             if not bounce_strategy:
-                bounce_strategy = self._collision_data[sprite][0]
+                bounce_strategy = collision_data[0]
 
             if self.speed < self._top_speed:
                 # Adjust the speed based on what we collided with.
-                self.speed += self._collision_data[sprite][1]
+                self.speed += collision_data[1]
 
-            on_collide = self._collision_data[sprite][2]
+            on_collide = collision_data[2]
             if on_collide:
                 # Invoke a collision action if we have one.
                 on_collide(sprite, self)
@@ -263,11 +473,23 @@ class Ball(pygame.sprite.Sprite):
         if len(rects) == 1:
             # Collision with a single object.
             if bounce_strategy:
-                # We have a bounce strategy, so use that.
-                self.angle = bounce_strategy(rects[0], self.rect)
+                # We have a bounce strategy, so use that. A swept ball is
+                # only touching the object, so pass the strategy the rect the
+                # ball would occupy one pixel further on.
+                ball_rect = self.rect
+                if normal:
+                    ball_rect = ball_rect.move(-normal[0], -normal[1])
+                self.angle = bounce_strategy(rects[0], ball_rect)
+            elif normal:
+                self.angle = self._calc_bounce_angle(
+                    *normal_collide_points(normal))
             else:
                 # Use the default calculation for the angle.
                 self.angle = self._calc_new_angle(rects)
+        elif normal:
+            # Collision with more than one object at the same moment.
+            self.angle = self._calc_bounce_angle(
+                *normal_collide_points(normal))
         else:
             # Collision with more than one object.
             # Use the default calculation for the angle.
@@ -286,66 +508,23 @@ class Ball(pygame.sprite.Sprite):
         """Calculate the default angle of bounce of the ball, given a
         sequence of rectangles that the ball collided with.
         """
-        tl, tr, bl, br = self._determine_collide_points(rects)
-
-        angle = self.angle
-
-        if [tl, tr, bl, br].count(True) in (1, 3, 4):
-            # Ball has collided with a corner, or is fully inside another
-            # sprite. Bounce it back in the direction it came from. Note we
-            # don't apply any randomness here, as we need the ball to go back
-            # in exactly the opposite direction to prevent it from getting
-            # stuck if it is inside a sprite.
-            LOG.debug('Corner or multipoint collision')
-            if self.angle > math.pi:
-                angle = self.angle - math.pi
-            else:
-                angle = self.angle + math.pi
-            if [tl, tr, bl, br].count(True) == 1:
-                # Add some randomness to corner collisions to prevent bounce
-                # loops.
-                angle += random.uniform(-RANDOM_RANGE, RANDOM_RANGE)
-        else:
-            top_collision = tl and tr and self.angle > math.pi
-            bottom_collision = bl and br and self.angle < math.pi
-
-            if top_collision or bottom_collision:
-                LOG.debug('Top/bottom collision')
-                angle = TWO_PI - self.angle
-                # Prevent vertical bounce loops by detecting near vertical
-                # angles and adjusting the angle of bounce.
-                if (TWO_PI - HALF_PI - 0.06) < angle < (
-                        TWO_PI - HALF_PI + 0.06):
-                    angle += 0.35
-                elif (HALF_PI + 0.06) > angle > (HALF_PI - 0.06):
-                    angle += 0.35
+        return self._calc_bounce_angle(
+            *self._determine_collide_points(rects))
 
-            else:
-                left_collision = (tl and bl and
-                                  HALF_PI < self.angle < TWO_PI - HALF_PI)
-                right_collision = tr and br and (
-                    self.angle > TWO_PI - HALF_PI or self.angle < HALF_PI)
-
-                if left_collision or right_collision:
-                    LOG.debug('Side collision')
-                    if self.angle < math.pi:
-                        angle = math.pi - self.angle
-                    else:
-                        angle = (TWO_PI - self.angle) + math.pi
-
-                    # Prevent horizontal bounce loops by detecting near
-                    # horizontal angles and adjusting the angle of bounce.
-                    if math.pi - 0.06 < angle < math.pi + 0.06:
-                        angle += 0.35
-                    elif angle > TWO_PI - 0.06:
-                        angle -= 0.35
-                    elif angle < 0.06:
-                        angle += 0.35
+    def _calc_bounce_angle(self, tl, tr, bl, br):
+        """Calculate the angle of bounce of the ball, given which of its
+        corners are in contact with what it struck.
+        """
+        angle = reflect(self.angle, tl, tr, bl, br)
 
+        if [tl, tr, bl, br].count(True) not in (3, 4):
             # Add a small amount of randomness to the bounce to make it a
             # little more unpredictable, and to prevent the ball from getting
-            # stuck in a repeating bounce loop.
-            angle += random.uniform(-RANDOM_RANGE, RANDOM_RANGE)
+            # stuck in a repeating bounce loop. Note we don't apply any
+            # randomness when the ball is inside another sprite, as we need
+            # the ball to go back in exactly the opposite direction to
+            # prevent it from getting stuck.
+            angle += self._rng.uniform(-RANDOM_RANGE, RANDOM_RANGE)
 
         angle = round(angle, 2)
 
@@ -445,3 +624,95 @@ class Ball(pygame.sprite.Sprite):
         self.visible = True
         self.angle = self._start_angle
         self._anchor = None
+
+
+def reflect(angle, tl, tr, bl, br):
+    """Reflect a ball's angle of travel off what it struck, given which of
+    its corners are in contact with it.
+
+    This is the ball's rule of bounce without the randomness it adds, so it
+    can also be used to predict where the ball will go.
+
+    Args:
+        angle:
+            The angle of travel of the ball in radians.
+        tl:
+            Whether the top left corner of the ball is in contact.
+        tr:
+            Whether the top right corner of the ball is in contact.
+        bl:
+            Whether the bottom left corner of the ball is in contact.
+        br:
+            Whether the bottom right corner of the ball is in contact.
+    Returns:
+        The angle of bounce in radians.
+    """
+    if [tl, tr, bl, br].count(True) in (1, 3, 4):
+        # Ball has collided with a corner, or is fully inside another
+        # sprite. Bounce it back in the direction it came from.
+        LOG.debug('Corner or multipoint collision')
+        if angle > math.pi:
+            return angle - math.pi
+        return angle + math.pi
+
+    top_collision = tl and tr and angle > math.pi
+    bottom_collision = bl and br and angle < math.pi
+
+    if top_collision or bottom_collision:
+        LOG.debug('Top/bottom collision')
+        new_angle = TWO_PI - angle
+        # Prevent vertical bounce loops by detecting near vertical
+        # angles and adjusting the angle of bounce.
+        if (TWO_PI - HALF_PI - 0.06) < new_angle < (TWO_PI - HALF_PI + 0.06):
+            new_angle += 0.35
+        elif (HALF_PI + 0.06) > new_angle > (HALF_PI - 0.06):
+            new_angle += 0.35
+        return new_angle
+
+    left_collision = tl and bl and HALF_PI < angle < TWO_PI - HALF_PI
+    right_collision = tr and br and (
+        angle > TWO_PI - HALF_PI or angle < HALF_PI)
+
+    if left_collision or right_collision:
+        LOG.debug('Side collision')
+        if angle < math.pi:
+            new_angle = math.pi - angle
+        else:
+            new_angle = (TWO_PI - angle) + math.pi
+
+        # Prevent horizontal bounce loops by detecting near horizontal
+        # angles and adjusting the angle of bounce.
+        if math.pi - 0.06 < new_angle < math.pi + 0.06:
+            new_angle += 0.35
+        elif new_angle > TWO_PI - 0.06:
+            new_angle -= 0.35
+        elif new_angle < 0.06:
+            new_angle += 0.35
+        return new_angle
+
+    return angle
+
+
+def normal_collide_points(normal):
+    """Determine which points on a ball are in contact with a surface,
+    given the normal of the surface.
+
+    Args:
+        normal:
+            The (x, y) normal of the surface the ball struck.
+    Returns:
+        A tuple of 4 booleans corresponding to the top left, top right,
+        bottom left and bottom right corners of the ball.
+    """
+    normal_x, normal_y = normal
+    if normal_x and normal_y:
+        # A corner, so only the ball's corner facing it is in contact.
+        return (normal_x > 0 and normal_y > 0,
+                normal_x < 0 and normal_y > 0,
+                normal_x > 0 and normal_y < 0,
+                normal_x < 0 and normal_y < 0)
+    # A side, so the two corners of the ball's side facing it.
+    return (normal_x > 0 or normal_y > 0,
+            normal_x < 0 or normal_y > 0,
+            normal_x > 0 or normal_y < 0,
+            normal_x < 0 or normal_y < 0)
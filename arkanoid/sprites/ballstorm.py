@@ -0,0 +1,331 @@
+import logging
+import math
+
+import pygame
+
+try:
+    import numpy
+except ImportError:
+    # The ball storm is optional, and is unavailable without numpy.
+    numpy = None
+
+from arkanoid.utils.util import load_png
+
+LOG = logging.getLogger(__name__)
+
+
+class StormBall(pygame.sprite.Sprite):
+    """One of the balls of a BallStorm.
+
+    A StormBall holds nothing but the image and rect used to draw it. It is
+    moved by its BallStorm, and is passed as the ball to collision callbacks.
+    """
+
+    def __init__(self, image, rect):
+        super().__init__()
+        self.image = image
+        self.rect = rect
+        self.visible = True
+
+
+class BallStorm:
+    """A large number of balls moved together.
+
+    Where a Ball is a sprite that moves and checks itself for collision,
+    the balls of a BallStorm are rows in arrays of positions, directions of
+    travel and speeds. Every ball is moved and tested against every collider
+    at once, and Python code only runs for the balls that strike something.
+    This keeps hundreds of balls in play at full frame rate.
+
+    The balls collide with the sprites of a CollisionWorld. The speed
+    adjustment, bounce strategy and collision callback of each sprite are
+    honoured as they are by a Ball, except that the callbacks of sprites
+    with a bounce strategy, such as the paddle, are not called. Those act on
+    the ball itself, for instance to catch it, which a StormBall can't do.
+
+    A BallStorm requires numpy. Use BallStorm.available() to check whether
+    it can be created.
+    """
+
+    def __init__(self, collision_world, top_speed=15, normalisation_rate=0.02,
+                 on_ball_lost=None):
+        """Initialise a new BallStorm with no balls.
+
+        Args:
+            collision_world:
+                The CollisionWorld holding the sprites the balls can collide
+                with.
+            top_speed:
+                The maximum speed in pixels per frame that collisions can
+                increase a ball's speed to.
+            normalisation_rate:
+                The per-frame rate at which each ball is brought back to its
+                base speed when it isn't colliding.
+            on_ball_lost:
+                Optional callable that will be called when a ball goes off the
+                edge of the screen and is removed from the storm. It takes a
+                single argument: the StormBall.
+        Raises:
+            RuntimeError if numpy is not installed.
+        """
+        if not self.available():
+            raise RuntimeError('BallStorm requires numpy')
+
+        self.collision_world = collision_world
+        self.normalisation_rate = normalisation_rate
+        self._top_speed = top_speed
+        self._on_ball_lost = on_ball_lost
+
+        self._image, rect = load_png('ball')
+        self._size = rect.size
+
+        # The area within which the balls are in play.
+        self._area = pygame.display.get_surface().get_rect()
+
+        # One row per ball: the exact top left position, the direction of
+        # travel as a unit vector, the speed and the base speed.
+        self._pos = numpy.empty((0, 2))
+        self._vel = numpy.empty((0, 2))
+        self._speed = numpy.empty(0)
+        self._base_speed = numpy.empty(0)
+        # The StormBall for each row.
+        self._balls = []
+
+        # Map of SpatialGrid to the number of sprites it held, its sprites
+        # and an array of their rects, so that the rects of the bricks are
+        # only gathered again after one is destroyed.
+        self._grid_rects = {}
+
+    @staticmethod
+    def available():
+        """Whether a BallStorm can be created.
+
+        Returns:
+            True if numpy is installed, False otherwise.
+        """
+        return numpy is not None
+
+    def __len__(self):
+        return len(self._balls)
+
+    @property
+    def sprites(self):
+        """The StormBall sprites, for drawing."""
+        return list(self._balls)
+
+    def release(self, pos, angles, speed):
+        """Add balls to the storm.
+
+        Args:
+            pos:
+                The (x, y) coordinates of the centre of the balls.
+            angles:
+                A sequence holding the angle in radians of each ball to add.
+            speed:
+                The base speed of the balls.
+        """
+        angles = numpy.asarray(angles, dtype=float)
+        count = len(angles)
+        width, height = self._size
+        topleft = pos[0] - width / 2, pos[1] - height / 2
+
+        self._pos = numpy.concatenate(
+            (self._pos, numpy.tile(topleft, (count, 1))))
+        self._vel = numpy.concatenate(
+            (self._vel, numpy.column_stack((numpy.cos(angles),
+                                            numpy.sin(angles)))))
+        self._speed = numpy.concatenate((self._speed, numpy.full(count, speed,
+                                                                 dtype=float)))
+        self._base_speed = numpy.concatenate(
+            (self._base_speed, numpy.full(count, speed, dtype=float)))
+
+        for _ in range(count):
+            rect = pygame.Rect((0, 0), self._size)
+            self._balls.append(StormBall(self._image, rect))
+        self._place_sprites()
+
+    def clear(self):
+        """Remove all balls from the storm."""
+        self._keep(numpy.zeros(len(self._balls), dtype=bool))
+
+    def update(self):
+        """Move every ball, bounce those that have struck a collider and
+        remove those that have left the screen.
+        """
+        if not self._balls:
+            return
+
+        self._pos += self._vel * self._speed[:, numpy.newaxis]
+
+        sprites, rects, speed_adjust = self._colliders()
+        if sprites:
+            width, height = self._size
+            left, top = self._pos[:, :1], self._pos[:, 1:]
+            # Ball against collider, as an array of shape (balls, colliders).
+            overlap = ((left < rects[:, 2]) & (left + width > rects[:, 0]) &
+                       (top < rects[:, 3]) & (top + height > rects[:, 1]))
+            struck = overlap.any(axis=1)
+        else:
+            overlap, struck = None, numpy.zeros(len(self._balls), dtype=bool)
+
+        if struck.any():
+            self._collide(numpy.flatnonzero(struck), overlap, sprites, rects,
+                          speed_adjust)
+
+        # Bring the speed of the balls that struck nothing back to base.
+        free = ~struck
+        self._speed[free] += numpy.where(
+            self._speed[free] > self._base_speed[free],
+            -self.normalisation_rate, self.normalisation_rate)
+
+        self._remove_lost()
+        self._place_sprites()
+
+    def _colliders(self):
+        """Gather the visible sprites of the collision world.
+
+        Returns:
+            A 3-tuple of a list of the sprites, an array of their rects as
+            (left, top, right, bottom) rows, and an array of their speed
+            adjustments.
+        """
+        sprites, rects, speed_adjust = [], [], []
+        for sprite, collision_data in self.collision_world.sprites():
+            if sprite.visible:
+                sprites.append(sprite)
+                rects.append((sprite.rect.left, sprite.rect.top,
+                              sprite.rect.right, sprite.rect.bottom))
+                speed_adjust.append(collision_data[1])
+        rect_arrays = [numpy.array(rects, dtype=float).reshape(-1, 4)]
+        speed_arrays = [numpy.array(speed_adjust, dtype=float)]
+
+        grids = self.collision_world.grids()
+        for grid in set(self._grid_rects) - {grid for grid, _ in grids}:
+            # Forget grids taken out of the world, such as the last round's.
+            del self._grid_rects[grid]
+
+        for grid, collision_data in grids:
+            cached = self._grid_rects.get(grid)
+            if cached is None or cached[0] != len(grid):
+                grid_sprites = [s for s in grid if s.visible]
+                grid_rects = numpy.array(
+                    [(s.rect.left, s.rect.top, s.rect.right, s.rect.bottom)
+                     for s in grid_sprites], dtype=float).reshape(-1, 4)
+                cached = len(grid), grid_sprites, grid_rects
+                self._grid_rects[grid] = cached
+            sprites.extend(cached[1])
+            rect_arrays.append(cached[2])
+            speed_arrays.append(numpy.full(len(cached[1]), collision_data[1],
+                                           dtype=float))
+
+        return (sprites, numpy.concatenate(rect_arrays),
+                numpy.concatenate(speed_arrays))
+
+    def _collide(self, struck, overlap, sprites, rects, speed_adjust):
+        """Bounce the balls that have struck a collider, adjust their speed
+        and invoke the collision callbacks.
+
+        Each ball is pushed back out of the first collider it overlaps along
+        whichever axis it has penetrated least, and its direction reversed
+        along that axis. A collider's bounce strategy, if it has one, then
+        decides the angle instead.
+
+        Args:
+            struck:
+                The indices of the balls that struck something.
+            overlap:
+                The (balls, colliders) array of which balls overlap which
+                colliders.
+            sprites:
+                The colliders.
+            rects:
+                The (left, top, right, bottom) rects of the colliders.
+            speed_adjust:
+                The speed adjustment of each collider.
+        """
+        width, height = self._size
+        first = overlap[struck].argmax(axis=1)
+        left, top = self._pos[struck, 0], self._pos[struck, 1]
+        hit = rects[first]
+
+        # Bounce strategies are given the ball's rect where it overlaps.
+        ball_rects = {}
+        for row, collider in enumerate(first):
+            if self.collision_world.collision_data(sprites[collider])[0]:
+                ball_rects[row] = pygame.Rect(
+                    round(left[row]), round(top[row]), width, height)
+
+        penetration_x = numpy.minimum(left + width - hit[:, 0],
+                                      hit[:, 2] - left)
+        penetration_y = numpy.minimum(top + height - hit[:, 1],
+                                      hit[:, 3] - top)
+        side = penetration_x < penetration_y
+
+        # Push the ball out towards the side of the collider it is nearest.
+        away_x = numpy.where(left + width / 2 < (hit[:, 0] + hit[:, 2]) / 2,
+                             -1.0, 1.0)
+        away_y = numpy.where(top + height / 2 < (hit[:, 1] + hit[:, 3]) / 2,
+                             -1.0, 1.0)
+        self._pos[struck, 0] += numpy.where(side, away_x * penetration_x, 0)
+        self._pos[struck, 1] += numpy.where(side, 0, away_y * penetration_y)
+        self._vel[struck, 0] = numpy.where(
+            side, away_x * numpy.abs(self._vel[struck, 0]),
+            self._vel[struck, 0])
+        self._vel[struck, 1] = numpy.where(
+            side, self._vel[struck, 1],
+            away_y * numpy.abs(self._vel[struck, 1]))
+
+        # Collisions with several colliders at once add up their speed
+        # adjustments, as they do for a Ball.
+        speed = self._speed[struck]
+        self._speed[struck] = numpy.where(
+            speed < self._top_speed,
+            speed + overlap[struck].astype(float) @ speed_adjust, speed)
+
+        for row, ball_rect in ball_rects.items():
+            sprite = sprites[first[row]]
+            bounce_strategy = self.collision_world.collision_data(sprite)[0]
+            angle = bounce_strategy(sprite.rect, ball_rect)
+            self._vel[struck[row]] = math.cos(angle), math.sin(angle)
+
+        # Invoke the callbacks. A brick destroyed by one ball is no longer
+        # visible, and can't then be struck by another.
+        for index, collider in zip(*numpy.nonzero(overlap[struck])):
+            sprite = sprites[collider]
+            if not sprite.visible:
+                continue
+            bounce_strategy, _, on_collide = \
+                self.collision_world.collision_data(sprite)
+            if on_collide and not bounce_strategy:
+                on_collide(sprite, self._balls[struck[index]])
+
+    def _remove_lost(self):
+        """Remove the balls that have gone off the screen."""
+        width, height = self._size
+        left, top = self._pos[:, 0], self._pos[:, 1]
+        area = self._area
+        keep = ((left >= area.left) & (left + width <= area.right) &
+                (top >= area.top) & (top + height <= area.bottom))
+        if keep.all():
+            return
+
+        lost = [ball for ball, kept in zip(self._balls, keep) if not kept]
+        self._keep(keep)
+        for ball in lost:
+            ball.visible = False
+            if self._on_ball_lost:
+                self._on_ball_lost(ball)
+
+    def _keep(self, keep):
+        """Keep only the balls for which keep is True."""
+        self._pos = self._pos[keep]
+        self._vel = self._vel[keep]
+        self._speed = self._speed[keep]
+        self._base_speed = self._base_speed[keep]
+        self._balls = [ball for ball, kept in zip(self._balls, keep) if kept]
+
+    def _place_sprites(self):
+        """Move the rect of each StormBall to its ball's position."""
+        for ball, topleft in zip(self._balls,
+                                 numpy.rint(self._pos).astype(int).tolist()):
+            ball.rect.topleft = topleft
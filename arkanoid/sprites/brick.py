@@ -97,6 +97,28 @@ class Brick(pygame.sprite.Sprite):
             return self.collision_count < self._destroy_after
         return True
 
+    @property
+    def hits_remaining(self):
+        """The number of further collisions the brick can take before it is
+        destroyed.
+
+        Returns:
+            The number of collisions, or None if the brick is never destroyed.
+        """
+        if self._destroy_after > 0:
+            return max(self._destroy_after - self.collision_count, 0)
+        return None
+
+    @property
+    def animating(self):
+        """Whether the brick is part way through an animation triggered by
+        Brick.animate().
+
+        Returns:
+            True if the brick is animating. False otherwise.
+        """
+        return self._animation is not None
+
     def animate(self):
         """Trigger animation of this brick."""
         self._animation = iter(self._image_sequence)
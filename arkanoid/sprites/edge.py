@@ -29,7 +29,14 @@ COORDS = {DOOR_TOP_LEFT: (115, 150),
 class TopEdge(pygame.sprite.Sprite):
     """The top edge of the game area."""
 
-    def __init__(self):
+    def __init__(self, rng=None):
+        """Initialise a new TopEdge.
+
+        Args:
+            rng:
+                Optional random.Random used to choose which door opens and
+                when. The random module is used if not supplied.
+        """
         super().__init__()
 
         self.image, self.rect = load_png('edge_top')
@@ -43,6 +50,7 @@ class TopEdge(pygame.sprite.Sprite):
         self._open_until = 0
 
         self._update_count = 0
+        self._rng = rng or random
 
         self.visible = True
 
@@ -110,9 +118,10 @@ class TopEdge(pygame.sprite.Sprite):
                 argument: a 2-tuple of the x,y coordinates of the door.
         """
         # Randomly select the door we use.
-        door = random.choice((DOOR_TOP_LEFT, DOOR_TOP_RIGHT))
+        door = self._rng.choice((DOOR_TOP_LEFT, DOOR_TOP_RIGHT))
         # Add a random delay before opening the door.
-        delay = random.choice(range(DOOR_OPEN_DELAY_MIN, DOOR_OPEN_DELAY_MAX))
+        delay = self._rng.choice(
+            range(DOOR_OPEN_DELAY_MIN, DOOR_OPEN_DELAY_MAX))
         delay += self._update_count
         self._open_queue.append((delay, door, lambda: on_open(COORDS[door])))
         self._open_queue.sort(key=operator.itemgetter(0))
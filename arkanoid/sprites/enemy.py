@@ -7,7 +7,10 @@ import weakref
 
 import pygame
 
-from arkanoid.utils.util import load_png_sequence
+from arkanoid.collision import masks_overlap
+from arkanoid.sprites.motion import FloatPosition
+from arkanoid.utils.util import (assets,
+                                 load_png_sequence)
 
 LOG = logging.getLogger(__name__)
 
@@ -26,6 +29,11 @@ MAX_DURATION = 60
 # sprites' movement.
 RANDOM_RANGE = 1.5  # 자유 이동 시 현재 방향에 더해져 움직임을 불규칙하게 만드는 무작위 범위(Radians)
 
+# How far apart, in pixels, enemies and the sprites they collide with can be
+# when a broadphase pairs them. This covers the movement of two enemies in a
+# frame, plus how much bigger the explosion animation is than an enemy.
+BROADPHASE_MARGIN = 16
+
 TWO_PI = math.pi * 2
 HALF_PI = math.pi / 2
 
@@ -47,8 +55,37 @@ class Enemy(pygame.sprite.Sprite):
     _enemies = weakref.WeakSet()
 
     def __init__(self, enemy_type, paddle, on_paddle_collide,
-                 collidable_sprites, on_destroyed):
-       
+                 collidable_sprites, on_destroyed, broadphase=None,
+                 precise=False, rng=None):
+        """Initialise a new Enemy.
+
+        Args:
+            enemy_type:
+                The EnemyType of the enemy.
+            paddle:
+                The paddle, which destroys the enemy when they collide.
+            on_paddle_collide:
+                Callable invoked when the enemy collides with the paddle. It
+                takes 2 arguments: the enemy and the paddle.
+            collidable_sprites:
+                The sprites that cause the enemy to change direction when it
+                collides with them.
+            on_destroyed:
+                Callable invoked with the enemy once it has exploded.
+            broadphase:
+                Optional SortAndSweep shared by all the enemies, with the
+                collidable sprites as its static sprites. When supplied, the
+                enemy only checks for collision with the sprites it pairs the
+                enemy with, rather than with every sprite and enemy.
+            precise:
+                Whether collisions with other enemies are confirmed by
+                testing masks once the rects overlap (default False), so
+                that enemies only bounce off each other when their shapes
+                touch.
+            rng:
+                Optional random.Random used for the enemy's wandering. The
+                random module is used if not supplied.
+        """
         super().__init__()
         self._enemies.add(self)
         self._paddle = paddle
@@ -59,12 +96,21 @@ class Enemy(pygame.sprite.Sprite):
         screen = pygame.display.get_surface() #화면 영역 이미지 로드
         self._area = screen.get_rect()
 
+        self._precise = precise
         self._animation, width, height = self._load_animation_sequence(
             enemy_type.value)
+        if precise:
+            # Build the masks of the explosion frames now rather than
+            # mid-play. They are only needed for precise collisions.
+            for image, _ in load_png_sequence('enemy_explosion'):
+                assets.mask(image)
 
         self.rect = pygame.Rect(self._area.center, (width, height))
         self.image = None
 
+        # The exact position of the enemy, from which its rect is derived.
+        self._pos = FloatPosition()
+
     
         self._explode_animation = None #폭발 상태
 
@@ -73,6 +119,8 @@ class Enemy(pygame.sprite.Sprite):
         self._collidable_sprites = pygame.sprite.Group()
         for sprite in collidable_sprites:
             self._collidable_sprites.add(sprite)
+        self._broadphase = broadphase
+        self._rng = rng or random
 
         # The current direction of travel of the sprite.
         self._direction = START_DIRECTION
@@ -112,6 +160,9 @@ class Enemy(pygame.sprite.Sprite):
         max_width, max_height = 0, 0
 
         for image, rect in sequence:
+            if self._precise:
+                # Build the mask of each frame now rather than mid-play.
+                assets.mask(image)
             if rect.width > max_width:
                 max_width = rect.width
             if rect.height > max_height:
@@ -138,15 +189,15 @@ class Enemy(pygame.sprite.Sprite):
                                                    False):
                         self._on_paddle_collide(self, self._paddle)
                     else:
-                        visible_sprites = itertools.chain(
-                            (sprite for sprite in self._collidable_sprites if
-                             sprite.visible),
-                            (sprite for sprite in self._enemies if
-                             sprite.visible and sprite is not self)
-                        )
+                        visible_sprites = self._nearby_sprites()
                         sprites_collided = pygame.sprite.spritecollide(
                             self,
                             visible_sprites, None) # 다른 적이나 충돌 가능한 스프라이트 (벽, 벽돌 등)와 충돌했는지 확인
+                        if self._precise:
+                            sprites_collided = [
+                                sprite for sprite in sprites_collided if
+                                not isinstance(sprite, Enemy) or
+                                masks_overlap(self, sprite)]
 
                         # The following code could be pulled into a separate
                         # strategy class which could be passed to the enemy
@@ -172,7 +223,7 @@ class Enemy(pygame.sprite.Sprite):
                                 # direction with a new duration.
                                 self._direction = self._calc_direction()
                                 self._duration = (
-                                    self._update_count + random.choice(
+                                    self._update_count + self._rng.choice(
                                         range(MIN_DURATION, MAX_DURATION)))
                             elif self._update_count >= self._duration:
                                 # We've reached the maximum duration in the
@@ -202,7 +253,7 @@ class Enemy(pygame.sprite.Sprite):
                         # 약간의 무작위성을 추가하여 하단에 붙어있지 않게함
                         if abs(self._direction) < 0.1 or abs(self._direction - math.pi) < 0.1:
                             # 방향을 위쪽으로 살짝 틀어줌
-                            self._direction += random.uniform(HALF_PI/2, HALF_PI)
+                            self._direction += self._rng.uniform(HALF_PI/2, HALF_PI)
                     # 좌우 이탈 처리 (선택적으로 경계 안으로 되돌림)
                     elif self.rect.right > self._area.right or self.rect.left < self._area.left:
                         # 좌우 이탈 시에는 기존 벽 충돌 로직이 작동하도록 경계 안으로 되돌림
@@ -215,6 +266,30 @@ class Enemy(pygame.sprite.Sprite):
 
         self._update_count += 1
 
+    @property
+    def mask(self):
+        """The collision mask of the enemy's current image, shared by every
+        enemy, or None if the enemy has no image yet.
+        """
+        if self.image is None:
+            return None
+        return assets.mask(self.image)
+
+    def _nearby_sprites(self):
+        """Get the visible sprites and other enemies that the enemy might
+        be touching.
+        """
+        if self._broadphase is not None and self in self._broadphase:
+            return [sprite for sprite in self._broadphase.candidates(self) if
+                    sprite.visible]
+        # Not in a broadphase, so check everything.
+        return itertools.chain(
+            (sprite for sprite in self._collidable_sprites if
+             sprite.visible),
+            (sprite for sprite in self._enemies if
+             sprite.visible and sprite is not self)
+        )
+
     # 적이 공이나 패들에 맞아 파괴될 때 폭발 애니메이션을 처리
     def _explode(self):
         try: # 폭발 애니메이션 시퀀스(_explode_animation)의 프레임을 모두 사용하면 발생하는 StopIteration 예외를 잡음
@@ -232,7 +307,7 @@ class Enemy(pygame.sprite.Sprite):
         offset_x = SPEED * math.cos(self._direction)
         offset_y = SPEED * math.sin(self._direction)
 
-        return self.rect.move(offset_x, offset_y)
+        return self._pos.move(self.rect, offset_x, offset_y)
 
     def _calc_direction_collision(self, sprites_collided):
         """Calculate a new direction based upon the sprites we collided with.
@@ -315,7 +390,7 @@ class Enemy(pygame.sprite.Sprite):
         # 적의 위치에서 패들 중앙을 향하는 정확한 방향을 계산
         
         # 계산된 방향에 RANDOM_RANGE 내의 무작위 값을 더하여 움직임에 불규칙성 추가
-        direction += random.uniform(-RANDOM_RANGE, RANDOM_RANGE)
+        direction += self._rng.uniform(-RANDOM_RANGE, RANDOM_RANGE)
 
         return direction
 
@@ -0,0 +1,75 @@
+import logging
+
+LOG = logging.getLogger(__name__)
+
+
+class FloatPosition:
+    """The position of a moving sprite, tracked to a fraction of a pixel.
+
+    A pygame Rect only holds whole pixels, so moving a rect by a fractional
+    offset every frame throws the fraction away and the sprite ends up
+    travelling at the wrong speed and angle. A FloatPosition accumulates
+    the exact position of the top left of the sprite, and the sprite's rect
+    is derived from it by rounding to the nearest pixel.
+
+    The position is taken from the sprite's rect when first used. When
+    something else repositions the rect, such as a reset or an anchor, the
+    FloatPosition picks up the new position the next time it is used.
+    """
+
+    def __init__(self):
+        """Initialise a new FloatPosition."""
+        self.x, self.y = 0.0, 0.0
+        # The rect position last derived from x and y, or None if the
+        # position hasn't been taken from the rect yet.
+        self._pixel = None
+
+    def resolve(self, rect):
+        """Get the exact position of the sprite, taking up the position of
+        its rect instead if the rect has been moved by something else.
+
+        Args:
+            rect:
+                The current Rect of the sprite.
+        Returns:
+            The (x, y) position of the top left of the sprite, as floats.
+        """
+        if tuple(rect.topleft) != self._pixel:
+            self.x, self.y = rect.topleft
+            self._pixel = tuple(rect.topleft)
+        return self.x, self.y
+
+    def place(self, rect, x, y):
+        """Set the exact position of the sprite, and move its rect to the
+        nearest pixel.
+
+        Args:
+            rect:
+                The Rect of the sprite, which is updated in place.
+            x:
+                The x coordinate of the top left of the sprite.
+            y:
+                The y coordinate of the top left of the sprite.
+        Returns:
+            The rect.
+        """
+        self.x, self.y = x, y
+        self._pixel = round(x), round(y)
+        rect.topleft = self._pixel
+        return rect
+
+    def move(self, rect, dx, dy):
+        """Move the sprite by an offset, which may be fractional.
+
+        Args:
+            rect:
+                The Rect of the sprite. It is not modified.
+            dx:
+                The distance to move along the x-axis.
+            dy:
+                The distance to move along the y-axis.
+        Returns:
+            A new Rect at the sprite's new position.
+        """
+        x, y = self.resolve(rect)
+        return self.place(rect.copy(), x + dx, y + dy)
@@ -1,3 +1,4 @@
+import functools
 import itertools
 import logging
 import math
@@ -10,6 +11,10 @@ from arkanoid.utils.util import (load_png,
 
 LOG = logging.getLogger(__name__)
 
+# The angles of bounce in degrees off each of the 6 segments of the paddle,
+# from left to right.
+BOUNCE_ANGLES = 220, 245, 260, 280, 295, 320
+
 
 class Paddle(pygame.sprite.Sprite):
     """The movable paddle (a.k.a the "Vaus") used to control the ball to
@@ -207,33 +212,79 @@ class Paddle(pygame.sprite.Sprite):
         Returns:
             The angle of bounce in radians.
         """
-        # Logically break the paddle into 6 segments.
-        # Each segment triggers a different angle of bounce.
-        segment_size = paddle_rect.width // 6
-        segments = []
-
-        for i in range(6):
-            # Create rectangles for all segments bar the last.
-            left = paddle_rect.left + segment_size * i
-            if i < 5:
-                # These segments are a fixed size.
-                segment = pygame.Rect(left, paddle_rect.top, segment_size,
-                                      paddle_rect.height)
-            else:
-                # The last segment makes up what is left of the paddle width.
-                segment = pygame.Rect(left, paddle_rect.top,
-                                      paddle_rect.width - (segment_size * 5),
-                                      paddle_rect.height)
-            segments.append(segment)
+        # Look up the angle for the leftmost of the paddle's 6 segments that
+        # the ball overlaps.
+        offset = max(ball_rect.left - paddle_rect.left, 0)
+        if (ball_rect.right <= paddle_rect.left or
+                offset >= paddle_rect.width or
+                ball_rect.bottom <= paddle_rect.top or
+                ball_rect.top >= paddle_rect.bottom):
+            # The ball isn't over any segment, so use the last, as the
+            # segment lookup always has.
+            return math.radians(BOUNCE_ANGLES[-1])
+        return _segment_angles(paddle_rect.width)[offset]
+
+    @staticmethod
+    def smooth_bounce_strategy(paddle_rect, ball_rect):
+        """Alternative to bounce_strategy() in which the angle of bounce
+        changes smoothly along the paddle, rather than in 6 steps.
+
+        The angle is interpolated between the angles of the 6 segments
+        according to where the centre of the ball strikes the paddle. At the
+        centre of each segment the angle is the same as the segment's.
+
+        Args:
+            paddle_rect:
+                The Rect of the paddle.
+            ball_rect:
+                The Rect of the ball.
 
-        # The bounce angles corresponding to each of the 8 segments.
-        angles = 220, 245, 260, 280, 295, 320
+        Returns:
+            The angle of bounce in radians.
+        """
+        offset = ball_rect.centerx - paddle_rect.left
+        offset = min(max(offset, 0), paddle_rect.width)
+        return _curve_angles(paddle_rect.width)[offset]
 
-        # Discover which segment the ball collided with. Just use the first.
-        index = ball_rect.collidelist(segments)
 
-        # Look up the angle and convert it to radians, before returning.
-        return math.radians(angles[index])
+@functools.lru_cache(maxsize=None)
+def _segment_angles(width):
+    """The angle of bounce in radians at each horizontal offset across a
+    paddle of the given width, when the paddle is broken into 6 segments.
+
+    The paddle only comes in a few widths, so the table for each is built
+    the first time a ball strikes a paddle of that width, then reused.
+    """
+    # The first 5 segments are a fixed size, and the last makes up what is
+    # left of the paddle width.
+    segment_size = max(width // 6, 1)
+    last = len(BOUNCE_ANGLES) - 1
+    return tuple(math.radians(BOUNCE_ANGLES[min(x // segment_size, last)])
+                 for x in range(width))
+
+
+@functools.lru_cache(maxsize=None)
+def _curve_angles(width):
+    """The angle of bounce in radians at each horizontal offset from 0 to
+    the width inclusive across a paddle of the given width, interpolated
+    linearly between the angles at the centre of each of the 6 segments.
+    """
+    segment_size = width / len(BOUNCE_ANGLES)
+    centres = [segment_size * (i + 0.5) for i in range(len(BOUNCE_ANGLES))]
+
+    angles = []
+    for x in range(width + 1):
+        if x <= centres[0]:
+            degrees = BOUNCE_ANGLES[0]
+        elif x >= centres[-1]:
+            degrees = BOUNCE_ANGLES[-1]
+        else:
+            i = int((x - centres[0]) // segment_size)
+            fraction = (x - centres[i]) / segment_size
+            degrees = BOUNCE_ANGLES[i] + fraction * (
+                BOUNCE_ANGLES[i + 1] - BOUNCE_ANGLES[i])
+        angles.append(math.radians(degrees))
+    return tuple(angles)
 
 
 class PaddleState:
@@ -548,14 +599,12 @@ class LaserBullet(pygame.sprite.Sprite):
                 False)
 
             if not top_edge_collision:
-                visible_bricks = (brick for brick in self._game.round.bricks
-                                  if brick.visible)
-                brick_collide = pygame.sprite.spritecollide(self,
-                                                            visible_bricks,
-                                                            False)
-
-                if brick_collide:
-                    brick = brick_collide[0]
+                # Bullets travel straight up, so only the lowest brick in
+                # the bullet's columns can be hit.
+                brick = self._game.round.lowest_brick(self.rect.left,
+                                                      self.rect.right)
+
+                if brick is not None and self.rect.top < brick.rect.bottom:
                     brick.value = 0
                     brick.powerup_cls = None
                     self._game.on_brick_collide(brick, self)
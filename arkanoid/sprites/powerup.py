@@ -5,6 +5,7 @@ import math
 import pygame
 
 from arkanoid.event import receiver
+from arkanoid.sprites.motion import FloatPosition
 from arkanoid.sprites.paddle import (LaserState,
                                      NormalState,
                                      NarrowState,
@@ -92,6 +93,8 @@ class PowerUp(pygame.sprite.Sprite):
         # ─────────────────────────────────────────────
         self.rect = pygame.Rect(0, 0, target_w, target_h)
         self.rect.midtop = brick.rect.midbottom
+        # 파워업의 정확한 위치 (rect는 여기서 반올림해 얻음)
+        self._pos = FloatPosition()
         # 여기까지 수정 완 ------------------
         
         # 수정
@@ -116,7 +119,7 @@ class PowerUp(pygame.sprite.Sprite):
 
     def update(self):
         # Move down by the specified speed.
-        self.rect = self.rect.move(0, self._speed)
+        self.rect = self._pos.move(self.rect, 0, self._speed)
 
         if self._area.contains(self.rect):
             if self._animation_start % 4 == 0:
@@ -0,0 +1,104 @@
+"""Packs the images in the data/graphics directory into a few atlas pages.
+
+This is a build step, run by arkanoid.spec when the game is bundled. To
+use the atlas when running from source, run it after changing any graphics:
+
+    python -m arkanoid.utils.atlas
+
+The pages and a manifest are written to the data/atlas directory. When the
+manifest is present, load_png() and load_png_sequence() return subsurfaces
+of the atlas pages instead of loading each image from its own file.
+"""
+import json
+import logging
+import os
+
+import pygame
+
+from arkanoid.utils.util import (ATLAS_DIR,
+                                 ATLAS_MANIFEST,
+                                 GRAPHICS_DIR)
+
+LOG = logging.getLogger(__name__)
+
+# The size of each atlas page.
+PAGE_SIZE = 1024, 1024
+
+# Images larger than this in either dimension are left in their own files,
+# as they would take up most of a page on their own.
+MAX_IMAGE_SIZE = 512
+
+# The transparent gap left around each image on a page.
+PADDING = 1
+
+
+def pack(graphics_dir=GRAPHICS_DIR, atlas_dir=ATLAS_DIR, page_size=PAGE_SIZE):
+    """Pack the png images in a directory into atlas pages, and write the
+    pages along with a manifest describing where each image is.
+
+    Images are packed onto shelves, tallest first, so that the frames of a
+    sequence (which share a size) end up next to each other.
+
+    Args:
+        graphics_dir:
+            The directory containing the png images.
+        atlas_dir:
+            The directory to write the atlas pages and manifest to.
+        page_size:
+            The (width, height) of each page.
+    Returns:
+        The manifest, a dictionary with a 'pages' list of page filenames and
+        an 'images' map of image filename to [page, x, y, width, height].
+    """
+    images = []
+    for filename in sorted(os.listdir(graphics_dir)):
+        if not filename.lower().endswith('.png'):
+            continue
+        image = pygame.image.load(os.path.join(graphics_dir, filename))
+        if max(image.get_size()) > MAX_IMAGE_SIZE:
+            LOG.debug('Not packing %s: too large', filename)
+            continue
+        images.append((filename, image))
+
+    images.sort(key=lambda item: (-item[1].get_height(), item[0]))
+
+    pages, placements = [], {}
+    page_width, page_height = page_size
+    x, y, shelf_height = page_width, page_height, 0
+
+    for filename, image in images:
+        width, height = image.get_size()
+        if x + width > page_width:
+            # Start a new shelf.
+            x, y, shelf_height = 0, y + shelf_height, 0
+        if y + height > page_height:
+            # Start a new page.
+            pages.append(pygame.Surface(page_size, pygame.SRCALPHA))
+            x, y, shelf_height = 0, 0, 0
+
+        # Copy the pixels exactly, rather than blending them onto the
+        # transparent page.
+        pages[-1].blit(image, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        placements[filename] = [len(pages) - 1, x, y, width, height]
+
+        x += width + PADDING
+        shelf_height = max(shelf_height, height + PADDING)
+
+    os.makedirs(atlas_dir, exist_ok=True)
+    manifest = {'pages': [], 'images': placements}
+
+    for index, page in enumerate(pages, start=1):
+        filename = 'atlas_{}.png'.format(index)
+        pygame.image.save(page, os.path.join(atlas_dir, filename))
+        manifest['pages'].append(filename)
+
+    with open(os.path.join(atlas_dir, ATLAS_MANIFEST), 'w') as file:
+        json.dump(manifest, file, indent=1, sort_keys=True)
+
+    LOG.info('Packed %s images into %s pages', len(placements), len(pages))
+    return manifest
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    pack()
@@ -0,0 +1,95 @@
+import functools
+import logging
+
+from arkanoid.utils import ptext
+
+LOG = logging.getLogger(__name__)
+
+DIGITS = '0123456789'
+
+
+class DigitAtlas:
+    """The digits 0-9 pre-rendered in a particular font, size and colour.
+
+    Numbers are composed by blitting a subsurface of the atlas for each
+    digit, so drawing a number that has never been seen before allocates
+    nothing and adds nothing to any text cache.
+
+    Use digit_atlas() to obtain an instance, so that atlases are shared.
+    """
+
+    def __init__(self, fontname, fontsize, color):
+        """Initialise a new DigitAtlas.
+
+        Args:
+            fontname:
+                The filename of the font.
+            fontsize:
+                The size of the font.
+            color:
+                The colour of the digits.
+        """
+        font = ptext.getfont(fontname, fontsize)
+        self._surf = font.render(DIGITS, True, color).convert_alpha()
+
+        # Slice the atlas into one subsurface per digit, using the advance
+        # of each glyph so that digits line up as the font would set them.
+        self._glyphs, left = {}, 0
+        for digit, metrics in zip(DIGITS, font.metrics(DIGITS)):
+            advance = metrics[4]
+            self._glyphs[digit] = self._surf.subsurface(
+                (left, 0, advance, self._surf.get_height()))
+            left += advance
+
+    def size(self, text):
+        """Get the size of a string of digits when drawn.
+
+        Args:
+            text:
+                The string of digits.
+        Returns:
+            A 2-tuple of the width and height.
+        """
+        return (sum(self._glyphs[digit].get_width() for digit in text),
+                self._surf.get_height())
+
+    def draw(self, text, surf, topright):
+        """Draw a string of digits right aligned onto a surface.
+
+        Args:
+            text:
+                The string of digits.
+            surf:
+                The surface to draw onto.
+            topright:
+                The coordinates of the top right of the drawn digits.
+        Returns:
+            The Rect of the area drawn.
+        Raises:
+            KeyError if the text contains a character that is not a digit.
+        """
+        right, top = topright
+        left = right - self.size(text)[0]
+        x = left
+        for digit in text:
+            glyph = self._glyphs[digit]
+            surf.blit(glyph, (x, top))
+            x += glyph.get_width()
+        return surf.get_rect().clip((left, top, right - left,
+                                     self._surf.get_height()))
+
+
+@functools.lru_cache()
+def digit_atlas(fontname, fontsize, color):
+    """Get the digit atlas for the given font, size and colour. This will
+    render the atlas if it hasn't previously been rendered.
+
+    Args:
+        fontname:
+            The filename of the font.
+        fontsize:
+            The size of the font.
+        color:
+            The colour of the digits, as a tuple.
+    """
+    return DigitAtlas(fontname, fontsize, color)
@@ -0,0 +1,82 @@
+"""Generates the manifest of image sequences in the data/graphics directory.
+
+This is a build step. Run it after adding, removing or renaming any
+graphics:
+
+    python -m arkanoid.utils.manifest
+
+The manifest records the number of frames in each sequence, so that
+load_png_sequence() knows which files make up a sequence without probing
+the filesystem for them.
+"""
+import json
+import logging
+import os
+import re
+
+from arkanoid.utils.util import (ASSET_MANIFEST,
+                                 GRAPHICS_DIR)
+
+LOG = logging.getLogger(__name__)
+
+# Matches the filename of a frame in a sequence, e.g. 'paddle_wide_3.png'.
+FRAME_PATTERN = re.compile(r'^(?P<prefix>.+)_(?P<number>\d+)\.png$',
+                           re.IGNORECASE)
+
+
+def build(graphics_dir=GRAPHICS_DIR):
+    """Build the manifest of the image sequences in a directory.
+
+    A sequence is counted from frame 1 up to the first missing frame
+    number, matching how load_png_sequence() forms the filenames.
+
+    Args:
+        graphics_dir:
+            The directory containing the png images.
+    Returns:
+        The manifest, a dictionary with a 'sequences' map of filename
+        prefix to frame count.
+    """
+    frames = {}
+    for filename in os.listdir(graphics_dir):
+        match = FRAME_PATTERN.match(filename)
+        if match:
+            frames.setdefault(match.group('prefix'), set()).add(
+                int(match.group('number')))
+
+    sequences = {}
+    for prefix, numbers in frames.items():
+        count = 0
+        while count + 1 in numbers:
+            count += 1
+        if count:
+            sequences[prefix] = count
+
+    return {'sequences': sequences}
+
+
+def write(graphics_dir=GRAPHICS_DIR, manifest_path=ASSET_MANIFEST):
+    """Build the manifest of the image sequences in a directory and write
+    it out as JSON.
+
+    Args:
+        graphics_dir:
+            The directory containing the png images.
+        manifest_path:
+            The path of the manifest file to write.
+    Returns:
+        The manifest.
+    """
+    manifest = build(graphics_dir)
+    with open(manifest_path, 'w') as file:
+        json.dump(manifest, file, indent=1, sort_keys=True)
+        file.write('\n')
+
+    LOG.info('Wrote %s sequences to %s', len(manifest['sequences']),
+             manifest_path)
+    return manifest
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    write()
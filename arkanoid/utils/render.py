@@ -0,0 +1,340 @@
+import logging
+
+import pygame
+
+from arkanoid.utils import ptext
+
+LOG = logging.getLogger(__name__)
+
+
+class Renderer:
+    """Draws the game sprites over a background and presents the result.
+
+    The renderer works in one of two modes. In full mode the whole background
+    is blitted and every visible sprite drawn on each call to render(), and
+    present() flips the entire display.
+
+    In dirty rectangle mode the renderer remembers the rect and image that
+    each sprite was last drawn with. Only the regions covered by sprites that
+    have moved, changed image, appeared or disappeared since the last frame
+    have their background restored and their sprites redrawn, and present()
+    updates just those regions of the display.
+
+    Anything drawn directly onto the screen outside of render() should be
+    reported with mark_dirty() so that it gets presented, or invalidate() if
+    the region needs to be rebuilt from the background and sprites.
+    """
+
+    def __init__(self, screen=None, dirty_rects=True):
+        """Initialise a new Renderer.
+
+        Args:
+            screen:
+                Optional surface to render onto. Defaults to the display
+                surface.
+            dirty_rects:
+                Whether to render using dirty rectangles (default True). When
+                False, the whole screen is redrawn and flipped every frame.
+        """
+        self._screen = screen or pygame.display.get_surface()
+        self.dirty_rects = dirty_rects
+
+        # The background surface and the screen position it is drawn at.
+        self._background = None
+        self._background_rect = None
+
+        # Map of sprite to the (rect, image) it was last drawn with.
+        self._drawn = {}
+
+        # Regions that must be rebuilt from the background on next render.
+        self._invalid = []
+
+        # Regions of the screen that have changed and must be presented.
+        self._updates = []
+
+        # Whether the whole screen needs to be rebuilt on the next render.
+        self._full_redraw = True
+
+        # Whether the whole display needs to be flipped on the next present.
+        self._flip = True
+
+        # The regions rebuilt by the last render, or None if everything was.
+        self._rebuilt = None
+
+    def set_background(self, background, pos):
+        """Set the background that sprites are drawn over.
+
+        Setting a different background surface to the current one causes the
+        whole screen to be redrawn on the next render.
+
+        Args:
+            background:
+                The background surface.
+            pos:
+                The screen coordinates of the top left of the background.
+        """
+        rect = background.get_rect(topleft=pos)
+        if background is not self._background or \
+                rect != self._background_rect:
+            self._background = background
+            self._background_rect = rect
+            self.invalidate()
+
+    def invalidate(self, rect=None):
+        """Request that a region of the screen be rebuilt from the background
+        and sprites on the next render.
+
+        Args:
+            rect:
+                Optional Rect of the region to rebuild. If not supplied, the
+                whole screen is rebuilt.
+        """
+        if rect is None:
+            self._full_redraw = True
+        else:
+            self._invalid.append(pygame.Rect(rect))
+
+    def mark_dirty(self, rect):
+        """Report a region of the screen that has been drawn onto directly,
+        so that it is included when the display is next presented.
+
+        Args:
+            rect:
+                The Rect of the region that was drawn.
+        """
+        if rect:
+            self._updates.append(pygame.Rect(rect))
+
+    def restore(self, rect):
+        """Restore the background over a region of the screen, redrawing any
+        sprites within it on the next render.
+
+        Args:
+            rect:
+                The Rect of the region to restore.
+        """
+        rect = pygame.Rect(rect).clip(self._background_rect)
+        if rect:
+            self._blit_background(rect)
+            self.invalidate(rect)
+
+    def damaged(self, rect):
+        """Get the parts of a region of the screen that were rebuilt from the
+        background during the last render, meaning anything drawn directly
+        onto the screen within them will have been erased.
+
+        Args:
+            rect:
+                The Rect of the region.
+        Returns:
+            A list of the Rects of the rebuilt parts of the region, which is
+            empty if none of it was rebuilt.
+        """
+        rect = pygame.Rect(rect)
+        if self._rebuilt is None:
+            return [rect]
+        return [rect.clip(self._rebuilt[index])
+                for index in rect.collidelistall(self._rebuilt)]
+
+    def render(self, sprites, rects=None):
+        """Draw the sprites over the background.
+
+        Args:
+            sprites:
+                The sequence of sprites to draw, in drawing order. Sprites
+                with a false visible attribute are not drawn.
+            rects:
+                Optional mapping of sprite to the Rect to draw it at instead
+                of its own rect, such as one from an Interpolator.
+        """
+        rects = rects or {}
+        if not self.dirty_rects or self._full_redraw:
+            self._render_full(sprites, rects)
+        else:
+            self._render_dirty(sprites, rects)
+
+    def _render_full(self, sprites, rects):
+        self._screen.blit(self._background, self._background_rect)
+        self._drawn.clear()
+
+        for sprite in sprites:
+            if sprite.visible:
+                rect = rects.get(sprite, sprite.rect)
+                self._screen.blit(sprite.image, rect)
+                self._drawn[sprite] = pygame.Rect(rect), sprite.image
+
+        self._invalid = []
+        self._rebuilt = None
+        self._full_redraw = False
+        self._flip = True
+
+    def _render_dirty(self, sprites, rects):
+        dirty, current = self._invalid, set()
+
+        for sprite in sprites:
+            current.add(sprite)
+            drawn = self._drawn.get(sprite)
+
+            if sprite.visible:
+                rect = rects.get(sprite, sprite.rect)
+                if drawn is None:
+                    # Newly visible.
+                    dirty.append(pygame.Rect(rect))
+                elif drawn[0] != rect or drawn[1] is not sprite.image:
+                    # Moved or changed its image.
+                    dirty.append(drawn[0])
+                    dirty.append(pygame.Rect(rect))
+            elif drawn is not None:
+                # Hidden since the last frame.
+                dirty.append(drawn[0])
+                del self._drawn[sprite]
+
+        for sprite in [s for s in self._drawn if s not in current]:
+            # No longer rendered at all.
+            dirty.append(self._drawn.pop(sprite)[0])
+
+        dirty = self._merge(rect.clip(self._background_rect) for rect in dirty)
+
+        for rect in dirty:
+            self._blit_background(rect)
+
+        for sprite in sprites:
+            if sprite.visible:
+                rect = rects.get(sprite, sprite.rect)
+                # Only draw the parts of the sprite that lie within the dirty
+                # regions, so sprites outside of them are left untouched.
+                for index in rect.collidelistall(dirty):
+                    clip = rect.clip(dirty[index])
+                    self._screen.blit(sprite.image, clip,
+                                      clip.move(-rect.x, -rect.y))
+                self._drawn[sprite] = pygame.Rect(rect), sprite.image
+
+        self._rebuilt = dirty
+        self._updates += dirty
+        self._invalid = []
+
+    @staticmethod
+    def _merge(rects):
+        # Combine overlapping rects so that no part of a sprite is drawn more
+        # than once, which would otherwise darken any translucent pixels.
+        merged = []
+        for rect in rects:
+            if not rect:
+                continue
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect = rect.union(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+        return merged
+
+    def _blit_background(self, rect):
+        self._screen.blit(self._background, rect,
+                          rect.move(-self._background_rect.x,
+                                    -self._background_rect.y))
+
+    def present(self):
+        """Present the changes made since the last call to the display."""
+        if not self.dirty_rects or self._flip:
+            pygame.display.flip()
+            self._flip = False
+        elif self._updates:
+            pygame.display.update(self._updates)
+
+        self._updates = []
+
+
+class Interpolator:
+    """Works out where to draw moving sprites between simulation steps.
+
+    When the game is simulated in fixed steps, the frames drawn needn't line
+    up with the steps, and drawing each sprite where the latest step left it
+    makes its motion judder. Instead, the position of each sprite is recorded
+    before every step, and a frame draws the sprite part way between there
+    and where the step left it, by how far the frame falls into the next
+    step. Sprites are drawn up to one step behind the simulation.
+
+    A sprite that jumps further than max_distance in a step, such as a ball
+    being reset, is drawn where it is rather than sliding across the screen.
+    """
+
+    def __init__(self, max_distance):
+        """Initialise a new Interpolator.
+
+        Args:
+            max_distance:
+                The furthest a sprite can move along either axis in a single
+                step and still be interpolated.
+        """
+        self.max_distance = max_distance
+
+        # Map of sprite to the top left of its rect before the latest step.
+        self._previous = {}
+
+    def record(self, sprites):
+        """Record the positions of the sprites before a simulation step.
+
+        Args:
+            sprites:
+                The sprites that might move. Those that are not visible are
+                drawn without interpolation when they next appear.
+        """
+        self._previous = {sprite: tuple(sprite.rect.topleft) for sprite in
+                          sprites if sprite.visible}
+
+    def rects(self, sprites, alpha):
+        """Get the rects to draw the sprites at.
+
+        Args:
+            sprites:
+                The sprites being drawn.
+            alpha:
+                How far the frame falls between the latest step and the
+                next, from 0 to 1.
+        Returns:
+            A dict of sprite to the Rect to draw it at, holding only the
+            sprites that are drawn away from their own rects.
+        """
+        rects = {}
+        for sprite in sprites:
+            previous = self._previous.get(sprite)
+            if previous is None:
+                continue
+            rect = sprite.rect
+            dx, dy = rect.x - previous[0], rect.y - previous[1]
+            if (dx or dy) and abs(dx) <= self.max_distance and \
+                    abs(dy) <= self.max_distance:
+                offset_x = round(previous[0] + dx * alpha) - rect.x
+                offset_y = round(previous[1] + dy * alpha) - rect.y
+                if offset_x or offset_y:
+                    rects[sprite] = rect.move(offset_x, offset_y)
+        return rects
+
+
+class TextSprite(pygame.sprite.Sprite):
+    """A sprite that displays a fixed piece of text.
+
+    Text that is displayed as a sprite is drawn and erased by the Renderer
+    along with all the other sprites, rather than being drawn directly onto
+    the screen every frame.
+    """
+
+    def __init__(self, text, pos, **kwargs):
+        """Initialise a new TextSprite.
+
+        Args:
+            text:
+                The text to display.
+            pos:
+                The screen coordinates of the top left of the text.
+            kwargs:
+                Keyword arguments passed through to ptext, e.g. fontname,
+                fontsize and color.
+        """
+        super().__init__()
+        self.image, pos = ptext.draw(text, pos, surf=None, **kwargs)
+        self.rect = self.image.get_rect(topleft=pos)
+        self.visible = True
+
+    def update(self):
+        pass
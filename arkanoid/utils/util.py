@@ -1,16 +1,272 @@
 import functools
+import json
+import logging
 import os
 
 import pygame
 
+LOG = logging.getLogger(__name__)
 
 HIGH_SCORE_FILE = os.path.join(os.path.expanduser('~'), '.arkanoid')
 
 
+GRAPHICS_DIR = os.path.join(os.path.dirname(__file__), '..', 'data',
+                            'graphics')
+
+# The directory holding the atlas pages built by arkanoid.utils.atlas, and
+# the name of the manifest within it.
+ATLAS_DIR = os.path.join(os.path.dirname(__file__), '..', 'data', 'atlas')
+ATLAS_MANIFEST = 'atlas.json'
+
+# The manifest of image sequences and their frame counts, generated by
+# arkanoid.utils.manifest.
+ASSET_MANIFEST = os.path.join(GRAPHICS_DIR, 'manifest.json')
+
+
+class AssetCache:
+    """A cache of the images loaded from the data/graphics directory, shared
+    by the whole process.
+
+    Each image is decoded from disk once, and the same surface is then
+    handed out to every client that asks for it. Clients must therefore
+    treat the surfaces as read only, and copy them if they need to draw
+    onto them.
+
+    When an atlas has been built, images packed into it are served as
+    subsurfaces of the atlas pages, and only images that aren't in the atlas
+    are loaded from their own files.
+
+    The number of frames in each image sequence is read from the asset
+    manifest, so sequences are loaded without probing the filesystem for
+    where they end.
+
+    The collision mask of an image is also built once and shared.
+    """
+
+    def __init__(self, atlas_dir=ATLAS_DIR, manifest=ASSET_MANIFEST):
+        """Initialise a new AssetCache.
+
+        Args:
+            atlas_dir:
+                Optional directory holding the atlas pages and manifest.
+            manifest:
+                Optional path of the asset manifest of image sequences.
+        """
+        self._atlas_dir = atlas_dir
+        self._manifest = manifest
+        # Map of sequence filename prefix to frame count, read from the
+        # asset manifest on first use. False if there is no manifest.
+        self._frame_counts = None
+        # Map of image filename to (page number, rect) within the atlas,
+        # read from the manifest on first use.
+        self._atlas = None
+        # The atlas page filenames, and map of page number to loaded page.
+        self._page_files = []
+        self._pages = {}
+
+        # Map of png filename to surface.
+        self._images = {}
+        # Map of sequence filename prefix to list of surfaces.
+        self._sequences = {}
+        # Map of surface to its collision mask.
+        self._masks = {}
+
+        # The number of lookups served from the cache, and the number that
+        # had to go to disk.
+        self.hits = 0
+        self.misses = 0
+
+    def image(self, filename):
+        """Get the image with the specified filename, loading it if it
+        hasn't previously been loaded.
+
+        Args:
+            filename:
+                The filename of the image, with or without the '.png'
+                extension.
+        Returns:
+            The image surface.
+        Raises:
+            FileNotFoundError if the image filename was not found.
+        """
+        if not filename.lower().endswith('.png'):
+            filename = '{}.png'.format(filename)
+
+        try:
+            image = self._images[filename]
+        except KeyError:
+            self.misses += 1
+            image = self._images[filename] = self._load(filename)
+        else:
+            self.hits += 1
+
+        return image
+
+    def sequence(self, filename_prefix):
+        """Get the sequence of images with the specified filename prefix,
+        loading them if they haven't previously been loaded.
+
+        See load_png_sequence() for how the filenames are formed.
+
+        Args:
+            filename_prefix:
+                The beginning of the png filename of each file in the
+                sequence.
+        Returns:
+            A list of image surfaces, empty if there are no images in the
+            sequence.
+        """
+        try:
+            sequence = self._sequences[filename_prefix]
+        except KeyError:
+            self.misses += 1
+            if self._frame_counts is None:
+                self._frame_counts = self._load_frame_counts()
+
+            if self._frame_counts is False:
+                # There's no manifest, so find where the sequence ends.
+                sequence = self._probe_sequence(filename_prefix)
+            else:
+                count = self._frame_counts.get(filename_prefix, 0)
+                sequence = [self._cached('%s_%s.png' % (filename_prefix, number))
+                            for number in range(1, count + 1)]
+
+            self._sequences[filename_prefix] = sequence
+        else:
+            self.hits += 1
+
+        return sequence
+
+    def mask(self, image):
+        """Get the collision mask of an image, building it if it hasn't
+        previously been built.
+
+        Args:
+            image:
+                The image surface, normally one handed out by this cache.
+        Returns:
+            A pygame.mask.Mask of the opaque pixels of the image.
+        """
+        try:
+            return self._masks[image]
+        except KeyError:
+            mask = self._masks[image] = pygame.mask.from_surface(image)
+            return mask
+
+    def preload(self, *filenames):
+        """Load images into the cache ahead of them being needed, so that
+        the game doesn't stall decoding them mid-play.
+
+        The asset manifest is also read, if it hasn't been already.
+
+        Args:
+            filenames:
+                The filenames of the images to load. When none are supplied,
+                every png in the data/graphics directory is loaded.
+        """
+        if self._frame_counts is None:
+            self._frame_counts = self._load_frame_counts()
+
+        if not filenames:
+            filenames = [filename for filename in os.listdir(GRAPHICS_DIR)
+                         if filename.lower().endswith('.png')]
+
+        for filename in filenames:
+            if not filename.lower().endswith('.png'):
+                filename = '{}.png'.format(filename)
+            self._cached(filename)
+
+    def clear(self):
+        """Remove all images from the cache and reset the counters."""
+        self._images.clear()
+        self._sequences.clear()
+        self._masks.clear()
+        self._frame_counts = None
+        self._atlas = None
+        self._pages.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def _cached(self, filename):
+        try:
+            return self._images[filename]
+        except KeyError:
+            image = self._images[filename] = self._load(filename)
+            return image
+
+    def _probe_sequence(self, filename_prefix):
+        count, sequence = 1, []
+
+        while True:
+            try:
+                sequence.append(
+                    self._cached('%s_%s.png' % (filename_prefix, count)))
+            except FileNotFoundError:
+                # End of sequence.
+                break
+            count += 1
+
+        return sequence
+
+    def _load_frame_counts(self):
+        try:
+            with open(self._manifest) as file:
+                return json.load(file)['sequences']
+        except FileNotFoundError:
+            LOG.warning('Asset manifest not found: %s', self._manifest)
+            return False
+
+    def _load(self, filename):
+        if self._atlas is None:
+            self._atlas = self._load_atlas_manifest()
+
+        try:
+            page, rect = self._atlas[filename]
+        except KeyError:
+            return self._load_file(os.path.join(GRAPHICS_DIR, filename))
+
+        if page not in self._pages:
+            self._pages[page] = self._load_file(
+                os.path.join(self._atlas_dir, self._page_files[page]))
+        return self._pages[page].subsurface(rect)
+
+    def _load_atlas_manifest(self):
+        try:
+            with open(os.path.join(self._atlas_dir, ATLAS_MANIFEST)) as file:
+                manifest = json.load(file)
+        except FileNotFoundError:
+            # No atlas has been built.
+            return {}
+
+        self._page_files = manifest['pages']
+        return {filename: (page, pygame.Rect(x, y, width, height))
+                for filename, (page, x, y, width, height)
+                in manifest['images'].items()}
+
+    def _load_file(self, fullpath):
+        if not os.path.exists(fullpath):
+            raise FileNotFoundError('File not found: {}'.format(fullpath))
+
+        image = pygame.image.load(fullpath)
+        if image.get_alpha is None:
+            image = image.convert()
+        else:
+            image = image.convert_alpha()
+
+        return image
+
+
+# The singleton AssetCache instance.
+assets = AssetCache()
+
+
 def load_png(filename):
     """Load a png image with the specified filename from the
     data/graphics directory and return it and its Rect.
 
+    The image is shared with all other callers via the asset cache, so it
+    must not be drawn onto. The Rect is new for each call.
+
     Args:
         filename:
             The filename of the image, with or without the '.png' extension.
@@ -19,19 +275,7 @@ def load_png(filename):
     Raises:
         FileNotFoundError if the image filename was not found.
     """
-    if not filename.lower().endswith('.png'):
-        filename = '{}.png'.format(filename)
-    fullpath = os.path.join(os.path.dirname(__file__), '..', 'data',
-                            'graphics', filename)
-    if not os.path.exists(fullpath):
-        raise FileNotFoundError('File not found: {}'.format(fullpath))
-
-    image = pygame.image.load(fullpath)
-    if image.get_alpha is None:
-        image = image.convert()
-    else:
-        image = image.convert_alpha()
-
+    image = assets.image(filename)
     return image, image.get_rect()
 
 
@@ -41,13 +285,16 @@ def load_png_sequence(filename_prefix):
 
     Each png filename in the sequence will be formed by appending an
     incrementing number, starting at 1, followed by the .png extension. The
-    png files will then be loaded for each sequence number until a file
-    cannot be found, at which point loading will stop and a list of
-    the files will be returned.
+    png files will then be loaded for each sequence number up to the frame
+    count recorded in the asset manifest, and a list of the files will be
+    returned. Without a manifest, files are loaded until one cannot be
+    found.
+
+    For example, if the filename prefix is 'paddle_wide' then the files
+    'paddle_wide_1.png', 'paddle_wide_2.png' etc. will be loaded.
 
-    For example, if the filename prefix is 'paddle_wide' then a filename of
-    'paddle_wide_1.png' will attempt to be loaded, followed by
-    'paddle_wide_2.png' etc. until a file cannot be found.
+    As with load_png(), the images are shared via the asset cache but the
+    Rects are new for each call.
 
     Args:
         filename_prefix:
@@ -55,19 +302,8 @@ def load_png_sequence(filename_prefix):
     Returns:
         A list of 2-tuples of image/rect.
     """
-    count, sequence = 1, []
-
-    while True:
-        filename = '%s_%s.png' % (filename_prefix, count)
-        try:
-            sequence.append(load_png(filename))
-        except FileNotFoundError:
-            # End of sequence.
-            break
-        else:
-            count += 1
-
-    return sequence
+    return [(image, image.get_rect())
+            for image in assets.sequence(filename_prefix)]
 
 
 @functools.lru_cache()
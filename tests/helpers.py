@@ -0,0 +1,19 @@
+from unittest.mock import Mock
+
+import pygame
+
+from arkanoid.sprites.ball import Ball
+
+
+class SpriteFactoryMixin:
+    """Makes the swept balls and plain sprites shared by the collision
+    tests."""
+
+    def _ball(self, mock_load_png, start_pos, angle, speed):
+        mock_load_png.return_value = Mock(), pygame.Rect(0, 0, 10, 10)
+        return Ball(start_pos, angle, speed, top_speed=100, swept=True)
+
+    def _sprite(self, rect):
+        sprite = pygame.sprite.Sprite()
+        sprite.rect, sprite.visible = pygame.Rect(rect), True
+        return sprite
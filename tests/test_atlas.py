@@ -0,0 +1,81 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import pygame
+
+from arkanoid.utils.atlas import pack
+from arkanoid.utils.manifest import write
+from arkanoid.utils.util import AssetCache
+
+
+class TestAtlas(TestCase):
+
+    def setUp(self):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+        self._tmp = tempfile.TemporaryDirectory()
+        self.graphics_dir = os.path.join(self._tmp.name, 'graphics')
+        self.atlas_dir = os.path.join(self._tmp.name, 'atlas')
+        os.mkdir(self.graphics_dir)
+
+        self.images = {}
+        for index, size in enumerate(((40, 20), (40, 20), (10, 30), (60, 5))):
+            image = pygame.Surface(size, pygame.SRCALPHA)
+            image.fill((index * 50, 100, 200, 128))
+            image.fill((255, 0, 0, 255), (0, 0, 2, 2))
+            filename = 'image_{}.png'.format(index + 1)
+            pygame.image.save(image, os.path.join(self.graphics_dir,
+                                                  filename))
+            self.images[filename] = image
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_pack_places_every_image(self):
+        manifest = pack(self.graphics_dir, self.atlas_dir)
+
+        self.assertEqual(manifest['pages'], ['atlas_1.png'])
+        self.assertEqual(set(manifest['images']), set(self.images))
+        self.assertTrue(os.path.exists(os.path.join(self.atlas_dir,
+                                                    'atlas_1.png')))
+        self.assertTrue(os.path.exists(os.path.join(self.atlas_dir,
+                                                    'atlas.json')))
+
+    def test_pack_images_do_not_overlap(self):
+        manifest = pack(self.graphics_dir, self.atlas_dir)
+
+        rects = [pygame.Rect(x, y, w, h)
+                 for _, x, y, w, h in manifest['images'].values()]
+        for index, rect in enumerate(rects):
+            self.assertEqual(rect.collidelist(rects[index + 1:]), -1)
+
+    def test_pack_starts_new_page_when_full(self):
+        manifest = pack(self.graphics_dir, self.atlas_dir,
+                        page_size=(64, 32))
+
+        self.assertGreater(len(manifest['pages']), 1)
+
+    def test_cache_serves_subsurfaces_of_atlas(self):
+        pack(self.graphics_dir, self.atlas_dir)
+        cache = AssetCache(atlas_dir=self.atlas_dir)
+
+        for filename, expected in self.images.items():
+            image = cache.image(filename)
+
+            self.assertIsNotNone(image.get_parent())
+            self.assertEqual(image.get_size(), expected.get_size())
+            self.assertEqual(pygame.image.tobytes(image, 'RGBA'),
+                             pygame.image.tobytes(expected, 'RGBA'))
+
+    def test_cache_shares_atlas_page(self):
+        pack(self.graphics_dir, self.atlas_dir)
+        manifest = os.path.join(self.atlas_dir, 'manifest.json')
+        write(self.graphics_dir, manifest)
+        cache = AssetCache(atlas_dir=self.atlas_dir, manifest=manifest)
+
+        sequence = cache.sequence('image')
+
+        self.assertEqual(len(sequence), 4)
+        self.assertEqual(len({image.get_parent() for image in sequence}), 1)
@@ -1,3 +1,4 @@
+import math
 from unittest.case import TestCase
 from unittest.mock import (call,
                            Mock,
@@ -5,9 +6,12 @@ from unittest.mock import (call,
 
 import pygame
 
+from arkanoid.collision import SpatialGrid
 from arkanoid.sprites.ball import (Ball,
                                    RANDOM_RANGE)
 
+from helpers import SpriteFactoryMixin
+
 
 class TestBall(TestCase):
 
@@ -37,8 +41,41 @@ class TestBall(TestCase):
         # Offset x: -5.678340450896964
         # Offset y: 5.63528612616141
 
-        self.assertAlmostEqual(ball.rect.x, 95.0)
-        self.assertAlmostEqual(ball.rect.y, 105.0)
+        self.assertAlmostEqual(ball.rect.x, 94.0)
+        self.assertAlmostEqual(ball.rect.y, 106.0)
+
+    @patch('arkanoid.sprites.ball.load_png')
+    @patch('arkanoid.sprites.ball.pygame')
+    def test_direction_follows_angle(self, mock_pygame, mock_load_png):
+        """Test that the ball moves at its new angle once the angle has been
+        changed.
+        """
+        self._configure_mocks(mock_pygame, mock_load_png)
+
+        mock_pygame.sprite.spritecollide.return_value = []
+
+        ball = Ball((100, 100), 2.36, 8, normalisation_rate=0)
+        ball.angle = math.pi / 2
+        ball.update()
+
+        self.assertEqual(ball.angle, math.pi / 2)
+        self.assertAlmostEqual(ball.velocity[0], 0)
+        self.assertEqual(ball.velocity[1], 1)
+        self.assertEqual(ball.rect.topleft, (100, 108))
+
+    @patch('arkanoid.sprites.ball.load_png')
+    @patch('arkanoid.sprites.ball.pygame')
+    def test_fractional_movement_accumulates(self, mock_pygame,
+                                             mock_load_png):
+        self._configure_mocks(mock_pygame, mock_load_png)
+
+        mock_pygame.sprite.spritecollide.return_value = []
+
+        ball = Ball((100, 100), 0, 0.4, normalisation_rate=0)
+        for _ in range(5):
+            ball.update()
+
+        self.assertEqual(ball.rect.topleft, (102, 100))
 
     @patch('arkanoid.sprites.ball.load_png')
     @patch('arkanoid.sprites.ball.pygame')
@@ -99,8 +136,9 @@ class TestBall(TestCase):
                                    speed_adjust=0.05,
                                    on_collide=mock_on_collide)
 
-        ball._collidable_sprites.add.assert_called_once_with(mock_sprite)
-        self.assertEqual(len(ball._collision_data), 1)
+        self.assertIn(mock_sprite, ball.collision_world)
+        self.assertEqual(ball.collision_world.collision_data(mock_sprite),
+                         (mock_bounce, 0.05, mock_on_collide))
 
     @patch('arkanoid.sprites.ball.load_png')
     @patch('arkanoid.sprites.ball.pygame')
@@ -120,8 +158,8 @@ class TestBall(TestCase):
                                    on_collide=mock_on_collide)
         ball.remove_collidable_sprite(mock_sprite1)
 
-        ball._collidable_sprites.remove.assert_called_once_with(mock_sprite1)
-        self.assertEqual(len(ball._collision_data), 1)
+        self.assertNotIn(mock_sprite1, ball.collision_world)
+        self.assertEqual(len(ball.collision_world), 1)
 
     @patch('arkanoid.sprites.ball.load_png')
     @patch('arkanoid.sprites.ball.pygame')
@@ -138,8 +176,8 @@ class TestBall(TestCase):
                                    on_collide=mock_on_collide)
         ball.remove_collidable_sprite(mock_sprite1)  # Does not exist.
 
-        ball._collidable_sprites.remove.assert_called_once_with(mock_sprite1)
-        self.assertEqual(len(ball._collision_data), 1)
+        self.assertIn(mock_sprite2, ball.collision_world)
+        self.assertEqual(len(ball.collision_world), 1)
 
     @patch('arkanoid.sprites.ball.load_png')
     @patch('arkanoid.sprites.ball.pygame')
@@ -159,8 +197,7 @@ class TestBall(TestCase):
                                    on_collide=mock_on_collide)
         ball.remove_all_collidable_sprites()
 
-        ball._collidable_sprites.empty.assert_called_once_with()
-        self.assertEqual(len(ball._collision_data), 0)
+        self.assertEqual(len(ball.collision_world), 0)
 
     @patch('arkanoid.sprites.ball.load_png')
     @patch('arkanoid.sprites.ball.pygame')
@@ -187,6 +224,55 @@ class TestBall(TestCase):
         mock_bounce.assert_called_once_with(mock_sprite.rect, ball.rect)
         self.assertEqual(ball.angle, 2.4)
 
+    @patch('arkanoid.sprites.ball.load_png')
+    @patch('arkanoid.sprites.ball.pygame')
+    def test_grid_sprite_collision(self, mock_pygame, mock_load_png):
+        """Test that only the visible sprites in the grid cells near the ball
+        are checked, and that the grid's collision data is used when the ball
+        strikes one of them.
+        """
+        self._configure_mocks(mock_pygame, mock_load_png)
+        mock_grid, mock_on_collide = Mock(), Mock()
+        mock_brick, mock_hidden_brick = Mock(visible=True), Mock(visible=False)
+        mock_grid.query.return_value = [mock_brick, mock_hidden_brick]
+        mock_grid.__contains__ = Mock(return_value=True)
+        mock_pygame.sprite.spritecollide.return_value = [mock_brick]
+
+        ball = Ball((100, 100), 2.36, 8)
+        ball.add_collidable_grid(mock_grid, speed_adjust=0.5,
+                                 on_collide=mock_on_collide)
+        ball._calc_new_angle = Mock()
+        ball.update()
+
+        mock_grid.query.assert_called_once_with(ball.rect)
+        mock_pygame.sprite.spritecollide.assert_called_once_with(
+            ball, [mock_brick], False)
+        self.assertEqual(ball.speed, 8.5)
+        mock_on_collide.assert_called_once_with(mock_brick, ball)
+
+    @patch('arkanoid.sprites.ball.load_png')
+    @patch('arkanoid.sprites.ball.pygame')
+    def test_clone_shares_grids(self, mock_pygame, mock_load_png):
+        self._configure_mocks(mock_pygame, mock_load_png)
+        mock_grid, mock_on_collide = Mock(), Mock()
+
+        ball = Ball((100, 100), 2.36, 8)
+        ball.add_collidable_grid(mock_grid, on_collide=mock_on_collide)
+        clone = ball.clone()
+
+        self.assertIs(clone.collision_world, ball.collision_world)
+
+    @patch('arkanoid.sprites.ball.load_png')
+    @patch('arkanoid.sprites.ball.pygame')
+    def test_clone_shares_rng(self, mock_pygame, mock_load_png):
+        self._configure_mocks(mock_pygame, mock_load_png)
+        rng = Mock()
+
+        ball = Ball((100, 100), 2.36, 8, rng=rng)
+        clone = ball.clone()
+
+        self.assertIs(clone._rng, rng)
+
     @patch('arkanoid.sprites.ball.load_png')
     @patch('arkanoid.sprites.ball.pygame')
     def test_single_sprite_collision_default(self, mock_pygame, mock_load_png):
@@ -262,7 +348,7 @@ class TestBall(TestCase):
         mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
 
         def collidepoint(point):
-            return point == (95.0, 95.0)
+            return point == (94.0, 94.0)
 
         mock_sprite.rect.collidepoint.side_effect = collidepoint
 
@@ -287,11 +373,11 @@ class TestBall(TestCase):
         mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
 
         def collidepoint(point):
-            return point == (104.0, 94.0)  # Top left corner
+            return point == (104.0, 93.0)  # Top left corner
 
         mock_sprite.rect.collidepoint.side_effect = collidepoint
 
-        ball = Ball((100, 100),  5.3, 8)
+        ball = Ball((100, 100), 5.3, 8)
         ball.add_collidable_sprite(mock_sprite)
         ball.update()
 
@@ -312,11 +398,11 @@ class TestBall(TestCase):
         mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
 
         def collidepoint(point):
-            return point == (115.0, 105.0)  # Top right corner.
+            return point == (116.0, 106.0)  # Top right corner.
 
         mock_sprite.rect.collidepoint.side_effect = collidepoint
 
-        ball = Ball((100, 100),  0.78, 8)
+        ball = Ball((100, 100), 0.78, 8)
         ball.add_collidable_sprite(mock_sprite)
         ball.update()
 
@@ -337,11 +423,11 @@ class TestBall(TestCase):
         mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
 
         def collidepoint(point):
-            return point == (95.0, 105.0)  # Top left corner.
+            return point == (94.0, 106.0)  # Top left corner.
 
         mock_sprite.rect.collidepoint.side_effect = collidepoint
 
-        ball = Ball((100, 100),  2.35, 8)
+        ball = Ball((100, 100), 2.35, 8)
         ball.add_collidable_sprite(mock_sprite)
         ball.update()
 
@@ -362,11 +448,11 @@ class TestBall(TestCase):
         mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
 
         def collidepoint(point):
-            return point == (115.0, 105.0)  # Top right corner.
+            return point == (116.0, 106.0)  # Top right corner.
 
         mock_sprite.rect.collidepoint.side_effect = collidepoint
 
-        ball = Ball((100, 100),  0.78, 8)
+        ball = Ball((100, 100), 0.78, 8)
         ball.add_collidable_sprite(mock_sprite)
         ball.update()
 
@@ -387,7 +473,7 @@ class TestBall(TestCase):
         mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
 
         def collidepoint(point):
-            return point == (105.0, 115.0)  # Bottom left corner
+            return point == (106.0, 116.0)  # Bottom left corner
 
         mock_sprite.rect.collidepoint.side_effect = collidepoint
 
@@ -412,7 +498,7 @@ class TestBall(TestCase):
         mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
 
         def collidepoint(point):
-            return point == (105.0, 115.0)  # Bottom right corner
+            return point == (104.0, 116.0)  # Bottom right corner
 
         mock_sprite.rect.collidepoint.side_effect = collidepoint
 
@@ -437,7 +523,7 @@ class TestBall(TestCase):
         mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
 
         def collidepoint(point):
-            return point == (95.0, 105.0)  # Bottom left corner
+            return point == (94.0, 104.0)  # Bottom left corner
 
         mock_sprite.rect.collidepoint.side_effect = collidepoint
 
@@ -462,7 +548,7 @@ class TestBall(TestCase):
         mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
 
         def collidepoint(point):
-            return point == (115.0, 105.0)  # Bottom left corner
+            return point == (116.0, 104.0)  # Bottom left corner
 
         mock_sprite.rect.collidepoint.side_effect = collidepoint
 
@@ -544,7 +630,7 @@ class TestBall(TestCase):
         mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
 
         def collidepoint(point):
-            points = [(95.0, 115.0), (105.0, 115.0)]
+            points = [(95.0, 116.0), (105.0, 116.0)]
             return point in points
 
         mock_sprite.rect.collidepoint.side_effect = collidepoint
@@ -571,7 +657,7 @@ class TestBall(TestCase):
         mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
 
         def collidepoint(point):
-            points = [(95.0, 105.0), (105.0, 105.0)]
+            points = [(95.0, 106.0), (105.0, 106.0)]
             return point in points
 
         mock_sprite.rect.collidepoint.side_effect = collidepoint
@@ -595,7 +681,7 @@ class TestBall(TestCase):
         mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
 
         def collidepoint(point):
-            points = [(95.0, 105.0), (95.0, 115.0)]
+            points = [(95.0, 106.0), (95.0, 116.0)]
             return point in points
 
         mock_sprite.rect.collidepoint.side_effect = collidepoint
@@ -645,7 +731,7 @@ class TestBall(TestCase):
         mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
 
         def collidepoint(point):
-            points = [(101.0, 93.0), (101.0, 103.0)]
+            points = [(101.0, 92.0), (101.0, 102.0)]
             return point in points
 
         mock_sprite.rect.collidepoint.side_effect = collidepoint
@@ -670,7 +756,7 @@ class TestBall(TestCase):
         mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
 
         def collidepoint(point):
-            points = [(112.0, 107.0), (112.0, 117.0)]
+            points = [(113.0, 107.0), (113.0, 117.0)]
             return point in points
 
         mock_sprite.rect.collidepoint.side_effect = collidepoint
@@ -694,7 +780,7 @@ class TestBall(TestCase):
         mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
 
         def collidepoint(point):
-            points = [(111.0, 93.0), (111.0, 103.0)]
+            points = [(111.0, 92.0), (111.0, 102.0)]
             return point in points
 
         mock_sprite.rect.collidepoint.side_effect = collidepoint
@@ -721,7 +807,7 @@ class TestBall(TestCase):
         mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
 
         def collidepoint(point):
-            points = [(111.0, 93.0), (111.0, 103.0)]
+            points = [(111.0, 94.0), (111.0, 104.0)]
             return point in points
 
         mock_sprite.rect.collidepoint.side_effect = collidepoint
@@ -746,7 +832,7 @@ class TestBall(TestCase):
         mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
 
         def collidepoint(point):
-            points = [(100.0, 93.0), (110.0, 93.0)]
+            points = [(100.0, 92.0), (110.0, 92.0)]
             return point in points
 
         mock_sprite.rect.collidepoint.side_effect = collidepoint
@@ -770,7 +856,7 @@ class TestBall(TestCase):
         mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
 
         def collidepoint(point):
-            points = [(100.0, 117.0), (110.0, 117.0)]
+            points = [(100.0, 118.0), (110.0, 118.0)]
             return point in points
 
         mock_sprite.rect.collidepoint.side_effect = collidepoint
@@ -794,7 +880,7 @@ class TestBall(TestCase):
         mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
 
         def collidepoint(point):
-            points = [(93.0, 100.0), (93.0, 110.0)]
+            points = [(92.0, 100.0), (92.0, 110.0)]
             return point in points
 
         mock_sprite.rect.collidepoint.side_effect = collidepoint
@@ -818,7 +904,7 @@ class TestBall(TestCase):
         mock_pygame.sprite.spritecollide.return_value = [mock_sprite]
 
         def collidepoint(point):
-            points = [(117.0, 100.0), (117.0, 110.0)]
+            points = [(118.0, 100.0), (118.0, 110.0)]
             return point in points
 
         mock_sprite.rect.collidepoint.side_effect = collidepoint
@@ -838,7 +924,6 @@ class TestBall(TestCase):
         ball = Ball((100, 100), 2.32, 8)
 
         sprite, bounce, on_collide, offscreen = Mock(), Mock(), Mock(), Mock()
-        ball._collidable_sprites.__iter__.return_value = [sprite]
 
         ball.add_collidable_sprite(sprite,
                                    bounce_strategy=bounce,
@@ -858,8 +943,28 @@ class TestBall(TestCase):
         self.assertEqual(clone._top_speed, 14)
         self.assertEqual(clone.normalisation_rate, 0.3)
         self.assertEqual(clone._off_screen_callback, offscreen)
-        clone._collidable_sprites.add.assert_has_calls([call(sprite)])
-        self.assertEqual(clone._collision_data, ball._collision_data)
+        self.assertIs(clone.collision_world, ball.collision_world)
+        self.assertEqual(clone.collision_world.collision_data(sprite),
+                         (bounce, 2, on_collide))
+
+    @patch('arkanoid.sprites.ball.load_png')
+    @patch('arkanoid.sprites.ball.pygame')
+    def test_clone_sees_sprites_added_later(self, mock_pygame, mock_load_png):
+        """Test that a sprite added to a ball after it has been cloned can be
+        struck by the clone, and that removing it removes it from both.
+        """
+        self._configure_mocks(mock_pygame, mock_load_png)
+        sprite = Mock()
+
+        ball = Ball((100, 100), 2.32, 8)
+        clone = ball.clone()
+        ball.add_collidable_sprite(sprite)
+
+        self.assertIn(sprite, clone._nearby_sprites())
+
+        clone.remove_collidable_sprite(sprite)
+
+        self.assertNotIn(sprite, ball._nearby_sprites())
 
     @patch('arkanoid.sprites.ball.load_png')
     @patch('arkanoid.sprites.ball.pygame')
@@ -932,3 +1037,157 @@ class TestBall(TestCase):
 
         self.assertIsNone(ball._anchor)
         self.assertEqual(ball.angle, 4.01)
+
+
+@patch('arkanoid.sprites.ball.random.uniform', Mock(return_value=0))
+@patch('arkanoid.sprites.ball.pygame.display.get_surface',
+       Mock(return_value=pygame.Surface((600, 800))))
+@patch('arkanoid.sprites.ball.load_png')
+class TestSweptBall(SpriteFactoryMixin, TestCase):
+
+    def test_does_not_pass_through_thin_sprite(self, mock_load_png):
+        ball = self._ball(mock_load_png, (100, 100), 0.3, 40)
+        wall, on_collide = self._sprite((120, 50, 2, 100)), Mock()
+        ball.add_collidable_sprite(wall, on_collide=on_collide)
+
+        ball.update()
+
+        on_collide.assert_called_once_with(wall, ball)
+        self.assertLessEqual(ball.rect.right, wall.rect.left)
+        self.assertEqual(ball.angle, 2.84)
+
+    def test_bounce_varied_by_supplied_rng(self, mock_load_png):
+        mock_load_png.return_value = Mock(), pygame.Rect(0, 0, 10, 10)
+        rng = Mock()
+        rng.uniform.return_value = 0.05
+        ball = Ball((100, 100), 0.3, 40, top_speed=100, swept=True, rng=rng)
+        ball.add_collidable_sprite(self._sprite((120, 50, 2, 100)))
+
+        ball.update()
+
+        rng.uniform.assert_called_once_with(-RANDOM_RANGE, RANDOM_RANGE)
+        self.assertEqual(ball.angle, 2.89)
+
+    def test_resolves_multiple_impacts_in_one_update(self, mock_load_png):
+        ball = self._ball(mock_load_png, (100, 100), 0.79, 40)
+        right, bottom = (self._sprite((120, 0, 10, 300)),
+                         self._sprite((0, 125, 300, 10)))
+        on_collide = Mock()
+        ball.add_collidable_sprite(right, on_collide=on_collide)
+        ball.add_collidable_sprite(bottom, on_collide=on_collide)
+
+        ball.update()
+
+        on_collide.assert_has_calls([call(right, ball), call(bottom, ball)])
+        self.assertLessEqual(ball.rect.right, right.rect.left)
+        self.assertLessEqual(ball.rect.bottom, bottom.rect.top)
+        self.assertTrue(math.pi < ball.angle < math.pi * 1.5)
+
+    def test_simultaneous_impacts_bounce_once(self, mock_load_png):
+        ball = self._ball(mock_load_png, (100, 100), 1.2, 20)
+        bricks = [self._sprite((90, 115, 15, 5)),
+                  self._sprite((105, 115, 15, 5))]
+        on_collide = Mock()
+        for brick in bricks:
+            ball.add_collidable_sprite(brick, on_collide=on_collide)
+
+        ball.update()
+
+        on_collide.assert_has_calls([call(bricks[0], ball),
+                                     call(bricks[1], ball)])
+        self.assertEqual(on_collide.call_count, 2)
+        self.assertLessEqual(ball.rect.bottom, 115)
+        self.assertAlmostEqual(ball.angle, 5.08)
+
+    def test_bounce_strategy_given_contact_rect(self, mock_load_png):
+        ball = self._ball(mock_load_png, (100, 100), math.pi / 2, 20)
+        paddle, bounce = self._sprite((80, 115, 60, 10)), Mock()
+        bounce.return_value = 4.5
+        ball.add_collidable_sprite(paddle, bounce_strategy=bounce)
+
+        ball.update()
+
+        bounce.assert_called_once_with(paddle.rect,
+                                       pygame.Rect(100, 106, 10, 10))
+        self.assertTrue(bounce.call_args[0][1].colliderect(paddle.rect))
+        self.assertEqual(ball.angle, 4.5)
+
+    def test_queries_grid_along_path(self, mock_load_png):
+        ball = self._ball(mock_load_png, (100, 100), 0, 40)
+        grid = SpatialGrid((10, 10))
+        brick, on_collide = self._sprite((130, 100, 10, 10)), Mock()
+        grid.add(brick)
+        ball.add_collidable_grid(grid, on_collide=on_collide)
+
+        ball.update()
+
+        on_collide.assert_called_once_with(brick, ball)
+        self.assertLessEqual(ball.rect.right, 130)
+
+    def test_queries_grid_from_fractional_position(self, mock_load_png):
+        ball = self._ball(mock_load_png, (53, 577), 4.54, 6)
+        ball._pos.place(ball.rect, 53.385, 576.855)
+        grid = SpatialGrid((43, 21), origin=(22, 529))
+        brick, on_collide = self._sprite((22, 550, 43, 21)), Mock()
+        grid.add(brick)
+        ball.add_collidable_grid(grid, on_collide=on_collide)
+
+        ball.update()
+
+        # The ball's rect is a pixel clear of the brick's cell, but its
+        # exact path reaches the brick.
+        on_collide.assert_called_once_with(brick, ball)
+        self.assertGreaterEqual(ball.position[1], brick.rect.bottom)
+
+    @patch('arkanoid.sprites.ball.sweep', Mock(return_value=None))
+    def test_end_position_overlapping_sprite_struck(self, mock_load_png):
+        ball = self._ball(mock_load_png, (100, 100), 0, 8)
+        wall, on_collide = self._sprite((115, 90, 10, 30)), Mock()
+        ball.add_collidable_sprite(wall, on_collide=on_collide)
+
+        ball.update()
+
+        on_collide.assert_called_once_with(wall, ball)
+
+    def _precise_sprite(self, rect):
+        sprite = self._sprite(rect)
+        sprite.mask = pygame.mask.Mask(sprite.rect.size, fill=True)
+        return sprite
+
+    def _round_image(self):
+        image = pygame.Surface((10, 10), pygame.SRCALPHA)
+        pygame.draw.circle(image, (255, 255, 255), (5, 5), 5)
+        return image
+
+    def test_precise_sprite_missed_by_corner(self, mock_load_png):
+        ball = self._ball(mock_load_png, (100, 100), 0, 3)
+        ball.image = self._round_image()
+        enemy, on_collide = self._precise_sprite((112, 109, 10, 10)), Mock()
+        ball.collision_world.add(enemy, on_collide=on_collide, precise=True)
+
+        ball.update()
+
+        # The rects overlap, but not the round ball and the enemy.
+        self.assertTrue(ball.rect.colliderect(enemy.rect))
+        on_collide.assert_not_called()
+        self.assertEqual(ball.angle, 0)
+
+    def test_precise_sprite_struck(self, mock_load_png):
+        ball = self._ball(mock_load_png, (100, 100), 0, 3)
+        ball.image = self._round_image()
+        enemy, on_collide = self._precise_sprite((111, 100, 10, 10)), Mock()
+        ball.collision_world.add(enemy, on_collide=on_collide, precise=True)
+
+        ball.update()
+
+        on_collide.assert_called_once_with(enemy, ball)
+        self.assertNotEqual(ball.angle, 0)
+
+    def test_no_collision_normalises_speed(self, mock_load_png):
+        ball = self._ball(mock_load_png, (100, 100), 0, 8)
+        ball.base_speed = 10
+
+        ball.update()
+
+        self.assertEqual(ball.rect.topleft, (108, 100))
+        self.assertEqual(ball.speed, 8.02)
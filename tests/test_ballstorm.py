@@ -0,0 +1,184 @@
+import math
+from unittest import (skipUnless,
+                      TestCase)
+from unittest.mock import (Mock,
+                           patch)
+
+import pygame
+
+from arkanoid.collision import (CollisionWorld,
+                                SpatialGrid)
+from arkanoid.sprites.ballstorm import BallStorm
+from arkanoid.sprites.paddle import Paddle
+from arkanoid.sprites.powerup import CatchPowerUp
+
+from helpers import SpriteFactoryMixin
+
+
+@skipUnless(BallStorm.available(), 'numpy is not installed')
+@patch('arkanoid.sprites.ballstorm.pygame.display.get_surface',
+       Mock(return_value=pygame.Surface((600, 800))))
+@patch('arkanoid.sprites.ballstorm.load_png',
+       Mock(return_value=(Mock(), pygame.Rect(0, 0, 10, 10))))
+class TestBallStorm(SpriteFactoryMixin, TestCase):
+
+    def setUp(self):
+        self.world = CollisionWorld()
+
+    def _storm(self, **kwargs):
+        return BallStorm(self.world, normalisation_rate=0, **kwargs)
+
+    def test_release(self):
+        storm = self._storm()
+
+        storm.release((100, 200), [0, math.pi], 5)
+
+        self.assertEqual(len(storm), 2)
+        self.assertEqual([ball.rect.center for ball in storm.sprites],
+                         [(100, 200), (100, 200)])
+
+    def test_balls_move_together(self):
+        storm = self._storm()
+        storm.release((100, 200), [0, math.pi / 2], 5)
+
+        storm.update()
+
+        self.assertEqual([ball.rect.topleft for ball in storm.sprites],
+                         [(100, 195), (95, 200)])
+
+    def test_bounce_off_side(self):
+        wall, on_collide = self._sprite((110, 0, 20, 800)), Mock()
+        self.world.add(wall, speed_adjust=0.5, on_collide=on_collide)
+        storm = self._storm()
+        storm.release((100, 200), [0], 8)
+
+        storm.update()
+
+        ball = storm.sprites[0]
+        self.assertEqual(ball.rect.right, 110)
+        on_collide.assert_called_once_with(wall, ball)
+
+        storm.update()
+
+        # Travelling left, at the adjusted speed.
+        self.assertEqual(ball.rect.topleft, (92, 195))
+
+    def test_bounce_off_top(self):
+        brick = self._sprite((50, 150, 100, 20))
+        self.world.add(brick)
+        storm = self._storm()
+        storm.release((100, 178), [math.pi * 1.5], 8)
+
+        storm.update()
+        storm.update()
+
+        self.assertEqual(storm.sprites[0].rect.top, 178)
+
+    def test_bounce_strategy(self):
+        paddle, bounce = self._sprite((50, 300, 100, 20)), Mock()
+        bounce.return_value = math.pi * 1.5
+        self.world.add(paddle, bounce_strategy=bounce)
+        storm = self._storm()
+        storm.release((100, 290), [math.pi / 2], 8)
+
+        storm.update()
+
+        ball = storm.sprites[0]
+        bounce.assert_called_once_with(paddle.rect,
+                                       pygame.Rect(95, 293, 10, 10))
+        self.assertEqual(ball.rect.bottom, 300)
+
+        storm.update()
+
+        self.assertEqual(ball.rect.bottom, 292)
+
+    def test_bounce_strategy_sprite_callback_not_called(self):
+        paddle, on_collide = self._sprite((50, 300, 100, 20)), Mock()
+        self.world.add(paddle, bounce_strategy=Mock(return_value=4.5),
+                       on_collide=on_collide)
+        storm = self._storm()
+        storm.release((100, 290), [math.pi / 2], 8)
+
+        storm.update()
+
+        on_collide.assert_not_called()
+
+    @patch('arkanoid.sprites.powerup.receiver', Mock())
+    @patch('arkanoid.sprites.powerup.load_png_sequence',
+           Mock(return_value=[]))
+    @patch('arkanoid.sprites.paddle.load_png_sequence', Mock())
+    @patch('arkanoid.sprites.paddle.load_png')
+    def test_storm_ball_not_caught(self, mock_load_png):
+        mock_load_png.return_value = Mock(), pygame.Rect(0, 0, 100, 20)
+        paddle = Paddle()
+        paddle.rect.topleft = 50, 300
+        self.world.add(paddle, bounce_strategy=paddle.bounce_strategy,
+                       on_collide=paddle.on_ball_collide)
+        brick = Mock(rect=pygame.Rect(0, 0, 40, 20))
+        CatchPowerUp(Mock(paddle=paddle), brick)._activate()
+        storm = self._storm()
+        storm.release((100, 290), [math.pi / 2], 8)
+
+        storm.update()
+        storm.update()
+
+        # The ball bounced off the paddle rather than being caught.
+        self.assertLess(storm.sprites[0].rect.bottom, 300)
+
+    def test_grid_sprites(self):
+        grid, on_collide = SpatialGrid((100, 20)), Mock()
+        brick = self._sprite((50, 150, 100, 20))
+        grid.add(brick)
+        self.world.add_grid(grid, on_collide=on_collide)
+        storm = self._storm()
+        storm.release((100, 178), [math.pi * 1.5], 8)
+
+        storm.update()
+
+        on_collide.assert_called_once_with(brick, storm.sprites[0])
+
+    def test_destroyed_sprite_not_struck_again(self):
+        """Test that a brick destroyed by one ball isn't also struck by
+        another ball in the same update.
+        """
+        brick = self._sprite((50, 150, 100, 20))
+
+        def destroy(sprite, ball):
+            sprite.visible = False
+
+        on_collide = Mock(side_effect=destroy)
+        self.world.add(brick, on_collide=on_collide)
+        storm = self._storm()
+        storm.release((100, 178), [math.pi * 1.5] * 2, 8)
+
+        storm.update()
+
+        on_collide.assert_called_once_with(brick, storm.sprites[0])
+
+    def test_ball_lost(self):
+        on_ball_lost = Mock()
+        storm = self._storm(on_ball_lost=on_ball_lost)
+        storm.release((300, 795), [math.pi / 2, math.pi * 1.5], 8)
+        lost = storm.sprites[0]
+
+        storm.update()
+
+        self.assertEqual(len(storm), 1)
+        self.assertNotIn(lost, storm.sprites)
+        on_ball_lost.assert_called_once_with(lost)
+
+    def test_clear(self):
+        storm = self._storm()
+        storm.release((100, 200), [0, 1, 2], 5)
+
+        storm.clear()
+        storm.update()
+
+        self.assertEqual(len(storm), 0)
+        self.assertEqual(storm.sprites, [])
+
+    @patch('arkanoid.sprites.ballstorm.numpy', None)
+    def test_unavailable_without_numpy(self):
+        self.assertFalse(BallStorm.available())
+        with self.assertRaises(RuntimeError):
+            self._storm()
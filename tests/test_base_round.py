@@ -3,6 +3,8 @@ from unittest.mock import (call,
                            Mock,
                            patch)
 
+import pygame
+
 from arkanoid.rounds.base import BaseRound
 from arkanoid.sprites.brick import BrickColour
 
@@ -55,7 +57,7 @@ class TestBaseRound(TestCase):
         mock_background = Mock()
         mock_create_background = Mock()
         mock_create_background.return_value = mock_background
-        mock_create_bricks = Mock()
+        mock_create_bricks = Mock(return_value=[])
         BaseRound._create_edges = mock_create_edges
         BaseRound._create_background = mock_create_background
         BaseRound._create_bricks = mock_create_bricks
@@ -105,3 +107,178 @@ class TestBaseRound(TestCase):
             base_round.brick_destroyed()
 
         self.assertFalse(base_round.complete)
+
+    @patch('arkanoid.rounds.base.pygame')
+    def test_round_progress(self, mock_pygame):
+        bricks = [Mock(colour=BrickColour.blue) for _ in range(4)]
+        bricks.append(Mock(colour=BrickColour.gold))
+        base_round = self._create_round(bricks)
+
+        self.assertEqual(base_round.bricks_remaining, 4)
+        self.assertEqual(base_round.percent_cleared, 0)
+
+        base_round.brick_destroyed()
+
+        self.assertEqual(base_round.bricks_remaining, 3)
+        self.assertEqual(base_round.percent_cleared, 25)
+        self.assertFalse(base_round.complete)
+
+        for _ in range(3):
+            base_round.brick_destroyed()
+
+        self.assertEqual(base_round.bricks_remaining, 0)
+        self.assertEqual(base_round.percent_cleared, 100)
+        self.assertTrue(base_round.complete)
+
+    @patch('arkanoid.rounds.base.pygame')
+    def test_static_layer_holds_side_edges_and_visible_bricks(self,
+                                                              mock_pygame):
+        bricks = [Mock(visible=True), Mock(visible=False)]
+        base_round = self._create_round(bricks)
+
+        layer = base_round.static_layer
+
+        self.assertIs(layer, base_round.background.copy.return_value)
+        layer.blit.assert_has_calls([
+            call(base_round.edges.left.image,
+                 base_round.edges.left.rect.move.return_value),
+            call(base_round.edges.right.image,
+                 base_round.edges.right.rect.move.return_value),
+            call(bricks[0].image, bricks[0].rect.move.return_value)])
+        self.assertEqual(layer.blit.call_count, 3)
+        bricks[0].rect.move.assert_called_once_with(0, -150)
+
+    @patch('arkanoid.rounds.base.pygame')
+    def test_static_layer_built_once(self, mock_pygame):
+        base_round = self._create_round([Mock(visible=True)])
+
+        self.assertIs(base_round.static_layer, base_round.static_layer)
+        base_round.background.copy.assert_called_once_with()
+
+    @patch('arkanoid.rounds.base.pygame')
+    def test_animate_brick_lifts_brick_from_static_layer(self, mock_pygame):
+        brick = Mock(visible=True)
+        base_round = self._create_round([brick])
+        layer = base_round.static_layer
+        layer.blit.reset_mock()
+
+        base_round.animate_brick(brick)
+
+        brick.animate.assert_called_once_with()
+        self.assertEqual(base_round.animating_bricks, [brick])
+        area = brick.rect.move.return_value
+        layer.blit.assert_called_once_with(base_round.background, area, area)
+
+    @patch('arkanoid.rounds.base.pygame')
+    def test_update_returns_animated_brick_to_static_layer(self,
+                                                           mock_pygame):
+        brick = Mock(visible=True, animating=True)
+        base_round = self._create_round([brick])
+        layer = base_round.static_layer
+        base_round.animate_brick(brick)
+        layer.blit.reset_mock()
+
+        base_round.update()
+
+        brick.update.assert_called_once_with()
+        self.assertEqual(base_round.animating_bricks, [brick])
+        layer.blit.assert_not_called()
+
+        brick.animating = False
+        base_round.update()
+
+        self.assertEqual(base_round.animating_bricks, [])
+        layer.blit.assert_called_once_with(brick.image,
+                                           brick.rect.move.return_value)
+
+    @patch('arkanoid.rounds.base.pygame')
+    def test_brick_destroyed_erases_brick_from_static_layer(self,
+                                                            mock_pygame):
+        brick = Mock(visible=True)
+        base_round = self._create_round([brick])
+        layer = base_round.static_layer
+        base_round.animate_brick(brick)
+        layer.blit.reset_mock()
+
+        base_round.brick_destroyed(brick)
+
+        self.assertEqual(base_round.animating_bricks, [])
+        area = brick.rect.move.return_value
+        layer.blit.assert_called_once_with(base_round.background, area, area)
+
+    @patch('arkanoid.rounds.base.pygame')
+    def test_brick_grid_indexes_visible_bricks(self, mock_pygame):
+        bricks = [Mock(visible=True, rect=pygame.Rect(15, 165, 42, 21)),
+                  Mock(visible=True, rect=pygame.Rect(57, 186, 42, 21)),
+                  Mock(visible=False, rect=pygame.Rect(99, 165, 42, 21))]
+        base_round = self._create_round(bricks)
+        base_round.edges.left.rect = pygame.Rect(0, 150, 15, 500)
+        base_round.edges.top.rect = pygame.Rect(15, 150, 570, 15)
+
+        grid = base_round.brick_grid
+
+        self.assertIs(grid, base_round.brick_grid)
+        self.assertEqual(len(grid), 2)
+        self.assertEqual(grid.query(pygame.Rect(20, 170, 10, 10)),
+                         [bricks[0]])
+        self.assertEqual(grid.query(pygame.Rect(60, 190, 10, 10)),
+                         [bricks[1]])
+        self.assertEqual(grid.query(pygame.Rect(100, 170, 10, 10)), [])
+
+    @patch('arkanoid.rounds.base.pygame')
+    def test_brick_destroyed_removes_brick_from_grid(self, mock_pygame):
+        brick = Mock(visible=True, rect=pygame.Rect(15, 165, 42, 21))
+        base_round = self._create_round([brick])
+        base_round.edges.left.rect = pygame.Rect(0, 150, 15, 500)
+        base_round.edges.top.rect = pygame.Rect(15, 150, 570, 15)
+        grid = base_round.brick_grid
+
+        base_round.brick_destroyed(brick)
+
+        self.assertNotIn(brick, grid)
+
+    @patch('arkanoid.rounds.base.pygame')
+    def test_lowest_brick_in_columns(self, mock_pygame):
+        bricks = [Mock(visible=True, rect=pygame.Rect(15, 165, 42, 21)),
+                  Mock(visible=True, rect=pygame.Rect(15, 186, 42, 21)),
+                  Mock(visible=True, rect=pygame.Rect(57, 207, 42, 21)),
+                  Mock(visible=False, rect=pygame.Rect(99, 165, 42, 21))]
+        base_round = self._create_round(bricks)
+        base_round.edges.left.rect = pygame.Rect(0, 150, 15, 500)
+
+        self.assertIs(base_round.lowest_brick(20, 30), bricks[1])
+        self.assertIs(base_round.lowest_brick(50, 60), bricks[2])
+        self.assertIs(base_round.lowest_brick(60, 70), bricks[2])
+        self.assertIsNone(base_round.lowest_brick(100, 110))
+
+    @patch('arkanoid.rounds.base.pygame')
+    def test_brick_destroyed_removes_brick_from_columns(self, mock_pygame):
+        bricks = [Mock(visible=True, rect=pygame.Rect(15, 165, 42, 21)),
+                  Mock(visible=True, rect=pygame.Rect(15, 186, 42, 21))]
+        base_round = self._create_round(bricks)
+        base_round.edges.left.rect = pygame.Rect(0, 150, 15, 500)
+        base_round.lowest_brick(20, 30)
+
+        base_round.brick_destroyed(bricks[1])
+
+        self.assertIs(base_round.lowest_brick(20, 30), bricks[0])
+
+        base_round.brick_destroyed(bricks[0])
+
+        self.assertIsNone(base_round.lowest_brick(20, 30))
+
+    @patch('arkanoid.rounds.base.pygame')
+    def test_uses_supplied_rng(self, mock_pygame):
+        self._setup_mocks(mock_pygame)
+        rng = Mock()
+
+        base_round = BaseRound(top_offset=150, rng=rng)
+
+        self.assertIs(base_round.rng, rng)
+
+    def _create_round(self, bricks):
+        BaseRound._create_edges = Mock()
+        BaseRound._create_background = Mock()
+        BaseRound._create_bricks = Mock(return_value=bricks)
+
+        return BaseRound(top_offset=150)
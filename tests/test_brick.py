@@ -103,3 +103,36 @@ class TestBrick(TestCase):
         gold_brick.collision_count += 100
         self.assertTrue(gold_brick.visible)
 
+    @patch('arkanoid.sprites.brick.load_png_sequence')
+    @patch('arkanoid.sprites.brick.load_png')
+    def test_hits_remaining(self, mock_load_png, mock_load_png_sequence):
+
+        mock_load_png.return_value = Mock(), Mock()
+
+        silver_brick = Brick(BrickColour.silver, 1, powerup_cls=Mock())
+        gold_brick = Brick(BrickColour.gold, 1, powerup_cls=Mock())
+
+        self.assertEqual(silver_brick.hits_remaining, 2)
+        silver_brick.collision_count += 1
+        self.assertEqual(silver_brick.hits_remaining, 1)
+        silver_brick.collision_count += 1
+        self.assertEqual(silver_brick.hits_remaining, 0)
+        self.assertIsNone(gold_brick.hits_remaining)
+
+
+    @patch('arkanoid.sprites.brick.load_png_sequence')
+    @patch('arkanoid.sprites.brick.load_png')
+    def test_animating(self, mock_load_png, mock_load_png_sequence):
+
+        mock_load_png.return_value = Mock(), Mock()
+        mock_load_png_sequence.return_value = ((Mock(), Mock()), )
+
+        red_brick = Brick(BrickColour.red, 1, powerup_cls=Mock())
+
+        self.assertFalse(red_brick.animating)
+        red_brick.animate()
+        self.assertTrue(red_brick.animating)
+        red_brick.update()
+        self.assertTrue(red_brick.animating)
+        red_brick.update()
+        self.assertFalse(red_brick.animating)
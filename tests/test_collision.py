@@ -0,0 +1,325 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+import pygame
+
+from arkanoid.collision import (box_overlaps,
+                                CollisionWorld,
+                                masks_overlap,
+                                path_rect,
+                                SortAndSweep,
+                                SpatialGrid,
+                                sweep)
+
+
+class TestSpatialGrid(TestCase):
+
+    def setUp(self):
+        self.grid = SpatialGrid((40, 20), origin=(10, 100))
+
+    def _sprite(self, x, y, width=40, height=20):
+        return Mock(rect=pygame.Rect(x, y, width, height))
+
+    def test_query_finds_sprite_in_cell(self):
+        sprite = self._sprite(50, 120)
+        self.grid.add(sprite)
+
+        self.assertEqual(self.grid.query(pygame.Rect(60, 125, 5, 5)),
+                         [sprite])
+
+    def test_query_ignores_other_cells(self):
+        self.grid.add(self._sprite(50, 120))
+
+        self.assertEqual(self.grid.query(pygame.Rect(95, 125, 5, 5)), [])
+        self.assertEqual(self.grid.query(pygame.Rect(60, 145, 5, 5)), [])
+
+    def test_query_spanning_cells(self):
+        sprites = [self._sprite(10, 100), self._sprite(50, 100),
+                   self._sprite(10, 120), self._sprite(50, 120),
+                   self._sprite(90, 100)]
+        for sprite in sprites:
+            self.grid.add(sprite)
+
+        found = self.grid.query(pygame.Rect(45, 115, 10, 10))
+
+        self.assertEqual(found, sprites[:4])
+
+    def test_sprite_spanning_cells_returned_once(self):
+        sprite = self._sprite(30, 110)
+        self.grid.add(sprite)
+
+        self.assertEqual(self.grid.query(pygame.Rect(10, 100, 80, 40)),
+                         [sprite])
+
+    def test_remove(self):
+        sprite = self._sprite(50, 120)
+        self.grid.add(sprite)
+
+        self.grid.remove(sprite)
+        self.grid.remove(sprite)
+
+        self.assertNotIn(sprite, self.grid)
+        self.assertEqual(len(self.grid), 0)
+        self.assertEqual(self.grid.query(sprite.rect), [])
+
+    def test_add_again_reindexes_moved_sprite(self):
+        sprite = self._sprite(50, 120)
+        self.grid.add(sprite)
+
+        sprite.rect.topleft = 130, 160
+        self.grid.add(sprite)
+
+        self.assertEqual(len(self.grid), 1)
+        self.assertEqual(self.grid.query(pygame.Rect(50, 120, 5, 5)), [])
+        self.assertEqual(self.grid.query(pygame.Rect(135, 165, 5, 5)),
+                         [sprite])
+
+    def test_clear(self):
+        self.grid.add(self._sprite(50, 120))
+
+        self.grid.clear()
+
+        self.assertEqual(list(self.grid), [])
+
+
+class TestCollisionWorld(TestCase):
+
+    def setUp(self):
+        self.world = CollisionWorld()
+
+    def _sprite(self, x, y, visible=True):
+        return Mock(rect=pygame.Rect(x, y, 40, 20), visible=visible)
+
+    def test_nearby_includes_visible_sprites(self):
+        sprite, hidden = self._sprite(0, 0), self._sprite(100, 0, False)
+        self.world.add(sprite)
+        self.world.add(hidden)
+
+        self.assertEqual(self.world.nearby(pygame.Rect(300, 300, 5, 5)),
+                         [sprite])
+
+    def test_nearby_queries_grids(self):
+        grid = SpatialGrid((40, 20))
+        near, far = self._sprite(0, 0), self._sprite(200, 200)
+        grid.add(near)
+        grid.add(far)
+        self.world.add_grid(grid)
+
+        self.assertEqual(self.world.nearby(pygame.Rect(5, 5, 5, 5)), [near])
+
+    def test_collision_data(self):
+        sprite, bounce, on_collide = self._sprite(0, 0), Mock(), Mock()
+        self.world.add(sprite, bounce_strategy=bounce, speed_adjust=0.5,
+                       on_collide=on_collide)
+
+        self.assertEqual(self.world.collision_data(sprite),
+                         (bounce, 0.5, on_collide))
+
+    def test_collision_data_from_grid(self):
+        grid, sprite, on_collide = (SpatialGrid((40, 20)), self._sprite(0, 0),
+                                    Mock())
+        grid.add(sprite)
+        self.world.add_grid(grid, speed_adjust=0.1, on_collide=on_collide)
+
+        self.assertIn(sprite, self.world)
+        self.assertEqual(self.world.collision_data(sprite),
+                         (None, 0.1, on_collide))
+
+    def test_collision_data_unknown_sprite(self):
+        with self.assertRaises(KeyError):
+            self.world.collision_data(self._sprite(0, 0))
+
+    def test_remove(self):
+        sprite = self._sprite(0, 0)
+        self.world.add(sprite)
+
+        self.world.remove(sprite)
+        self.world.remove(sprite)
+
+        self.assertNotIn(sprite, self.world)
+        self.assertEqual(len(self.world), 0)
+
+    def test_precise(self):
+        sprite, other = self._sprite(0, 0), self._sprite(100, 0)
+        self.world.add(sprite, precise=True)
+        self.world.add(other)
+
+        self.assertTrue(self.world.is_precise(sprite))
+        self.assertFalse(self.world.is_precise(other))
+
+        self.world.remove(sprite)
+
+        self.assertFalse(self.world.is_precise(sprite))
+
+    def test_clear(self):
+        grid = SpatialGrid((40, 20))
+        grid.add(self._sprite(0, 0))
+        self.world.add(self._sprite(100, 0))
+        self.world.add_grid(grid)
+
+        self.world.clear()
+
+        self.assertEqual(len(self.world), 0)
+        self.assertEqual(self.world.nearby(pygame.Rect(0, 0, 5, 5)), [])
+
+
+class TestMasksOverlap(TestCase):
+
+    def _sprite(self, x, y, mask):
+        return Mock(rect=pygame.Rect((x, y), mask.get_size()), mask=mask)
+
+    def _circle(self):
+        # A 10 x 10 circle, with its corners clear.
+        surface = pygame.Surface((10, 10), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (255, 255, 255), (5, 5), 5)
+        return pygame.mask.from_surface(surface)
+
+    def test_overlapping(self):
+        ball = self._sprite(0, 0, self._circle())
+        other = self._sprite(5, 5, self._circle())
+
+        self.assertTrue(masks_overlap(ball, other))
+
+    def test_only_corners_of_rects_overlapping(self):
+        ball = self._sprite(0, 0, self._circle())
+        other = self._sprite(8, 8, self._circle())
+
+        self.assertTrue(ball.rect.colliderect(other.rect))
+        self.assertFalse(masks_overlap(ball, other))
+
+    def test_no_mask(self):
+        ball = self._sprite(0, 0, self._circle())
+        other = Mock(rect=pygame.Rect(8, 8, 10, 10), mask=None)
+
+        self.assertTrue(masks_overlap(ball, other))
+
+
+class TestSortAndSweep(TestCase):
+
+    def setUp(self):
+        self.broadphase = SortAndSweep(margin=2)
+
+    def _sprite(self, x, y, visible=True):
+        return Mock(rect=pygame.Rect(x, y, 20, 20), visible=visible)
+
+    def test_movers_paired(self):
+        first, second, far = (self._sprite(0, 0), self._sprite(15, 10),
+                              self._sprite(200, 0))
+        self.broadphase.rebuild([far, second, first])
+
+        self.assertEqual(self.broadphase.candidates(first), [second])
+        self.assertEqual(self.broadphase.candidates(second), [first])
+        self.assertEqual(self.broadphase.candidates(far), [])
+        self.assertEqual(len(self.broadphase.pairs()), 1)
+
+    def test_paired_within_margin(self):
+        first, near, apart = (self._sprite(0, 0), self._sprite(21, 0),
+                              self._sprite(0, 22))
+        self.broadphase.rebuild([first, near, apart])
+
+        self.assertEqual(self.broadphase.candidates(first), [near])
+
+    def test_overlapping_x_but_not_y(self):
+        first, below = self._sprite(0, 0), self._sprite(5, 100)
+        self.broadphase.rebuild([first, below])
+
+        self.assertEqual(self.broadphase.candidates(first), [])
+
+    def test_static_paired_with_movers_only(self):
+        wall, brick, other_brick = (Mock(rect=pygame.Rect(0, 0, 10, 800)),
+                                    self._sprite(10, 100),
+                                    self._sprite(26, 100))
+        mover = self._sprite(5, 110)
+        self.broadphase.set_static([other_brick, brick, wall])
+        self.broadphase.rebuild([mover])
+
+        self.assertEqual(set(self.broadphase.candidates(mover)),
+                         {wall, brick, other_brick})
+        self.assertTrue(all(pair[0] is mover
+                            for pair in self.broadphase.pairs()))
+
+    def test_invisible_static_left_out(self):
+        brick, mover = self._sprite(0, 0, visible=False), self._sprite(5, 5)
+        self.broadphase.set_static([brick])
+        self.broadphase.rebuild([mover])
+
+        self.assertEqual(self.broadphase.candidates(mover), [])
+
+    def test_swept_at_first_query(self):
+        first, second = self._sprite(0, 0), self._sprite(200, 0)
+        self.broadphase.rebuild([first, second])
+
+        second.rect.topleft = 10, 0
+
+        self.assertEqual(self.broadphase.candidates(first), [second])
+
+    def test_contains(self):
+        mover, brick = self._sprite(0, 0), self._sprite(50, 0)
+        self.broadphase.set_static([brick])
+        self.broadphase.rebuild([mover])
+
+        self.assertIn(mover, self.broadphase)
+        self.assertNotIn(brick, self.broadphase)
+
+
+class TestSweep(TestCase):
+
+    def test_hits_side(self):
+        impact = sweep((0, 0, 10, 10), 20, 0, pygame.Rect(15, 0, 5, 10))
+
+        self.assertEqual(impact, (0.25, (-1, 0)))
+
+    def test_hits_thin_rect_passed_over_in_one_move(self):
+        impact = sweep((0, 0, 10, 10), 0, -40, pygame.Rect(0, -20, 10, 2))
+
+        self.assertEqual(impact, (0.45, (0, 1)))
+
+    def test_hits_corner(self):
+        impact = sweep((0, 0, 10, 10), 20, 20, pygame.Rect(15, 15, 5, 5))
+
+        self.assertEqual(impact, (0.25, (-1, -1)))
+
+    def test_touching_and_moving_towards(self):
+        impact = sweep((0, 0, 10, 10), 0, 20, pygame.Rect(0, 10, 10, 5))
+
+        self.assertEqual(impact, (0, (0, -1)))
+
+    def test_touching_and_moving_away(self):
+        impact = sweep((0, 0, 10, 10), 0, -20, pygame.Rect(0, 10, 10, 5))
+
+        self.assertIsNone(impact)
+
+    def test_misses(self):
+        self.assertIsNone(
+            sweep((0, 0, 10, 10), 20, 0, pygame.Rect(15, 10, 5, 5)))
+        self.assertIsNone(
+            sweep((0, 0, 10, 10), 4, 0, pygame.Rect(15, 0, 5, 10)))
+
+    def test_already_overlapping(self):
+        self.assertIsNone(
+            sweep((0, 0, 10, 10), 5, 5, pygame.Rect(5, 5, 10, 10)))
+
+
+class TestPathRect(TestCase):
+
+    def test_covers_fractional_box_over_movement(self):
+        rect = path_rect((53.385, 576.855, 10, 10), -1.03, -5.91)
+
+        self.assertEqual(rect, pygame.Rect(52, 570, 12, 17))
+
+    def test_stationary_box(self):
+        self.assertEqual(path_rect((10, 20, 10, 10)),
+                         pygame.Rect(10, 20, 10, 10))
+        self.assertEqual(path_rect((10.5, 20.5, 10, 10)),
+                         pygame.Rect(10, 20, 11, 11))
+
+
+class TestBoxOverlaps(TestCase):
+
+    def test_overlapping_by_fraction(self):
+        self.assertTrue(box_overlaps((52.4, 570.9, 10, 10),
+                                     pygame.Rect(22, 550, 43, 21)))
+
+    def test_touching_edge(self):
+        self.assertFalse(box_overlaps((52.4, 571, 10, 10),
+                                      pygame.Rect(22, 550, 43, 21)))
@@ -0,0 +1,55 @@
+import os
+from unittest import TestCase
+
+import pygame
+
+from arkanoid.utils import ptext
+from arkanoid.utils.digits import (DigitAtlas,
+                                   digit_atlas)
+
+FONT = os.path.join(os.path.dirname(__file__), '..', 'arkanoid', 'data',
+                    'fonts', 'generation.ttf')
+
+
+class TestDigitAtlas(TestCase):
+
+    def setUp(self):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    def test_size_matches_font(self):
+        atlas = DigitAtlas(FONT, 20, (255, 255, 255))
+
+        self.assertEqual(atlas.size('1234567890'),
+                         ptext.getfont(FONT, 20).size('1234567890'))
+
+    def test_draw_right_aligned(self):
+        atlas = DigitAtlas(FONT, 20, (255, 255, 255))
+        surf = pygame.Surface((150, 20))
+        width, height = atlas.size('100')
+
+        rect = atlas.draw('100', surf, (150, 0))
+
+        self.assertEqual(rect, pygame.Rect(150 - width, 0, width, height))
+
+    def test_draw_matches_rendered_text(self):
+        atlas = DigitAtlas(FONT, 20, (255, 255, 255))
+        expected = pygame.Surface((150, 20))
+        expected.blit(ptext.getfont(FONT, 20).render(
+            '500', True, (255, 255, 255)), (150 - atlas.size('500')[0], 0))
+        surf = pygame.Surface((150, 20))
+
+        atlas.draw('500', surf, (150, 0))
+
+        self.assertEqual(pygame.image.tobytes(surf, 'RGB'),
+                         pygame.image.tobytes(expected, 'RGB'))
+
+    def test_draw_rejects_non_digits(self):
+        atlas = DigitAtlas(FONT, 20, (255, 255, 255))
+
+        with self.assertRaises(KeyError):
+            atlas.draw('-1', pygame.Surface((150, 20)), (150, 0))
+
+    def test_digit_atlas_shared(self):
+        self.assertIs(digit_atlas(FONT, 20, (255, 255, 255)),
+                      digit_atlas(FONT, 20, (255, 255, 255)))
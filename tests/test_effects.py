@@ -0,0 +1,142 @@
+from unittest import TestCase
+from unittest.mock import (Mock,
+                           patch)
+
+from arkanoid.effects import (Effect,
+                              Effects,
+                              ease_in,
+                              hold,
+                              linear)
+
+
+class TestEffect(TestCase):
+
+    def test_alpha_follows_easing(self):
+        effect = Effect((255, 255, 255), 0, 100, duration=4, easing=linear)
+        alphas = []
+
+        for _ in range(4):
+            alphas.append(effect.alpha)
+            effect.advance()
+
+        self.assertEqual(alphas, [25, 50, 75, 100])
+
+    def test_alpha_follows_ease_in(self):
+        effect = Effect((255, 255, 255), 0, 100, duration=2, easing=ease_in)
+
+        self.assertEqual(effect.alpha, 25)
+
+    def test_hold_keeps_start_alpha(self):
+        effect = Effect((255, 255, 255), 128, 0, duration=10, easing=hold)
+
+        for _ in range(9):
+            effect.advance()
+
+        self.assertEqual(effect.alpha, 128)
+
+    def test_finished_after_duration(self):
+        effect = Effect((255, 255, 255), 128, 0, duration=2)
+
+        effect.advance()
+        self.assertFalse(effect.finished)
+        effect.advance()
+        self.assertTrue(effect.finished)
+
+    def test_persistent_effect_never_finishes(self):
+        effect = Effect((0, 0, 0), 0, 255, duration=2)
+        effect.persist = True
+
+        for _ in range(5):
+            effect.advance()
+
+        self.assertFalse(effect.finished)
+        self.assertEqual(effect.alpha, 255)
+
+    def test_no_duration_never_finishes(self):
+        effect = Effect((0, 0, 0), 64, 64)
+
+        for _ in range(5):
+            effect.advance()
+
+        self.assertFalse(effect.finished)
+        self.assertEqual(effect.alpha, 64)
+
+
+@patch('arkanoid.effects.pygame')
+class TestEffects(TestCase):
+
+    def test_overlays_allocated_up_front(self, mock_pygame):
+        Effects(Mock(), Mock())
+
+        self.assertEqual(mock_pygame.Surface.call_count, 2)
+
+    def test_draw_does_nothing_when_inactive(self, mock_pygame):
+        mock_screen, mock_renderer = Mock(), Mock()
+        effects = Effects(mock_screen, Mock(), mock_renderer)
+
+        effects.update()
+        effects.draw()
+
+        self.assertFalse(effects.active)
+        mock_screen.blit.assert_not_called()
+        mock_renderer.invalidate.assert_not_called()
+        mock_renderer.mark_dirty.assert_not_called()
+
+    def test_flash_draws_overlay_for_duration(self, mock_pygame):
+        mock_screen, mock_renderer = Mock(), Mock()
+        mock_overlay = mock_pygame.Surface.return_value.convert.return_value
+        effects = Effects(mock_screen, Mock(), mock_renderer)
+        area = mock_pygame.Rect.return_value
+
+        effects.flash(duration=3)
+
+        for _ in range(5):
+            effects.update()
+            effects.draw()
+
+        self.assertFalse(effects.active)
+        self.assertEqual(mock_screen.blit.call_count, 3)
+        mock_screen.blit.assert_called_with(mock_overlay, area)
+        mock_overlay.set_alpha.assert_called_with(128)
+        self.assertEqual(mock_pygame.Surface.call_count, 2)
+
+    def test_area_rebuilt_after_overlay_drawn(self, mock_pygame):
+        mock_renderer = Mock()
+        effects = Effects(Mock(), Mock(), mock_renderer)
+        area = mock_pygame.Rect.return_value
+
+        effects.flash(duration=1)
+        effects.update()
+        effects.draw()
+
+        mock_renderer.invalidate.assert_not_called()
+        mock_renderer.mark_dirty.assert_called_once_with(area)
+
+        effects.update()
+
+        mock_renderer.invalidate.assert_called_once_with(area)
+
+        effects.update()
+
+        self.assertEqual(mock_renderer.invalidate.call_count, 1)
+
+    def test_tint_remains_until_removed(self, mock_pygame):
+        mock_screen = Mock()
+        effects = Effects(mock_screen, Mock())
+
+        tint = effects.tint((255, 0, 0))
+        for _ in range(20):
+            effects.draw()
+
+        self.assertTrue(effects.active)
+        effects.remove(tint)
+        self.assertFalse(effects.active)
+
+    def test_clear_removes_effects(self, mock_pygame):
+        effects = Effects(Mock(), Mock())
+        effects.flash()
+        effects.fade()
+
+        effects.clear()
+
+        self.assertFalse(effects.active)
@@ -1,4 +1,6 @@
 from unittest import TestCase
+from unittest.mock import (Mock,
+                           patch)
 
 from arkanoid.event import receiver
 
@@ -56,3 +58,42 @@ class TestEventReceiver(TestCase):
     def test_unregister_handler_raises_exception_when_no_handler(self):
         with self.assertRaises(AssertionError):
             receiver.unregister_handler()
+
+    @patch('arkanoid.event.pygame')
+    def test_receive_dispatches_events(self, mock_pygame):
+        handler = Mock()
+        event = Mock(type='receive_event')
+        mock_pygame.event.get.return_value = [event]
+        receiver._handlers['receive_event'].append(handler)
+
+        received = receiver.receive()
+
+        self.assertTrue(received)
+        handler.assert_called_once_with(event)
+        mock_pygame.event.wait.assert_not_called()
+        receiver.unregister_handler(handler)
+
+    @patch('arkanoid.event.pygame')
+    def test_receive_waits_for_event_with_timeout(self, mock_pygame):
+        handler = Mock()
+        event = Mock(type='receive_event')
+        mock_pygame.event.wait.return_value = event
+        mock_pygame.event.get.return_value = []
+        receiver._handlers['receive_event'].append(handler)
+
+        received = receiver.receive(timeout=100)
+
+        self.assertTrue(received)
+        mock_pygame.event.wait.assert_called_once_with(100)
+        handler.assert_called_once_with(event)
+        receiver.unregister_handler(handler)
+
+    @patch('arkanoid.event.pygame')
+    def test_receive_returns_false_when_wait_times_out(self, mock_pygame):
+        mock_pygame.event.wait.return_value = Mock(
+            type=mock_pygame.NOEVENT)
+        mock_pygame.event.get.return_value = []
+
+        received = receiver.receive(timeout=100)
+
+        self.assertFalse(received)
@@ -0,0 +1,78 @@
+from unittest import TestCase
+from unittest.mock import (Mock,
+                           patch)
+
+from arkanoid.hud import HudValue
+
+
+@patch('arkanoid.hud.digit_atlas')
+@patch('arkanoid.hud.ptext')
+@patch('arkanoid.hud.pygame')
+class TestHudValue(TestCase):
+
+    def test_display_draws_digits_from_atlas(self, mock_pygame, mock_ptext,
+                                             mock_digit_atlas):
+        mock_screen, mock_renderer = Mock(), Mock()
+        hud_value = HudValue(mock_screen, (590, 25), 'font.ttf', 20,
+                             (255, 255, 255), renderer=mock_renderer)
+        mock_surf = mock_pygame.Surface.return_value.convert_alpha.return_value
+        mock_rect = mock_surf.get_rect.return_value
+
+        hud_value.display(100)
+
+        mock_digit_atlas.assert_called_once_with('font.ttf', 20,
+                                                 (255, 255, 255))
+        mock_digit_atlas.return_value.draw.assert_called_once_with(
+            '100', mock_surf, (mock_rect.width, 0))
+        mock_ptext.draw.assert_not_called()
+        mock_screen.blit.assert_called_once_with(mock_surf, mock_rect)
+        mock_renderer.mark_dirty.assert_called_once_with(mock_rect)
+
+    def test_display_draws_other_text_with_ptext(self, mock_pygame,
+                                                 mock_ptext, mock_digit_atlas):
+        hud_value = HudValue(Mock(), (590, 25), 'font.ttf', 20,
+                             (255, 255, 255))
+        mock_surf = mock_pygame.Surface.return_value.convert_alpha.return_value
+
+        hud_value.display(-1)
+
+        mock_ptext.draw.assert_called_once_with(
+            '-1', topright=(mock_surf.get_rect.return_value.width, 0),
+            surf=mock_surf, fontname='font.ttf', fontsize=20,
+            color=(255, 255, 255))
+        mock_digit_atlas.return_value.draw.assert_not_called()
+
+    def test_display_allocates_surface_once(self, mock_pygame, mock_ptext,
+                                            mock_digit_atlas):
+        hud_value = HudValue(Mock(), (590, 25), 'font.ttf', 20,
+                             (255, 255, 255))
+
+        hud_value.display(100)
+        hud_value.display(200)
+
+        mock_pygame.Surface.assert_called_once_with((150, 20))
+
+    def test_display_unchanged_value_not_drawn(self, mock_pygame, mock_ptext,
+                                               mock_digit_atlas):
+        mock_screen = Mock()
+        hud_value = HudValue(mock_screen, (590, 25), 'font.ttf', 20,
+                             (255, 255, 255))
+
+        hud_value.display(100)
+        hud_value.display(100)
+
+        self.assertEqual(mock_digit_atlas.return_value.draw.call_count, 1)
+        self.assertEqual(mock_screen.blit.call_count, 1)
+
+    def test_display_changed_value_drawn(self, mock_pygame, mock_ptext,
+                                         mock_digit_atlas):
+        mock_screen = Mock()
+        hud_value = HudValue(mock_screen, (590, 25), 'font.ttf', 20,
+                             (255, 255, 255))
+
+        hud_value.display(100)
+        hud_value.display(200)
+
+        mock_draw = mock_digit_atlas.return_value.draw
+        self.assertEqual(mock_draw.call_count, 2)
+        self.assertEqual(mock_draw.call_args[0][0], '200')
@@ -0,0 +1,46 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from arkanoid.utils.manifest import (build,
+                                     write)
+from arkanoid.utils.util import ASSET_MANIFEST
+
+
+class TestManifest(TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.graphics_dir = self._tmp.name
+        for filename in ('ball.png', 'paddle_wide_1.png', 'paddle_wide_2.png',
+                         'paddle_wide_3.png', 'door_1.png', 'door_3.png',
+                         'enemy_cone_1.png', 'notes_1.txt'):
+            open(os.path.join(self.graphics_dir, filename), 'w').close()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_build_counts_frames(self):
+        manifest = build(self.graphics_dir)
+
+        self.assertEqual(manifest['sequences'], {
+            'paddle_wide': 3,
+            'door': 1,
+            'enemy_cone': 1,
+        })
+
+    def test_write(self):
+        manifest_path = os.path.join(self.graphics_dir, 'manifest.json')
+
+        manifest = write(self.graphics_dir, manifest_path)
+
+        with open(manifest_path) as file:
+            self.assertEqual(json.load(file), manifest)
+
+    def test_asset_manifest_is_up_to_date(self):
+        with open(ASSET_MANIFEST) as file:
+            manifest = json.load(file)
+
+        self.assertEqual(manifest, build(),
+                         'Run python -m arkanoid.utils.manifest')
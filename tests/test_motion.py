@@ -0,0 +1,44 @@
+from unittest import TestCase
+
+import pygame
+
+from arkanoid.sprites.motion import FloatPosition
+
+
+class TestFloatPosition(TestCase):
+
+    def test_move_accumulates_fractions(self):
+        pos, rect = FloatPosition(), pygame.Rect(100, 100, 10, 10)
+
+        for _ in range(4):
+            rect = pos.move(rect, 0.3, -0.6)
+
+        self.assertEqual(rect.topleft, (101, 98))
+        self.assertAlmostEqual(pos.x, 101.2)
+        self.assertAlmostEqual(pos.y, 97.6)
+
+    def test_move_returns_new_rect(self):
+        pos, rect = FloatPosition(), pygame.Rect(100, 100, 10, 10)
+
+        moved = pos.move(rect, 2.5, 0)
+
+        self.assertEqual(rect.topleft, (100, 100))
+        self.assertEqual(moved.topleft, (102, 100))
+        self.assertEqual(moved.size, (10, 10))
+
+    def test_picks_up_rect_moved_elsewhere(self):
+        pos, rect = FloatPosition(), pygame.Rect(100, 100, 10, 10)
+        rect = pos.move(rect, 0.4, 0.4)
+
+        rect.topleft = 300, 200
+        rect = pos.move(rect, 0.4, 0.4)
+
+        self.assertEqual(pos.resolve(rect), (300.4, 200.4))
+
+    def test_place(self):
+        pos, rect = FloatPosition(), pygame.Rect(0, 0, 10, 10)
+
+        pos.place(rect, 20.7, 30.2)
+
+        self.assertEqual(rect.topleft, (21, 30))
+        self.assertEqual(pos.resolve(rect), (20.7, 30.2))
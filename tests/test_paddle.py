@@ -158,6 +158,40 @@ class TestPaddle(TestCase):
         self.assertEqual(angles[4], 295)
         self.assertEqual(angles[5], 320)
 
+    def test_bounce_strategy_ball_overlapping_two_segments(self):
+        paddle = pygame.Rect(100, 600, 60, 15)
+        ball = pygame.Rect(127, 602, 5, 5)
+
+        angle = Paddle.bounce_strategy(paddle, ball)
+
+        self.assertEqual(round(math.degrees(angle)), 260)
+
+    def test_bounce_strategy_ball_beside_paddle(self):
+        paddle = pygame.Rect(100, 600, 60, 15)
+        ball = pygame.Rect(160, 602, 5, 5)
+
+        angle = Paddle.bounce_strategy(paddle, ball)
+
+        self.assertEqual(round(math.degrees(angle)), 320)
+
+    def test_smooth_bounce_strategy(self):
+        paddle = pygame.Rect(100, 600, 60, 15)
+
+        def angle_at(centre):
+            ball = pygame.Rect(0, 602, 6, 6)
+            ball.centerx = centre
+            return math.degrees(Paddle.smooth_bounce_strategy(paddle, ball))
+
+        # The segment angles at the segment centres.
+        self.assertAlmostEqual(angle_at(105), 220)
+        self.assertAlmostEqual(angle_at(125), 260)
+        self.assertAlmostEqual(angle_at(155), 320)
+        # Interpolated between them.
+        self.assertAlmostEqual(angle_at(130), 270)
+        # Clamped beyond the outer segment centres.
+        self.assertAlmostEqual(angle_at(95), 220)
+        self.assertAlmostEqual(angle_at(170), 320)
+
 
 class TestLaserState(TestCase):
 
@@ -415,17 +449,19 @@ class TestLaserBullet(TestCase):
         bullet = LaserBullet(mock_game, Mock())
         bullet.release()
         mock_rect.move.return_value = mock_rect
-        visible_bricks = [Mock()]
-        mock_game.round.bricks = visible_bricks
-        mock_pygame.sprite.spritecollide.side_effect = [[], visible_bricks]
+        mock_rect.top = 200
+        mock_brick = Mock()
+        mock_brick.rect.bottom = 201
+        mock_game.round.lowest_brick.return_value = mock_brick
+        mock_pygame.sprite.spritecollide.side_effect = [[]]
 
         bullet.update()
 
         mock_rect.move.assert_called_once_with(0, -15)
-        mock_pygame.sprite.spritecollide. \
-            assert_has_calls([call(bullet, [mock_game.round.edges.top], False),
-                              call(bullet, ANY, False)])
-        mock_brick = visible_bricks[0]
+        mock_pygame.sprite.spritecollide.assert_called_once_with(
+            bullet, [mock_game.round.edges.top], False)
+        mock_game.round.lowest_brick.assert_called_once_with(mock_rect.left,
+                                                             mock_rect.right)
         self.assertEqual(mock_brick.value, 0)
         self.assertIsNone(mock_brick.powerup_cls)
         mock_game.on_brick_collide.assert_called_once_with(mock_brick, bullet)
@@ -439,25 +475,40 @@ class TestLaserBullet(TestCase):
         bullet = LaserBullet(mock_game, Mock())
         bullet.release()
         mock_rect.move.return_value = mock_rect
-        visible_bricks = []
-        mock_game.round.bricks = visible_bricks
+        mock_game.round.lowest_brick.return_value = None
         visible_enemies = [Mock()]
         mock_game.enemies = visible_enemies
-        mock_pygame.sprite.spritecollide.side_effect = [[], visible_bricks,
-                                                        visible_enemies]
+        mock_pygame.sprite.spritecollide.side_effect = [[], visible_enemies]
 
         bullet.update()
 
         mock_rect.move.assert_called_once_with(0, -15)
         mock_pygame.sprite.spritecollide. \
             assert_has_calls([call(bullet, [mock_game.round.edges.top], False),
-                              call(bullet, ANY, False),
                               call(bullet, ANY, False)])
         self.assertEqual(mock_game.on_brick_collide.call_count, 0)
         mock_enemy = visible_enemies[0]
         mock_game.on_enemy_collide.assert_called_once_with(mock_enemy, bullet)
         self.assertFalse(bullet.visible)
 
+    @patch('arkanoid.sprites.paddle.load_png')
+    @patch('arkanoid.sprites.paddle.pygame')
+    def test_below_lowest_brick(self, mock_pygame, mock_load_png):
+        mock_game, mock_rect = Mock(), Mock()
+        mock_load_png.return_value = Mock(), mock_rect
+        bullet = LaserBullet(mock_game, Mock())
+        bullet.release()
+        mock_rect.move.return_value = mock_rect
+        mock_rect.top = 201
+        mock_game.round.lowest_brick.return_value.rect.bottom = 201
+        mock_game.enemies = []
+        mock_pygame.sprite.spritecollide.side_effect = [[], []]
+
+        bullet.update()
+
+        self.assertEqual(mock_game.on_brick_collide.call_count, 0)
+        self.assertTrue(bullet.visible)
+
     @patch('arkanoid.sprites.paddle.load_png')
     @patch('arkanoid.sprites.paddle.pygame')
     def test_collide_edge(self, mock_pygame, mock_load_png):
@@ -0,0 +1,120 @@
+import math
+from unittest import TestCase
+from unittest.mock import (Mock,
+                           patch)
+
+import pygame
+
+from arkanoid.collision import (SpatialGrid,
+                                sweep)
+from arkanoid.predictor import TrajectoryPredictor
+
+from helpers import SpriteFactoryMixin
+
+
+@patch('arkanoid.sprites.ball.random.uniform', Mock(return_value=0))
+@patch('arkanoid.sprites.ball.pygame.display.get_surface',
+       Mock(return_value=pygame.Surface((600, 800))))
+@patch('arkanoid.sprites.ball.load_png')
+class TestTrajectoryPredictor(SpriteFactoryMixin, TestCase):
+
+    def _assert_path(self, path, expected):
+        self.assertEqual(len(path), len(expected))
+        for point, expected_point in zip(path, expected):
+            self.assertAlmostEqual(point[0], expected_point[0])
+            self.assertAlmostEqual(point[1], expected_point[1])
+
+    def test_straight_to_line(self, mock_load_png):
+        ball = self._ball(mock_load_png, (100, 100), math.pi / 2, 5)
+
+        prediction = TrajectoryPredictor(ball, 300).predict()
+
+        self.assertAlmostEqual(prediction.x, 105)
+        self.assertAlmostEqual(prediction.time, 38)
+        self._assert_path(prediction.path, ((105, 105), (105, 295)))
+
+    def test_bounce_off_wall(self, mock_load_png):
+        ball = self._ball(mock_load_png, (100, 100), 0.79, 10)
+        wall = self._sprite((200, 0, 10, 800))
+        ball.add_collidable_sprite(wall, speed_adjust=10)
+
+        prediction = TrajectoryPredictor(ball, 400).predict()
+
+        self.assertEqual(len(prediction.path), 3)
+        self.assertAlmostEqual(prediction.path[1][0], 195)
+        self.assertAlmostEqual(prediction.x, -1.72, places=2)
+        # The second leg is travelled at the adjusted speed.
+        first, second = (math.dist(*prediction.path[:2]),
+                         math.dist(*prediction.path[1:]))
+        self.assertAlmostEqual(prediction.time, first / 10 + second / 20)
+
+    def test_bounce_off_brick_in_grid(self, mock_load_png):
+        ball = self._ball(mock_load_png, (100, 200), 5.5, 10)
+        grid = SpatialGrid((50, 20))
+        grid.add(self._sprite((150, 100, 50, 20)))
+        ball.add_collidable_grid(grid)
+
+        prediction = TrajectoryPredictor(ball, 300).predict()
+
+        self.assertEqual(len(prediction.path), 3)
+        self.assertAlmostEqual(prediction.path[1][1], 125)
+
+    def test_ignores_paddle_and_precise_sprites(self, mock_load_png):
+        ball = self._ball(mock_load_png, (100, 100), math.pi / 2, 5)
+        paddle, enemy = (self._sprite((50, 200, 100, 10)),
+                         self._sprite((90, 150, 30, 30)))
+        ball.add_collidable_sprite(paddle, bounce_strategy=Mock())
+        ball.collision_world.add(enemy, precise=True)
+
+        prediction = TrajectoryPredictor(ball, 300).predict()
+
+        self._assert_path(prediction.path, ((105, 105), (105, 295)))
+
+    def test_ignores_destroyed_brick(self, mock_load_png):
+        ball = self._ball(mock_load_png, (100, 100), math.pi / 2, 5)
+        brick = self._sprite((90, 150, 30, 10))
+        brick.hits_remaining = 0
+        ball.add_collidable_sprite(brick)
+
+        prediction = TrajectoryPredictor(ball, 300).predict()
+
+        self._assert_path(prediction.path, ((105, 105), (105, 295)))
+
+    def test_no_prediction_heading_away(self, mock_load_png):
+        ball = self._ball(mock_load_png, (100, 100), math.pi * 1.5, 5)
+
+        self.assertIsNone(TrajectoryPredictor(ball, 300).predict())
+
+    def test_no_prediction_when_stopped(self, mock_load_png):
+        ball = self._ball(mock_load_png, (100, 100), math.pi / 2, 5)
+        ball.speed = 0
+
+        self.assertIsNone(TrajectoryPredictor(ball, 300).predict())
+
+    def test_no_prediction_beyond_line(self, mock_load_png):
+        ball = self._ball(mock_load_png, (100, 350), math.pi / 2, 5)
+
+        self.assertIsNone(TrajectoryPredictor(ball, 300).predict())
+
+    @patch('arkanoid.predictor.sweep', side_effect=sweep)
+    def test_path_held_until_ball_bounces(self, mock_sweep, mock_load_png):
+        ball = self._ball(mock_load_png, (100, 100), 0.79, 10)
+        ball.normalisation_rate = 0
+        ball.add_collidable_sprite(self._sprite((200, 0, 10, 800)))
+        predictor = TrajectoryPredictor(ball, 400)
+        first = predictor.predict()
+        calls = mock_sweep.call_count
+
+        self.assertIs(predictor.predict(), first)
+
+        ball.update()
+        moved = predictor.predict()
+
+        self.assertEqual(mock_sweep.call_count, calls)
+        self.assertAlmostEqual(moved.x, first.x)
+        self.assertAlmostEqual(moved.time, first.time - 1)
+
+        ball.angle = 1.2
+        predictor.predict()
+
+        self.assertGreater(mock_sweep.call_count, calls)
@@ -0,0 +1,230 @@
+from unittest import TestCase
+from unittest.mock import (Mock,
+                           patch)
+
+import pygame
+
+from arkanoid.utils.render import (Interpolator,
+                                   Renderer)
+
+
+class TestRenderer(TestCase):
+
+    def setUp(self):
+        self.screen = pygame.Surface((100, 100))
+        self.background = pygame.Surface((100, 80))
+        self.background.fill((0, 0, 255))
+        self.renderer = Renderer(self.screen)
+        self.renderer.set_background(self.background, (0, 20))
+
+    def _sprite(self, pos, colour=(255, 0, 0)):
+        sprite = Mock()
+        sprite.image = pygame.Surface((10, 10))
+        sprite.image.fill(colour)
+        sprite.rect = sprite.image.get_rect(topleft=pos)
+        sprite.visible = True
+        return sprite
+
+    def test_first_render_draws_everything(self):
+        sprite = self._sprite((10, 30))
+
+        self.renderer.render([sprite])
+
+        self.assertEqual(self.screen.get_at((0, 20)), (0, 0, 255))
+        self.assertEqual(self.screen.get_at((15, 35)), (255, 0, 0))
+
+    @patch('arkanoid.utils.render.pygame.display')
+    def test_first_present_flips_display(self, mock_display):
+        self.renderer.render([])
+        self.renderer.present()
+
+        mock_display.flip.assert_called_once_with()
+        mock_display.update.assert_not_called()
+
+    def test_moved_sprite_restores_old_position(self):
+        sprite = self._sprite((10, 30))
+        self.renderer.render([sprite])
+
+        sprite.rect.topleft = (50, 50)
+        self.renderer.render([sprite])
+
+        self.assertEqual(self.screen.get_at((15, 35)), (0, 0, 255))
+        self.assertEqual(self.screen.get_at((55, 55)), (255, 0, 0))
+
+    @patch('arkanoid.utils.render.pygame.display')
+    def test_moved_sprite_presents_changed_regions(self, mock_display):
+        sprite = self._sprite((10, 30))
+        self.renderer.render([sprite])
+        self.renderer.present()
+
+        sprite.rect.topleft = (50, 50)
+        self.renderer.render([sprite])
+        self.renderer.present()
+
+        mock_display.update.assert_called_once_with(
+            [pygame.Rect(10, 30, 10, 10), pygame.Rect(50, 50, 10, 10)])
+
+    @patch('arkanoid.utils.render.pygame.display')
+    def test_unchanged_sprite_not_presented(self, mock_display):
+        sprite = self._sprite((10, 30))
+        self.renderer.render([sprite])
+        self.renderer.present()
+
+        self.renderer.render([sprite])
+        self.renderer.present()
+
+        mock_display.flip.assert_called_once_with()
+        mock_display.update.assert_not_called()
+
+    def test_hidden_sprite_erased(self):
+        sprite = self._sprite((10, 30))
+        self.renderer.render([sprite])
+
+        sprite.visible = False
+        self.renderer.render([sprite])
+
+        self.assertEqual(self.screen.get_at((15, 35)), (0, 0, 255))
+
+    def test_removed_sprite_erased(self):
+        sprite = self._sprite((10, 30))
+        self.renderer.render([sprite])
+
+        self.renderer.render([])
+
+        self.assertEqual(self.screen.get_at((15, 35)), (0, 0, 255))
+
+    def test_overlapping_sprite_redrawn_over_erased_region(self):
+        below = self._sprite((10, 30), colour=(0, 255, 0))
+        above = self._sprite((15, 30))
+        self.renderer.render([below, above])
+
+        above.rect.topleft = (50, 50)
+        self.renderer.render([below, above])
+
+        self.assertEqual(self.screen.get_at((17, 35)), (0, 255, 0))
+        self.assertEqual(self.screen.get_at((22, 35)), (0, 0, 255))
+
+    def test_translucent_sprite_drawn_once_when_regions_overlap(self):
+        sprite = self._sprite((10, 30))
+        sprite.image = pygame.Surface((10, 10), pygame.SRCALPHA)
+        sprite.image.fill((255, 0, 0, 128))
+        self.renderer.render([sprite])
+        expected = self.screen.get_at((15, 35))
+
+        sprite.rect.topleft = (12, 30)
+        self.renderer.render([sprite])
+
+        self.assertEqual(self.screen.get_at((15, 35)), expected)
+
+    def test_new_background_redraws_everything(self):
+        sprite = self._sprite((10, 30))
+        self.renderer.render([sprite])
+        background = pygame.Surface((100, 80))
+        background.fill((0, 255, 0))
+
+        self.renderer.set_background(background, (0, 20))
+        self.renderer.render([sprite])
+
+        self.assertEqual(self.screen.get_at((0, 20)), (0, 255, 0))
+        self.assertEqual(self.screen.get_at((15, 35)), (255, 0, 0))
+
+    def test_restore_redraws_sprites_in_region(self):
+        sprite = self._sprite((10, 30))
+        self.renderer.render([sprite])
+        self.screen.fill((0, 0, 0))
+
+        self.renderer.restore(pygame.Rect(0, 20, 40, 40))
+        self.renderer.render([sprite])
+
+        self.assertEqual(self.screen.get_at((0, 20)), (0, 0, 255))
+        self.assertEqual(self.screen.get_at((15, 35)), (255, 0, 0))
+        # Outside of the restored region is untouched.
+        self.assertEqual(self.screen.get_at((60, 60)), (0, 0, 0))
+
+    def test_full_mode_redraws_everything(self):
+        renderer = Renderer(self.screen, dirty_rects=False)
+        renderer.set_background(self.background, (0, 20))
+        sprite = self._sprite((10, 30))
+        renderer.render([sprite])
+        self.screen.fill((0, 0, 0))
+
+        renderer.render([sprite])
+
+        self.assertEqual(self.screen.get_at((60, 60)), (0, 0, 255))
+        self.assertEqual(self.screen.get_at((15, 35)), (255, 0, 0))
+
+    def test_sprite_drawn_at_supplied_rect(self):
+        sprite = self._sprite((10, 30))
+        self.renderer.render([sprite])
+
+        self.renderer.render([sprite], {sprite: pygame.Rect(50, 50, 10, 10)})
+
+        self.assertEqual(self.screen.get_at((15, 35)), (0, 0, 255))
+        self.assertEqual(self.screen.get_at((55, 55)), (255, 0, 0))
+
+        self.renderer.render([sprite])
+
+        self.assertEqual(self.screen.get_at((15, 35)), (255, 0, 0))
+        self.assertEqual(self.screen.get_at((55, 55)), (0, 0, 255))
+
+    def test_damaged_after_full_render(self):
+        self.renderer.render([])
+
+        self.assertEqual(self.renderer.damaged((0, 0, 10, 10)),
+                         [pygame.Rect(0, 0, 10, 10)])
+
+    def test_damaged_returns_rebuilt_parts_of_region(self):
+        sprite = self._sprite((10, 30))
+        self.renderer.render([sprite])
+
+        sprite.rect.topleft = (50, 50)
+        self.renderer.render([sprite])
+
+        self.assertEqual(self.renderer.damaged((5, 25, 10, 10)),
+                         [pygame.Rect(10, 30, 5, 5)])
+        self.assertEqual(self.renderer.damaged((80, 80, 10, 10)), [])
+
+
+class TestInterpolator(TestCase):
+
+    def setUp(self):
+        self.interpolator = Interpolator(max_distance=20)
+
+    def _sprite(self, pos):
+        sprite = Mock()
+        sprite.rect = pygame.Rect(pos, (10, 10))
+        sprite.visible = True
+        return sprite
+
+    def test_moved_sprite_drawn_between_positions(self):
+        sprite = self._sprite((10, 30))
+        self.interpolator.record([sprite])
+
+        sprite.rect.topleft = (20, 40)
+
+        self.assertEqual(self.interpolator.rects([sprite], 0.25),
+                         {sprite: pygame.Rect(12, 32, 10, 10)})
+        self.assertEqual(self.interpolator.rects([sprite], 1), {})
+
+    def test_stationary_sprite_not_interpolated(self):
+        sprite = self._sprite((10, 30))
+        self.interpolator.record([sprite])
+
+        self.assertEqual(self.interpolator.rects([sprite], 0.5), {})
+
+    def test_jump_not_interpolated(self):
+        sprite = self._sprite((10, 30))
+        self.interpolator.record([sprite])
+
+        sprite.rect.topleft = (50, 30)
+
+        self.assertEqual(self.interpolator.rects([sprite], 0.5), {})
+
+    def test_newly_visible_sprite_not_interpolated(self):
+        sprite = self._sprite((10, 30))
+        sprite.visible = False
+        self.interpolator.record([sprite])
+
+        sprite.rect.topleft, sprite.visible = (20, 30), True
+
+        self.assertEqual(self.interpolator.rects([sprite], 0.5), {})
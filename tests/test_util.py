@@ -1,9 +1,14 @@
+import json
 import os
+import tempfile
 from unittest import TestCase
 from unittest.mock import Mock
+from unittest.mock import call
 from unittest.mock import patch
 
-from arkanoid.utils.util import (h_centre_pos,
+from arkanoid.utils.util import (GRAPHICS_DIR,
+                                 AssetCache,
+                                 h_centre_pos,
                                  save_high_score,
                                  load_high_score)
 
@@ -56,3 +61,129 @@ class TestUtil(TestCase):
             pass
 
         self.assertEqual(load_high_score(), 0)
+
+
+NO_ATLAS_DIR = os.path.join(os.path.dirname(__file__), 'no_atlas')
+NO_MANIFEST = os.path.join(NO_ATLAS_DIR, 'manifest.json')
+
+
+@patch('arkanoid.utils.util.os.path.exists')
+@patch('arkanoid.utils.util.pygame')
+class TestAssetCache(TestCase):
+
+    def test_image_loaded_once(self, mock_pygame, mock_exists):
+        mock_exists.return_value = True
+        cache = AssetCache(atlas_dir=NO_ATLAS_DIR, manifest=NO_MANIFEST)
+
+        image1 = cache.image('ball')
+        image2 = cache.image('ball.png')
+
+        self.assertIs(image1, image2)
+        mock_pygame.image.load.assert_called_once_with(
+            os.path.join(GRAPHICS_DIR, 'ball.png'))
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 1)
+
+    def test_image_not_found(self, mock_pygame, mock_exists):
+        mock_exists.return_value = False
+        cache = AssetCache(atlas_dir=NO_ATLAS_DIR, manifest=NO_MANIFEST)
+
+        with self.assertRaises(FileNotFoundError):
+            cache.image('missing')
+
+    def test_sequence_loaded_once(self, mock_pygame, mock_exists):
+        mock_exists.side_effect = [True, True, False]
+        mock_pygame.image.load.side_effect = [Mock(), Mock()]
+        cache = AssetCache(atlas_dir=NO_ATLAS_DIR, manifest=NO_MANIFEST)
+
+        sequence1 = cache.sequence('paddle_wide')
+        sequence2 = cache.sequence('paddle_wide')
+
+        self.assertEqual(len(sequence1), 2)
+        self.assertEqual(sequence1, sequence2)
+        self.assertEqual(mock_pygame.image.load.call_count, 2)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 1)
+
+    def test_sequence_uses_manifest_frame_count(self, mock_pygame,
+                                                mock_exists):
+        mock_exists.return_value = True
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest = os.path.join(tmp, 'manifest.json')
+            with open(manifest, 'w') as file:
+                json.dump({'sequences': {'paddle_wide': 3}}, file)
+            cache = AssetCache(atlas_dir=NO_ATLAS_DIR, manifest=manifest)
+
+            sequence = cache.sequence('paddle_wide')
+
+        self.assertEqual(len(sequence), 3)
+        self.assertEqual(mock_pygame.image.load.call_args_list, [
+            call(os.path.join(GRAPHICS_DIR, 'paddle_wide_1.png')),
+            call(os.path.join(GRAPHICS_DIR, 'paddle_wide_2.png')),
+            call(os.path.join(GRAPHICS_DIR, 'paddle_wide_3.png'))])
+        # Nothing was probed beyond the end of the sequence.
+        self.assertEqual(mock_exists.call_count, 3)
+
+    def test_sequence_not_in_manifest_is_empty(self, mock_pygame,
+                                               mock_exists):
+        with tempfile.TemporaryDirectory() as tmp:
+            manifest = os.path.join(tmp, 'manifest.json')
+            with open(manifest, 'w') as file:
+                json.dump({'sequences': {}}, file)
+            cache = AssetCache(atlas_dir=NO_ATLAS_DIR, manifest=manifest)
+
+            sequence = cache.sequence('brick_gold')
+
+        self.assertEqual(sequence, [])
+        mock_exists.assert_not_called()
+        mock_pygame.image.load.assert_not_called()
+
+    def test_sequence_uses_preloaded_images(self, mock_pygame, mock_exists):
+        mock_exists.side_effect = [True, True, False]
+        cache = AssetCache(atlas_dir=NO_ATLAS_DIR, manifest=NO_MANIFEST)
+        cache.preload('paddle_wide_1', 'paddle_wide_2.png')
+        mock_pygame.image.load.reset_mock()
+
+        sequence = cache.sequence('paddle_wide')
+
+        self.assertEqual(len(sequence), 2)
+        mock_pygame.image.load.assert_not_called()
+
+    @patch('arkanoid.utils.util.os.listdir')
+    def test_preload_all(self, mock_listdir, mock_pygame, mock_exists):
+        mock_exists.return_value = True
+        mock_listdir.return_value = ['ball.png', 'paddle.png', 'readme.txt']
+        cache = AssetCache(atlas_dir=NO_ATLAS_DIR, manifest=NO_MANIFEST)
+
+        cache.preload()
+        cache.image('ball')
+        cache.image('paddle')
+
+        self.assertEqual(mock_pygame.image.load.call_count, 2)
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(cache.misses, 0)
+
+    def test_clear(self, mock_pygame, mock_exists):
+        mock_exists.return_value = True
+        cache = AssetCache(atlas_dir=NO_ATLAS_DIR, manifest=NO_MANIFEST)
+        cache.image('ball')
+
+        cache.clear()
+        cache.image('ball')
+
+        self.assertEqual(mock_pygame.image.load.call_count, 2)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 0)
+
+    def test_mask_built_once_per_image(self, mock_pygame, mock_exists):
+        cache = AssetCache(atlas_dir=NO_ATLAS_DIR, manifest=NO_MANIFEST)
+        image1, image2 = Mock(), Mock()
+
+        mask1 = cache.mask(image1)
+        mask2 = cache.mask(image1)
+        cache.mask(image2)
+
+        self.assertIs(mask1, mask2)
+        mock_pygame.mask.from_surface.assert_has_calls(
+            [call(image1), call(image2)])
+        self.assertEqual(mock_pygame.mask.from_surface.call_count, 2)